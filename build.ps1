@@ -1,5 +1,6 @@
 param(
-    [switch]$Clean
+    [switch]$Clean,
+    [switch]$Benchmark
 )
 
 $ErrorActionPreference = "Stop"
@@ -27,6 +28,14 @@ $datas = @(
     "install;install"
 )
 
+# Embedded plugin index + precompiled bytecode: the exe skips folder scans at startup
+$indexPath = Join-Path $PSScriptRoot "build\plugin_index.json"
+& python cli.py --build-index $indexPath
+if ($LASTEXITCODE -ne 0) {
+    throw "Building the plugin index failed"
+}
+$datas += "$indexPath;."
+
 $pyArgs = @("--noconfirm","--clean","--onefile","--name","psCLI")
 foreach ($d in $datas) {
     $pyArgs += @("--add-data", $d)
@@ -43,3 +52,20 @@ if (Test-Path $versionFile) {
 $pyArgs += "cli.py"
 
 & python -m PyInstaller @pyArgs
+if ($LASTEXITCODE -ne 0) {
+    throw "PyInstaller failed"
+}
+
+# Startup time of the built exe with and without the embedded index
+if ($Benchmark) {
+    $exe = Join-Path $PSScriptRoot "dist\psCLI.exe"
+    foreach ($mode in @("scan", "index")) {
+        $env:PSCLI_EMBEDDED_INDEX = if ($mode -eq "scan") { "0" } else { "1" }
+        $times = 1..7 | ForEach-Object {
+            (Measure-Command { & $exe echo benchmark | Out-Null }).TotalMilliseconds
+        }
+        $median = ($times | Sort-Object)[3]
+        Write-Host ("{0,-6} startup: {1,7:N0} ms (median of 7)" -f $mode, $median)
+    }
+    Remove-Item Env:PSCLI_EMBEDDED_INDEX -ErrorAction SilentlyContinue
+}
@@ -1,19 +1,26 @@
 import os
 import sys
-import subprocess
-import inspect
+
+# Plugins import "cli"; when started as a script reuse this module instead of
+# executing cli.py a second time under its own name.
+if __name__ == "__main__":
+    sys.modules.setdefault("cli", sys.modules[__name__])
+
+# Modules needed only by some commands (ast, inspect, subprocess, platform, getpass,
+# socket, urllib, ...) are imported inside the functions that use them, keeping them
+# off the startup path; `cli.py --check-import-budget` guards this.
 import importlib
-import importlib.util
 import json
-import socket
-import urllib.request
-import platform
 import threading
-import webbrowser
 import re
-import getpass
-
-from plugins import owner
+import time
+import copy
+import contextlib
+import io
+import codecs
+import functools
+import contextvars
+from collections import deque, OrderedDict
 
 # Import msvcrt for Windows key detection
 try:
@@ -39,81 +46,1856 @@ if sys.platform == "win32":
     os.system('color')
 
 # --- DECORATOR ---
-def command(name=None, aliases=None):
+_CO_COROUTINE = 0x80  # inspect.CO_COROUTINE
+
+def command(name=None, aliases=None, output_flags=True):
+    """Register a function as a command; `async def` commands run on the shared event loop.
+
+    With output_flags=False the dispatcher leaves --json / --format in the
+    arguments for commands that parse them themselves.
+    """
     def decorator(func):
         func.is_command = True
         func.command_name = name if name else func.__name__
         func.aliases = aliases if aliases else []
+        func.output_flags = output_flags
+        func.is_async = bool(getattr(getattr(func, "__code__", None), "co_flags", 0) & _CO_COROUTINE)
         func.meta = {}
         return func
     return decorator
 
-# --- DISPATCHER CLASS (2026© Terminal psCLI) ---
-class Dispatcher:
-    def __init__(self, plugins_folder="plugins", metadata_folder="metadata"):
-        if getattr(sys, "frozen", False):
-            self.root_dir = getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
+REGISTRY_SNAPSHOT_VERSION = 3
+# Prebuilt registry shipped inside frozen builds (`cli.py --build-index`)
+PLUGIN_INDEX_NAME = "plugin_index.json"
+
+BINARY_EXTS = (".bat", ".cmd", ".ps1", ".exe", ".vbs")
+
+# Folders scanned for commands, in load and "modules" display order.
+# Override with "dispatcher": {"sources": [...]} in terminal.json.
+DEFAULT_SOURCES = [
+    {"folder": "plugins", "type": "plugins"},
+    {"folder": "health", "type": "tools", "title": "Health Tools", "color": "YELLOW"},
+    {"folder": "tools", "type": "tools", "title": "System Tools", "color": "MAGENTA"},
+    {"folder": "games", "type": "games", "title": "Games", "color": "GREEN"},
+    {"folder": "ascii", "type": "tools", "title": "ASCII Tools", "color": "BLUE"},
+    {"folder": "install", "type": "tools", "title": "Installers", "color": "CYAN"},
+]
+
+# --- STATIC PLUGIN DISCOVERY ---
+_MODULE_ATTRS = ("__author__", "__category__", "__group__", "__desc__")
+
+def _literal(node):
+    import ast
+    return ast.literal_eval(node)
+
+def _command_decorator(node):
+    """Return the @command(...) call decorating a function node, if any."""
+    import ast
+    for dec in node.decorator_list:
+        target = dec.func if isinstance(dec, ast.Call) else dec
+        if isinstance(target, ast.Name) and target.id == "command":
+            return dec
+        if isinstance(target, ast.Attribute) and target.attr == "command":
+            return dec
+    return None
+
+def _command_entry(node, dec):
+    import ast
+    name, aliases, output_flags = None, None, True
+    if isinstance(dec, ast.Call):
+        if dec.args:
+            name = _literal(dec.args[0])
+        if len(dec.args) > 1:
+            aliases = _literal(dec.args[1])
+        for kw in dec.keywords:
+            if kw.arg == "name":
+                name = _literal(kw.value)
+            elif kw.arg == "aliases":
+                aliases = _literal(kw.value)
+            elif kw.arg == "output_flags":
+                output_flags = bool(_literal(kw.value))
+    doc = (ast.get_docstring(node, clean=False) or "").strip().split('\n')[0]
+    return {
+        "attr": node.name,
+        "name": name if name else node.name,
+        "aliases": list(aliases) if aliases else [],
+        "doc": doc,
+        "output_flags": output_flags
+    }
+
+def discover_plugin(path):
+    """Read @command declarations and module metadata from a plugin file without importing it.
+
+    Returns None when the file cannot be resolved statically (syntax errors,
+    non-literal decorator arguments); callers should import the module instead.
+    """
+    import ast
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    attrs = {}
+    commands = []
+    functions = {}
+    wrapped = []
+    # Module-level statements, including those guarded by try/except ImportError
+    body = []
+    for node in tree.body:
+        body.extend(node.body if isinstance(node, ast.Try) else [node])
+    try:
+        for node in body:
+            if isinstance(node, ast.Assign):
+                for t in node.targets:
+                    if isinstance(t, ast.Name) and t.id in _MODULE_ATTRS:
+                        attrs[t.id] = _literal(node.value)
+                # main = command(name=..., aliases=...)(main)
+                v = node.value
+                if (len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                        and isinstance(v, ast.Call) and isinstance(v.func, ast.Call)
+                        and len(v.args) == 1 and isinstance(v.args[0], ast.Name)
+                        and any(kw.arg in ("name", "aliases") for kw in v.func.keywords)):
+                    wrapped.append((v.args[0].id, v.func))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions[node.name] = node
+                dec = _command_decorator(node)
+                if dec is not None:
+                    commands.append(_command_entry(node, dec))
+        for attr, call in wrapped:
+            if attr in functions:
+                commands.append(_command_entry(functions[attr], call))
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+    # Mirror inspect.getmembers() ordering so alias clashes resolve the same way
+    commands.sort(key=lambda c: c["attr"])
+    entry_point = "main" if "main" in functions else ("menu" if "menu" in functions else None)
+    return {"attrs": attrs, "commands": commands, "entry_point": entry_point}
+
+# --- CONFIG CACHE ---
+_json_cache = {}
+
+def load_json_cached(path, default=None):
+    """Parse a JSON settings file, re-reading it only when its mtime or size changes.
+
+    Returns a private copy of the data (or of `default` when the file does not
+    exist). Read and parse errors propagate to the caller.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        _json_cache.pop(path, None)
+        return copy.deepcopy(default)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _json_cache.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cached = _json_cache[path] = (stamp, data)
+    return copy.deepcopy(cached[1])
+
+def invalidate_json_cache(path=None):
+    """Forget cached contents of `path` (or of every file) after writing to it."""
+    if path is None:
+        _json_cache.clear()
+    else:
+        _json_cache.pop(path, None)
+
+# --- TABLE RENDERING ---
+_ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+CLEAR_SCREEN = "\x1b[2J\x1b[3J\x1b[H"
+
+def strip_ansi(text):
+    return _ANSI_RE.sub("", text)
+
+def visible_len(text):
+    """Length of `text` as shown on screen, ignoring ANSI escape codes."""
+    return len(_ANSI_RE.sub("", text)) if "\x1b" in text else len(text)
+
+def pad(text, width):
+    """Left-align `text` to `width` visible columns; plain text longer than that is cut."""
+    if "\x1b" not in text and len(text) > width:
+        return text[:width]
+    return text + " " * max(0, width - visible_len(text))
+
+def use_color(stream=None):
+    """True when `stream` (stdout by default) should receive colour codes.
+
+    NO_COLOR / FORCE_COLOR override the check for a terminal.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    stream = sys.stdout if stream is None else stream
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
+
+def terminal_width(stream=None):
+    """Columns of the terminal behind `stream`, or None when output is piped."""
+    stream = sys.stdout if stream is None else stream
+    try:
+        if not stream.isatty():
+            return None
+    except (AttributeError, ValueError):
+        return None
+    try:
+        return int(os.environ["COLUMNS"])
+    except (KeyError, ValueError):
+        pass
+    try:
+        return os.get_terminal_size(sys.__stdout__.fileno()).columns
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def emit(text, stream=None, clear=False):
+    """Write a rendered screen with a single call.
+
+    Colours (and the clear-screen sequence) are dropped when the stream is not
+    a terminal, so piped output stays plain text.
+    """
+    stream = sys.stdout if stream is None else stream
+    if use_color(stream):
+        if clear:
+            text = CLEAR_SCREEN + text
+    else:
+        text = strip_ansi(text)
+    stream.write(text)
+    stream.flush()
+
+class Table:
+    """Rows of cells laid out by visible width and rendered into one string.
+
+    `columns` is a list of (title, width) pairs; a width of None sizes the
+    column to its widest cell. A cell is either a string or a (text, colour)
+    pair. Column `flex` shrinks (down to `min_flex`) so rows fit `max_width`;
+    the last column is never padded.
+    """
+    def __init__(self, columns, sep=" | ", flex=None, min_flex=12):
+        self.columns = list(columns)
+        self.sep = sep
+        self.flex = flex
+        self.min_flex = min_flex
+        self._items = []
+
+    def add_row(self, *cells):
+        self._items.append(("row", cells))
+
+    def add_line(self, text):
+        """A full-width line between rows, e.g. a section title."""
+        self._items.append(("line", text))
+
+    def add_rule(self):
+        self._items.append(("rule", None))
+
+    def __len__(self):
+        return sum(1 for kind, _ in self._items if kind == "row")
+
+    @staticmethod
+    def _split(cell):
+        if isinstance(cell, tuple):
+            return str(cell[0]), cell[1]
+        return str(cell), ""
+
+    def _widths(self, max_width):
+        rows = [cells for kind, cells in self._items if kind == "row"]
+        widths = []
+        for i, (title, width) in enumerate(self.columns):
+            if width is None:
+                width = max([len(title)] + [visible_len(self._split(r[i])[0]) for r in rows if i < len(r)])
+            widths.append(width)
+        if max_width and self.flex is not None:
+            # The unpadded last column may wrap; only its title has to fit
+            total = sum(widths[:-1]) + len(self.columns[-1][0]) + visible_len(self.sep) * (len(widths) - 1)
+            if total > max_width:
+                widths[self.flex] = max(self.min_flex, widths[self.flex] - (total - max_width))
+        return widths
+
+    def render(self, max_width=None, top_rule=True):
+        widths = self._widths(max_width)
+        last = len(widths) - 1
+        sep_len = visible_len(self.sep)
+        rule_len = sum(widths) + sep_len * last
+        if max_width:
+            rule_len = min(rule_len, max_width)
+        rule = f"{Color.GRAY}{'-' * rule_len}{Color.RESET}"
+        plain_sep = strip_ansi(self.sep)
+        header = plain_sep.join(title if i == last else pad(title, widths[i])
+                                for i, (title, _) in enumerate(self.columns))
+        out = [rule] if top_rule else []
+        out += [Color.BOLD + header + Color.RESET, rule]
+        for kind, value in self._items:
+            if kind == "rule":
+                out.append(rule)
+            elif kind == "line":
+                out.append(value)
+            else:
+                cells = []
+                for i, cell in enumerate(value):
+                    text, colour = self._split(cell)
+                    if i != last:
+                        text = pad(text, widths[i])
+                    cells.append(f"{colour}{text}{Color.RESET}" if colour else text)
+                out.append(self.sep.join(cells))
+        out.append(rule)
+        return "\n".join(out) + "\n"
+
+# --- STRUCTURED OUTPUT ---
+class _ContextLocal:
+    """threading.local look-alike backed by context variables.
+
+    Each thread still sees its own values, and an async command started from a
+    thread carries them (output routing, format, job) into its asyncio tasks.
+    """
+    def __init__(self, prefix):
+        object.__setattr__(self, "_prefix", prefix)
+        object.__setattr__(self, "_vars", {})
+
+    def _var(self, name):
+        var = self._vars.get(name)
+        if var is None:
+            var = self._vars.setdefault(name, contextvars.ContextVar(f"{self._prefix}.{name}"))
+        return var
+
+    def __getattr__(self, name):
+        try:
+            return self._var(name).get()
+        except LookupError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self._var(name).set(value)
+
+OUTPUT_FORMATS = ("table", "json", "jsonl")
+_output_local = _ContextLocal("output")
+
+def current_format():
+    """Output format of the running command: "table" (default), "json" or "jsonl"."""
+    return getattr(_output_local, "format", "table")
+
+@contextlib.contextmanager
+def output_format(fmt):
+    """Run a block with `fmt` as the output format (None keeps the current one)."""
+    previous = current_format()
+    _output_local.format = fmt or previous
+    try:
+        yield
+    finally:
+        _output_local.format = previous
+
+def split_output_flags(words):
+    """Pull `--json`, `--format=FMT` and `--format FMT` out of `words`.
+
+    Returns (format or None, remaining words). A --format value that is not an
+    output format is left in place for the command's own option parser.
+    """
+    fmt, rest = None, []
+    words = list(words)
+    i = 0
+    while i < len(words):
+        word = words[i]
+        if word == "--json":
+            fmt = "json"
+        elif word.startswith("--format=") and word[9:].lower() in OUTPUT_FORMATS:
+            fmt = word[9:].lower()
+        elif word == "--format" and i + 1 < len(words) and words[i + 1].lower() in OUTPUT_FORMATS:
+            fmt = words[i + 1].lower()
+            i += 1
         else:
-            self.root_dir = os.path.dirname(os.path.abspath(__file__))
-        self.settings_path = os.path.expandvars(r"%userprofile%\.polsoft\psCli\settings\terminal.json")
-        self.settings = self._load_settings()
-        
-        self.plugins_path = os.path.join(self.root_dir, self.settings.get("dispatcher", {}).get("plugins_folder", plugins_folder))
-        self.metadata_path = os.path.join(self.root_dir, self.settings.get("dispatcher", {}).get("metadata_folder", metadata_folder))
-        
+            rest.append(word)
+        i += 1
+    return fmt, rest
+
+def emit_rows(rows, render=None, columns=None, stream=None):
+    """Write structured `rows` (dicts) in the current output format; returns the row count.
+
+    In table mode `render(rows)` builds the screen (by default a Table over
+    `columns`, or the keys of the first row); json/jsonl never call it, so no
+    coloured strings are built. jsonl is written in batches as rows arrive.
+    """
+    stream = sys.stdout if stream is None else stream
+    fmt = current_format()
+    if fmt == "jsonl":
+        count, batch = 0, []
+        for row in rows:
+            batch.append(json.dumps(row, ensure_ascii=False, default=str))
+            count += 1
+            if len(batch) == 256:
+                stream.write("\n".join(batch) + "\n")
+                batch = []
+        if batch:
+            stream.write("\n".join(batch) + "\n")
+        stream.flush()
+        return count
+    rows = list(rows)
+    if fmt == "json":
+        stream.write(json.dumps(rows, ensure_ascii=False, indent=2, default=str) + "\n")
+        stream.flush()
+    elif render is not None:
+        emit(render(rows), stream=stream)
+    elif rows:
+        keys = columns or list(rows[0])
+        table = Table([(k.upper(), None) for k in keys])
+        for row in rows:
+            table.add_row(*(", ".join(map(str, v)) if isinstance(v, (list, tuple)) else ("" if v is None else v)
+                            for v in (row.get(k) for k in keys)))
+        emit(table.render(max_width=terminal_width(stream)), stream=stream)
+    return len(rows)
+
+# --- SETTINGS FOLDER ---
+def user_path(path):
+    """Expand a %userprofile%-based path.
+
+    Where %userprofile% is not set (outside Windows) the same layout is placed
+    under the home directory, so per-user files never land in the current folder.
+    """
+    expanded = os.path.expandvars(path)
+    if "%userprofile%" not in expanded.lower():
+        return expanded
+    rest = re.sub(r"(?i)%userprofile%", "", expanded)
+    return os.path.join(os.path.expanduser("~"), *[part for part in re.split(r"[\\/]+", rest) if part])
+
+SETTINGS_DIR = os.path.dirname(user_path(r"%userprofile%\.polsoft\psCli\settings\terminal.json"))
+
+# --- DATA CACHE ---
+CACHE_DIR = os.path.join(SETTINGS_DIR, "cache")
+_data_caches = {}
+
+class FunctionCache:
+    """Memoizing wrapper around a data provider; see `cached`."""
+    def __init__(self, func, ttl=None, key=None, maxsize=128, persist=False, name=None):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.ttl = ttl
+        self.key = key
+        self.maxsize = maxsize
+        self.persist = persist
+        self.name = name or f"{func.__module__}.{func.__qualname__}"
+        self.hits = self.misses = self.evictions = 0
+        self._data = OrderedDict()
+        self._loaded = not persist
+        self._lock = threading.Lock()
+
+    def _key(self, args, kwargs):
+        k = self.key(*args, **kwargs) if self.key is not None else (args, tuple(sorted(kwargs.items())))
+        # Persisted entries are looked up by their repr, so use it for memory too
+        return repr(k) if self.persist else k
+
+    def __call__(self, *args, **kwargs):
+        k = self._key(args, kwargs)
+        now = time.time()
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._data.get(k)
+            if entry is not None and (entry[0] is None or entry[0] > now):
+                self._data.move_to_end(k)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+        # Computed outside the lock; exceptions are not cached
+        value = self.func(*args, **kwargs)
+        with self._lock:
+            self._data[k] = (now + self.ttl if self.ttl is not None else None, value)
+            self._data.move_to_end(k)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            if self.persist:
+                self._save()
+        return copy.deepcopy(value)
+
+    @property
+    def path(self):
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", self.name)
+        return os.path.join(CACHE_DIR, safe + ".json")
+
+    def _load(self):
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("entries", [])
+        except (OSError, ValueError, AttributeError):
+            return
+        now = time.time()
+        for k, expires, value in entries[-self.maxsize:]:
+            if expires is None or expires > now:
+                self._data[k] = (expires, value)
+
+    def _save(self):
+        entries = [[k, expires, value] for k, (expires, value) in self._data.items()]
+        tmp = self.path + ".tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"name": self.name, "entries": entries}, f)
+            os.replace(tmp, self.path)
+        except (OSError, TypeError, ValueError):
+            # Unwritable folder or a value that is not JSON; keep it in memory only
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+    def invalidate(self, *args, **kwargs):
+        """Drop the entry for these arguments."""
+        with self._lock:
+            if self._data.pop(self._key(args, kwargs), None) is not None and self.persist:
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+            if self.persist:
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            live = sum(1 for expires, _ in self._data.values() if expires is None or expires > now)
+        return {"name": self.name, "size": live, "maxsize": self.maxsize, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions, "ttl": self.ttl, "persist": self.persist}
+
+def cached(ttl=None, key=None, maxsize=128, persist=False, name=None):
+    """Memoize a slow data provider (subprocess output, platform queries, ...).
+
+    Results live in an LRU of `maxsize` entries for `ttl` seconds (None: until
+    cleared). `key(*args, **kwargs)` picks the cache key, by default the
+    arguments themselves. With persist=True entries are also kept as JSON under
+    the settings folder so they survive restarts; values must be JSON-serialisable
+    and come back as lists/dicts. Every cache shows up in `cache stats`.
+    """
+    def decorator(func):
+        cache = FunctionCache(func, ttl, key, maxsize, persist, name)
+        # A reloaded plugin replaces its caches under the same name
+        _data_caches[cache.name] = cache
+        return cache
+    return decorator
+
+def cache_stats():
+    return [c.stats() for c in _data_caches.values()]
+
+def cache_clear(pattern=None):
+    """Clear every cache whose name contains `pattern` (all when None); returns the count."""
+    cleared = 0
+    for name, c in list(_data_caches.items()):
+        if pattern is None or pattern.lower() in name.lower():
+            c.clear()
+            cleared += 1
+    if pattern is None:
+        # Persisted caches of plugins that are not imported in this session
+        try:
+            for fn in os.listdir(CACHE_DIR):
+                if fn.endswith(".json"):
+                    os.remove(os.path.join(CACHE_DIR, fn))
+        except OSError:
+            pass
+    return cleared
+
+# --- NETWORK STATUS ---
+def probe_local_ip(timeout=2):
+    # Network modules are imported by the probes, off the startup path
+    import socket
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.settimeout(timeout)
+        s.connect(("8.8.8.8", 80))
+        ip = s.getsockname()[0]
+        s.close()
+        return ip
+    except:
+        try:
+            return socket.gethostbyname(socket.gethostname())
+        except:
+            return None
+
+def probe_online(host="1.1.1.1", port=53, timeout=2):
+    import socket
+    try:
+        socket.create_connection((host, port), timeout=timeout).close()
+        return True
+    except:
+        return False
+
+def probe_public_ip(url="https://api.ipify.org?format=json", timeout=3):
+    import urllib.request
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as r:
+            data = json.loads(r.read().decode("utf-8"))
+            return data.get("ip")
+    except:
+        return None
+
+def probe_mac():
+    try:
+        import uuid
+        n = uuid.getnode()
+        return ":".join(f"{(n >> (i*8)) & 0xff:02x}" for i in reversed(range(6)))
+    except:
+        return None
+
+def probe_network(options=None):
+    """Run the local IP, connectivity and public IP probes concurrently.
+
+    `options` is the "network" section of terminal.json: probe_timeout,
+    public_ip_timeout, online_host, online_port and public_ip_url.
+    """
+    from concurrent.futures import ThreadPoolExecutor, wait
+    opts = options or {}
+    timeout = float(opts.get("probe_timeout", 2))
+    public_timeout = float(opts.get("public_ip_timeout", 3))
+    # The whole probe takes no longer than its slowest timeout; late answers count as unknown
+    deadline = float(opts.get("probe_deadline", max(timeout, public_timeout)))
+    pool = ThreadPoolExecutor(max_workers=4)
+    try:
+        mac = pool.submit(probe_mac)
+        local_ip = pool.submit(probe_local_ip, timeout)
+        online = pool.submit(probe_online, opts.get("online_host", "1.1.1.1"), int(opts.get("online_port", 53)), timeout)
+        public_ip = pool.submit(probe_public_ip, opts.get("public_ip_url", "https://api.ipify.org?format=json"),
+                                public_timeout)
+        done, _ = wait([mac, local_ip, online, public_ip], deadline)
+        result = lambda fut, default=None: fut.result() if fut in done else default
+        info = {"local_ip": result(local_ip), "online": result(online, False), "mac": result(mac)}
+        info["public_ip"] = result(public_ip) if info["online"] else None
+    finally:
+        pool.shutdown(wait=False)
+    return info
+
+NETWORK_CACHE = os.path.join(CACHE_DIR, "network.json")
+
+def network_info(options=None, refresh=False, path=NETWORK_CACHE):
+    """probe_network() result, shared between commands and processes through a file.
+
+    A result younger than network.status_ttl seconds is read back from `path`
+    instead of probing; refresh=True always probes. The returned dict carries
+    the probe time as "checked_at" (epoch seconds).
+    """
+    opts = options or {}
+    ttl = float(opts.get("status_ttl", 60))
+    if not refresh:
+        try:
+            data = load_json_cached(path)
+            if data and 0 <= time.time() - data["checked_at"] < ttl:
+                return data
+        except (ValueError, KeyError, TypeError, OSError):
+            pass
+    info = probe_network(opts)
+    info["checked_at"] = time.time()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return info
+
+class NetworkStatus:
+    """Network and OS details for the menu header, probed on a background thread.
+
+    snapshot() never blocks: it returns the last known values and starts a new
+    probe once they are older than network.status_ttl seconds. The first call
+    takes a fresh result from the shared network.json, so one-shot commands
+    show real values; it returns None only while nothing fresh is known.
+    With `blocking` set (one-shot runs, which exit before a background probe
+    lands) a call that finds nothing fresh waits for the probe instead.
+    """
+    def __init__(self, settings=None):
+        self._lock = threading.Lock()
+        self._info = None
+        self._stamp = None
+        self._worker = None
+        self._force = False
+        self.os_info = None
+        self.blocking = False
+        self.configure(settings or {})
+
+    def configure(self, settings):
+        self.options = dict(settings.get("network", {}) or {})
+        self.ttl = float(self.options.get("status_ttl", 60))
+
+    def invalidate(self):
+        """Re-probe on the next snapshot, bypassing the on-disk cache too."""
+        with self._lock:
+            self._stamp = None
+            self._force = True
+
+    def refresh(self):
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name="pscli-network-status", daemon=True)
+            self._worker.start()
+
+    def wait(self, timeout=None):
+        worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def _run(self):
+        with self._lock:
+            force, self._force = self._force, False
+        info = network_info(self.options, refresh=force)
+        os_info = None
+        try:
+            owner_mod = importlib.import_module("plugins.owner")
+            info["mac"] = owner_mod.get_preferred_mac() or info.get("mac")
+            os_info = owner_mod.get_os_info()
+        except Exception:
+            pass
+        with self._lock:
+            self._info = info
+            self._stamp = info.get("checked_at", time.time())
+            if os_info:
+                self.os_info = os_info
+
+    def _load_cached(self):
+        """Seed the status from network.json when another run probed recently."""
+        try:
+            data = load_json_cached(NETWORK_CACHE)
+            if data and 0 <= time.time() - data["checked_at"] < self.ttl:
+                self._info, self._stamp = data, data["checked_at"]
+        except (ValueError, KeyError, TypeError, OSError):
+            pass
+
+    def snapshot(self):
+        with self._lock:
+            if self._info is None and not self._force:
+                self._load_cached()
+            info = dict(self._info) if self._info is not None else None
+            # checked_at is wall-clock time, so a value read from disk keeps its age
+            fresh = self._stamp is not None and 0 <= time.time() - self._stamp < self.ttl
+        if not fresh:
+            self.refresh()
+            if self.blocking and info is None:
+                opts = self.options
+                self.wait(float(opts.get("probe_deadline", max(float(opts.get("probe_timeout", 2)),
+                                                                float(opts.get("public_ip_timeout", 3))))) + 1)
+                with self._lock:
+                    info = dict(self._info) if self._info is not None else None
+                fresh = info is not None
+        if info is not None:
+            info["stale"] = not fresh
+        return info
+
+# --- COMMAND INDEX ---
+BUILTIN_COMMANDS = ("all", "modules", "mod", "menu", "refresh", "reload", "watch", "stats",
+                    "jobs", "fg", "wait", "kill", "cache", "run-many", "exit", "quit")
+
+def _edit_distance(a, b, limit):
+    """Optimal string alignment distance, giving up (limit + 1) once it exceeds limit.
+
+    Only the diagonal band |i - j| <= limit is computed.
+    """
+    if a == b:
+        return 0
+    la, lb = len(a), len(b)
+    over = limit + 1
+    if abs(la - lb) > limit:
+        return over
+    prev2, prev = None, [j if j <= limit else over for j in range(lb + 1)]
+    for i in range(1, la + 1):
+        cur = [over] * (lb + 1)
+        if i <= limit:
+            cur[0] = i
+        lo, hi = max(1, i - limit), min(lb, i + limit)
+        row_min = cur[0]
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            v = prev[j - 1] + (ca != b[j - 1])
+            if prev[j] + 1 < v:
+                v = prev[j] + 1
+            if cur[j - 1] + 1 < v:
+                v = cur[j - 1] + 1
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == b[j - 1] and prev2[j - 2] + 1 < v:
+                v = prev2[j - 2] + 1
+            cur[j] = v
+            if v < row_min:
+                row_min = v
+        if row_min > limit:
+            return over
+        prev2, prev = prev, cur
+    return min(prev[lb], over)
+
+class CommandIndex:
+    """Prefix trie and SymSpell-style delete index over command, alias and group names.
+
+    Keys are case-folded; each remembers its original spelling and how many
+    registry entries of each kind ("command", "alias", "group", "builtin") use it.
+    """
+    KIND_RANK = {"command": 0, "builtin": 1, "alias": 2, "group": 3}
+
+    def __init__(self, max_distance=2, prefix_length=8):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._pinned = []
+        self.clear()
+
+    def clear(self):
+        self._words = {}
+        self._trie = {}
+        self._deletes = {}
+        for word, kind in self._pinned:
+            self.add(word, kind)
+
+    def pin(self, words, kind="builtin"):
+        """Add words that survive clear()."""
+        for word in words:
+            self._pinned.append((word, kind))
+            self.add(word, kind)
+
+    def _variants(self, key):
+        """All strings reachable from the key's prefix by deleting up to max_distance chars."""
+        level = {key[:self.prefix_length]}
+        variants = set(level)
+        for _ in range(self.max_distance):
+            level = {w[:i] + w[i + 1:] for w in level for i in range(len(w))}
+            variants |= level
+        return variants
+
+    def add(self, word, kind):
+        key = word.lower()
+        entry = self._words.get(key)
+        if entry is None:
+            entry = self._words[key] = {"word": word, "kinds": {}}
+            node = self._trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[None] = key
+            for v in self._variants(key):
+                self._deletes.setdefault(v, set()).add(key)
+        entry["kinds"][kind] = entry["kinds"].get(kind, 0) + 1
+
+    def remove(self, word, kind):
+        key = word.lower()
+        entry = self._words.get(key)
+        if entry is None or kind not in entry["kinds"]:
+            return
+        entry["kinds"][kind] -= 1
+        if entry["kinds"][kind] <= 0:
+            del entry["kinds"][kind]
+        if entry["kinds"]:
+            return
+        del self._words[key]
+        path, node = [], self._trie
+        for ch in key:
+            path.append((node, ch))
+            node = node[ch]
+        node.pop(None, None)
+        # Prune branches left without any word below them
+        for parent, ch in reversed(path):
+            if parent[ch]:
+                break
+            del parent[ch]
+        for v in self._variants(key):
+            keys = self._deletes.get(v)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._deletes[v]
+
+    def _rank(self, key, distance):
+        kinds = self._words[key]["kinds"]
+        return (distance, min(self.KIND_RANK.get(k, 9) for k in kinds), len(key), key)
+
+    def complete(self, prefix, limit=50):
+        """Original spellings of the words starting with prefix, shortest first."""
+        node = self._trie
+        for ch in prefix.lower():
+            node = node.get(ch)
+            if node is None:
+                return []
+        found, stack = [], [node]
+        while stack and len(found) < limit:
+            node = stack.pop()
+            for ch, child in node.items():
+                if ch is None:
+                    found.append(child)
+                else:
+                    stack.append(child)
+        return [self._words[k]["word"] for k in sorted(found, key=lambda k: (len(k), k))]
+
+    def suggest(self, word, limit=5):
+        """Closest known names: edits within max_distance, then completions of word."""
+        query = word.lower()
+        scored = {}
+        for v in self._variants(query):
+            for key in self._deletes.get(v, ()):
+                if key not in scored:
+                    d = _edit_distance(query, key, self.max_distance)
+                    if d <= self.max_distance:
+                        scored[key] = d
+        for spelled in self.complete(query, limit):
+            key = spelled.lower()
+            # A completion counts as one edit so near-misses still rank first
+            scored[key] = min(scored.get(key, 1), 1)
+        scored.pop(query, None)
+        ranked = sorted(scored, key=lambda k: self._rank(k, scored[k]))
+        return [self._words[k]["word"] for k in ranked[:limit]]
+
+# --- COMMAND REGISTRY ---
+class CommandRegistry:
+    """Commands and aliases with reverse-alias and group indexes.
+
+    Every mutation bumps `version`; sorted views built through `view()` are
+    cached until the next mutation.
+    """
+    def __init__(self):
         self.commands = {}
         self.aliases = {}
-        self._prepare_env()
+        self.index = CommandIndex()
+        self.version = 0
+        self._alias_index = {}
+        self._alias_order = {}
+        self._groups = {}
+        self._views = {}
+
+    def _changed(self):
+        self.version += 1
+        self._views.clear()
+
+    @staticmethod
+    def group_of(func):
+        return str(func.meta.get('group', 'python')).lower()
+
+    def add(self, name, func):
+        if name in self.commands:
+            self._drop_from_group(name)
+        else:
+            self.index.add(name, "command")
+        self.commands[name] = func
+        group = self.group_of(func)
+        if group not in self._groups:
+            self.index.add(group, "group")
+        self._groups.setdefault(group, {})[name] = None
+        self._changed()
+
+    def replace(self, name, func):
+        """Swap the callable behind a command without touching its indexes."""
+        self.commands[name] = func
+
+    def add_alias(self, alias, name):
+        old = self.aliases.get(alias)
+        if old is not None:
+            self._alias_index[old].remove(alias)
+        else:
+            self.index.add(alias, "alias")
+        self.aliases[alias] = name
+        # Keep aliases in first-registration order, as a scan over self.aliases would
+        self._alias_order.setdefault(alias, len(self._alias_order))
+        lst = self._alias_index.setdefault(name, [])
+        lst.append(alias)
+        lst.sort(key=self._alias_order.__getitem__)
+        self._changed()
 
-    def _local_ip(self):
+    def remove(self, name):
+        if name not in self.commands:
+            return
+        self._drop_from_group(name)
+        del self.commands[name]
+        self.index.remove(name, "command")
+        for alias in self._alias_index.pop(name, []):
+            del self.aliases[alias]
+            self.index.remove(alias, "alias")
+        self._changed()
+
+    def _drop_from_group(self, name):
+        group = self.group_of(self.commands[name])
+        members = self._groups.get(group)
+        if members is not None:
+            members.pop(name, None)
+            if not members:
+                del self._groups[group]
+                self.index.remove(group, "group")
+
+    def clear(self):
+        self.commands.clear()
+        self.aliases.clear()
+        self._alias_index.clear()
+        self._alias_order.clear()
+        self._groups.clear()
+        self.index.clear()
+        self._changed()
+
+    def resolve(self, trigger):
+        target = self.aliases.get(trigger, trigger)
+        return target if target in self.commands else None
+
+    def aliases_for(self, name):
+        return self._alias_index.get(name, [])
+
+    def groups(self):
+        return self._groups.keys()
+
+    def group_members(self, group):
+        return self._groups.get(group, {}).keys()
+
+    def view(self, key, build):
+        """Return build() cached under key until the registry changes."""
+        if key not in self._views:
+            self._views[key] = build()
+        return self._views[key]
+
+# --- STARTUP PROFILER ---
+class StartupProfiler:
+    """Phase and per-source timings collected by `cli.py --profile-startup`."""
+    def __init__(self):
+        self.phases = {}
+        self.items = {}
+        self._current = None
+        self._depth = 0
+        self._start = time.perf_counter()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        self._depth += 1
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except:
+            yield
+        finally:
+            self._depth -= 1
+            # Phases are reported in start order, nested ones indented under their parent
+            self.phases.setdefault(name, [0.0, self._depth, start])[0] += time.perf_counter() - start
+
+    def _record(self, path):
+        return self.items.setdefault(path, {
+            "source": os.path.join(os.path.basename(os.path.dirname(path)), os.path.basename(path)),
+            "load": 0.0, "import": 0.0, "meta": 0.0, "commands": 0, "error": None
+        })
+
+    @contextlib.contextmanager
+    def item(self, path, count):
+        """Time registering one source file; `count` returns the number of registrations so far."""
+        rec = self._record(path)
+        prev, self._current = self._current, rec
+        before = count()
+        start = time.perf_counter()
+        try:
+            yield rec
+        finally:
+            rec["load"] += time.perf_counter() - start
+            rec["commands"] += count() - before
+            self._current = prev
+
+    def add_meta(self, seconds):
+        if self._current is not None:
+            self._current["meta"] += seconds
+
+    def time_imports(self, dispatcher):
+        """Import every plugin the registry deferred and time each first import."""
+        for item in dispatcher.catalog or []:
+            mod_name = f"plugins.{item['name']}"
+            if item["kind"] != "python" or mod_name in sys.modules:
+                continue
+            rec = self._record(item["path"])
+            start = time.perf_counter()
             try:
-                return socket.gethostbyname(socket.gethostname())
-            except:
-                return None
+                importlib.import_module(mod_name)
+            except BaseException as e:
+                rec["error"] = f"{type(e).__name__}: {e}"
+            finally:
+                rec["import"] += time.perf_counter() - start
 
-    def _is_online(self):
+    def to_dict(self):
+        ms = lambda s: round(s * 1000, 3)
+        rows = sorted(self.items.values(), key=lambda r: r["load"] + r["import"], reverse=True)
+        return {
+            "phases": {name: ms(p[0]) for name, p in sorted(self.phases.items(), key=lambda p: p[1][2])},
+            "total_ms": ms(time.perf_counter() - self._start),
+            "sources": [dict(r, load=ms(r["load"]), **{"import": ms(r["import"]), "meta": ms(r["meta"])}) for r in rows]
+        }
+
+    def report(self, limit=None):
+        data = self.to_dict()
+        out = [f"{Color.CYAN}{Color.BOLD}STARTUP PROFILE{Color.RESET}\n"]
+        for name, value in data["phases"].items():
+            label = "  " * self.phases[name][1] + name
+            out.append(f"  {label:<20} {value:>10.2f} ms")
+        out.append(f"  {Color.BOLD}{'total':<20} {data['total_ms']:>10.2f} ms{Color.RESET}\n")
+
+        table = Table([("SOURCE", 32), ("LOAD ms", 9), ("IMPORT ms", 9), ("META ms", 8), ("CMDS", 4), ("ERROR", None)], flex=0)
+        for r in data["sources"][:limit]:
+            table.add_row(r["source"], f"{r['load']:>9.2f}", f"{r['import']:>9.2f}", f"{r['meta']:>8.2f}",
+                          f"{r['commands']:>4}", ((r["error"] or "")[:60], Color.RED))
+        out.append(table.render(max_width=terminal_width(), top_rule=False))
+        out.append(f"{Color.GRAY}LOAD includes META; IMPORT is the first import of a lazily registered plugin.{Color.RESET}\n")
+        emit("\n".join(out))
+
+# --- COMMAND METRICS ---
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+class CommandMetrics:
+    """Per-command call counts and latencies in an append-only JSONL store.
+
+    Every call appends one line. Reading keeps the newest `ring_size` samples per
+    command for percentiles; once the file grows past `max_bytes` older samples
+    are folded into per-command totals and the file is rewritten to at most half
+    of `max_bytes`, split evenly between the commands.
+    """
+    def __init__(self, path, settings=None):
+        self.path = path
+        self._lock = threading.RLock()
+        self.configure(settings or {})
+
+    def configure(self, settings):
+        cfg = settings.get("metrics", {})
+        self.enabled = cfg.get("enabled", True)
+        self.ring_size = max(1, int(cfg.get("ring_size", 200)))
+        self.max_bytes = int(cfg.get("max_bytes", 1024 * 1024))
+
+    @staticmethod
+    def _cpu():
+        t = os.times()
+        # Include finished child processes so external tools are accounted for
+        return t.user + t.system + t.children_user + t.children_system
+
+    @contextlib.contextmanager
+    def measure(self, name, group):
+        """Time the enclosed call; clear the yielded status["ok"] to count it as failed."""
+        status = {"ok": True}
+        wall0, cpu0 = time.perf_counter(), self._cpu()
         try:
-            socket.create_connection(("1.1.1.1", 53), timeout=2).close()
-            return True
-        except:
-            return False
+            yield status
+        except BaseException:
+            status["ok"] = False
+            raise
+        finally:
+            self.record(name, group, time.perf_counter() - wall0, self._cpu() - cpu0, status["ok"])
+
+    def record(self, name, group, wall, cpu, ok):
+        if not self.enabled:
+            return
+        line = json.dumps({"c": name, "g": group, "w": round(wall, 6), "u": round(cpu, 6), "ok": int(ok)}, ensure_ascii=False)
+        with self._lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    size = f.tell()
+            except OSError:
+                return
+            if size > self.max_bytes:
+                self.compact()
 
-    def _public_ip(self):
+    def load(self):
+        """Fold the store into {command: {"group", "count", "failures", "samples"}}."""
+        stats = {}
         try:
-            with urllib.request.urlopen("https://api.ipify.org?format=json", timeout=3) as r:
-                data = json.loads(r.read().decode("utf-8"))
-                return data.get("ip")
-        except:
+            f = open(self.path, "r", encoding="utf-8")
+        except OSError:
+            return stats
+        with f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                    name = rec["c"]
+                except (ValueError, TypeError, KeyError):
+                    continue  # torn line from an interrupted write
+                s = stats.get(name)
+                if s is None:
+                    s = stats[name] = {"group": rec.get("g", ""), "count": 0, "failures": 0,
+                                       "samples": deque(maxlen=self.ring_size)}
+                if "n" in rec:
+                    # Totals folded in by compact()
+                    s["count"] += rec["n"]
+                    s["failures"] += rec.get("f", 0)
+                    continue
+                ok = bool(rec.get("ok", 1))
+                s["group"] = rec.get("g", s["group"])
+                s["count"] += 1
+                s["failures"] += not ok
+                s["samples"].append((rec.get("w", 0.0), rec.get("u", 0.0), ok))
+        return stats
+
+    def compact(self):
+        with self._lock:
+            stats = self.load()
+            # Leave room to grow, or every later record() would rewrite the file again
+            budget = self.max_bytes // 2 // max(1, len(stats))
+            lines = []
+            for name, s in stats.items():
+                kept, used = [], 0
+                for w, u, ok in reversed(s["samples"]):
+                    line = json.dumps({"c": name, "g": s["group"], "w": w, "u": u, "ok": int(ok)}, ensure_ascii=False) + "\n"
+                    used += len(line.encode("utf-8"))
+                    if used > budget:
+                        break
+                    kept.append((line, ok))
+                kept.reverse()
+                folded = s["count"] - len(kept)
+                if folded:
+                    failed = s["failures"] - sum(1 for _, ok in kept if not ok)
+                    lines.append(json.dumps({"c": name, "g": s["group"], "n": folded, "f": failed}, ensure_ascii=False) + "\n")
+                lines.extend(line for line, _ in kept)
+            tmp_path = self.path + ".tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.writelines(lines)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+    def reset(self):
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def summarize(count, failures, samples):
+        walls = sorted(w for w, _, _ in samples)
+        mean = sum(walls) / len(walls) if walls else 0.0
+        return {
+            "calls": count, "failures": failures,
+            "p50": _percentile(walls, 50), "p95": _percentile(walls, 95), "max": walls[-1] if walls else 0.0,
+            "cpu": sum(u for _, u, _ in samples) / len(samples) if samples else 0.0,
+            # Estimated from the sampled mean once older calls have been folded
+            "total": mean * count
+        }
+
+# --- EXTERNAL TOOLS ---
+DEFAULT_INTERPRETERS = {
+    ".ps1": ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File"],
+    ".vbs": ["cscript", "//nologo"],
+    ".bat": ["cmd", "/c"],
+    ".cmd": ["cmd", "/c"],
+}
+
+class ExternalExecutor:
+    """Runs external tools with timeouts, a concurrency limit and a log file per run.
+
+    Console tools (menus, `cls`, `choice`) keep the terminal when run in the
+    foreground. Their output is captured, streamed and written to the log when
+    stdout is not a terminal (background jobs, daemon clients, `run-many`) or when
+    capture is requested in the settings or the tool's metadata.
+    """
+    def __init__(self, log_dir, settings=None):
+        self.log_dir = log_dir
+        self.history = deque(maxlen=100)
+        self._seq = 0
+        self._seq_lock = threading.Lock()
+        self.configure(settings or {})
+
+    def configure(self, settings):
+        cfg = settings.get("external", {})
+        self.timeout = cfg.get("timeout") or None
+        self.max_concurrent = max(1, int(cfg.get("max_concurrent", 4)))
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self.capture = cfg.get("capture", False)
+        self.keep_logs = int(cfg.get("keep_logs", 200))
+        self.interpreters = dict(DEFAULT_INTERPRETERS, **cfg.get("interpreters", {}))
+        # None: the locale's preferred encoding, looked up when a tool is captured
+        self.encoding = cfg.get("encoding") or ("oem" if sys.platform == "win32" else None)
+
+    def command_line(self, ext, path, args=()):
+        return list(self.interpreters.get(ext, [])) + [path] + list(args)
+
+    def _log_path(self, name):
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+        safe = re.sub(r"[^\w.-]+", "_", name)
+        return os.path.join(self.log_dir, f"{safe}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{seq}.log")
+
+    @staticmethod
+    def kill_tree(proc):
+        """Stop a tool together with the processes it started."""
+        import subprocess
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            import signal
+            try:
+                # Only run-many tools lead their own group; the rest share the shell's
+                if os.getpgid(proc.pid) == proc.pid:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                    return
+            except OSError:
+                pass
+            proc.kill()
+
+    def run(self, name, ext, path, args=(), timeout=None, capture=None, echo=True):
+        """Run one tool and return {name, path, cmd, code, duration, timed_out, log}."""
+        import subprocess
+        timeout = timeout or self.timeout
+        if capture is None:
+            capture = self.capture
+        # Without a real terminal behind stdout the output has to be relayed
+        interactive = echo and _has_fileno(sys.stdout)
+        capture = capture or not interactive
+        cmd = self.command_line(ext, path, args)
+        result = {"name": name, "path": path, "cmd": cmd, "code": None, "duration": 0.0, "timed_out": False, "log": None}
+        try:
+            os.makedirs(self.log_dir or ".", exist_ok=True)
+            result["log"] = self._log_path(name)
+            log = open(result["log"], "w", encoding="utf-8", errors="replace", newline="")
+        except OSError:
+            log = io.StringIO()
+
+        slots = self._slots
+        with slots, log:
+            log.write(f"# {subprocess.list2cmdline(cmd)}\n# started {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+            start = time.perf_counter()
+            try:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL if not interactive else None,
+                    stdout=subprocess.PIPE if capture else None,
+                    stderr=subprocess.STDOUT if capture else None,
+                    # Unattended runs (run-many, jobs, daemon clients) get their own process
+                    # group so a timeout stops the whole tree; foreground tools keep the
+                    # terminal's group and its Ctrl+C
+                    start_new_session=not interactive and os.name != "nt"
+                )
+            except OSError as e:
+                log.write(f"# failed to start: {e}\n")
+                print(f"{Color.RED}[ERROR] Execution: {e}{Color.RESET}")
+                result["code"] = 127
+                self.history.append(result)
+                return result
+
+            # Let `kill <n>` terminate tools started by a background job
+            job = getattr(_job_local, "job", None)
+            if job is not None:
+                job.procs.add(proc)
+            timer = None
+            if timeout:
+                timer = threading.Timer(timeout, self._expire, args=(proc, result))
+                timer.daemon = True
+                timer.start()
+            try:
+                if capture:
+                    self._pump(proc.stdout, log, echo)
+                code = proc.wait()
+            except KeyboardInterrupt:
+                self.kill_tree(proc)
+                proc.wait()
+                raise
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                if job is not None:
+                    job.procs.discard(proc)
+                if proc.stdout is not None:
+                    proc.stdout.close()
+
+            result["duration"] = time.perf_counter() - start
+            result["code"] = 124 if result["timed_out"] else code
+            log.write(f"\n# exit {result['code']} after {result['duration']:.2f}s"
+                      f"{' (timed out)' if result['timed_out'] else ''}\n")
+        self.history.append(result)
+        self._prune_logs()
+        return result
+
+    def _expire(self, proc, result):
+        result["timed_out"] = True
+        self.kill_tree(proc)
+
+    def _pump(self, pipe, log, echo):
+        """Copy tool output to the log and stdout as it arrives, prompts included."""
+        encoding = self.encoding
+        if encoding is None:
+            import locale
+            encoding = locale.getpreferredencoding(False)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        fd = pipe.fileno()
+        while True:
+            chunk = os.read(fd, 4096)
+            text = decoder.decode(chunk, final=not chunk)
+            if text:
+                log.write(text)
+                if echo:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+            if not chunk:
+                break
+
+    def _prune_logs(self):
+        try:
+            with os.scandir(self.log_dir or ".") as entries:
+                logs = sorted((de.stat().st_mtime_ns, de.path) for de in entries if de.name.endswith(".log"))
+        except OSError:
+            return
+        for _, path in logs[:max(0, len(logs) - self.keep_logs)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+# --- JOB CONTROL ---
+_job_local = _ContextLocal("job")
+_routing_lock = threading.Lock()
+
+@contextlib.contextmanager
+def no_password_prompts(hint):
+    """Refuse password-protected and mainte. commands inside the block.
+
+    Used where nobody is watching the console (daemon requests, background jobs,
+    parallel groups): execute() returns 126 with `hint` instead of prompting.
+    """
+    previous = getattr(_job_local, "no_prompt", None)
+    _job_local.no_prompt = hint
+    try:
+        yield
+    finally:
+        _job_local.no_prompt = previous
+
+class JobKilled(BaseException):
+    """Raised inside a background job thread by `kill <n>`."""
+
+class _OutputBuffer(io.TextIOBase):
+    """Thread-safe text buffer collecting a job's output."""
+    def __init__(self):
+        self._parts = []
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return False
+
+    def write(self, s):
+        with self._lock:
+            self._parts.append(s)
+            self._size += len(s)
+        return len(s)
+
+    def getvalue(self):
+        with self._lock:
+            text = "".join(self._parts)
+            self._parts = [text]
+            return text
+
+    def read_from(self, pos):
+        """Return (text written since pos, new position)."""
+        text = self.getvalue()
+        return text[pos:], len(text)
+
+class _RoutedStream(io.TextIOBase):
+    """sys.stdout/stderr/stdin stand-in sending each thread's I/O to its own route.
+
+    Threads without a route (the shell itself) use the original stream.
+    """
+    def __init__(self, name, default):
+        self._name = name
+        self.default = default
+
+    def _target(self):
+        routes = getattr(_job_local, "routes", None)
+        return routes[self._name] if routes else self.default
+
+    @property
+    def encoding(self):
+        return getattr(self.default, "encoding", None) or "utf-8"
+
+    def readable(self):
+        return self._name == "stdin"
+
+    def writable(self):
+        return self._name != "stdin"
+
+    def write(self, s):
+        return self._target().write(s)
+
+    def read(self, size=-1):
+        return self._target().read(size)
+
+    def readline(self, size=-1):
+        return self._target().readline(size)
+
+    def flush(self):
+        self._target().flush()
+
+    def isatty(self):
+        return self._target().isatty()
+
+    def fileno(self):
+        if getattr(_job_local, "routes", None):
+            raise io.UnsupportedOperation("fileno")
+        return self.default.fileno()
+
+    def __getattr__(self, name):
+        return getattr(self.default, name)
+
+@contextlib.contextmanager
+def capture_output(buffer):
+    """Route the calling thread's stdout/stderr into buffer; input() sees end of file."""
+    with _routing_lock:
+        for name in ("stdout", "stderr", "stdin"):
+            if not isinstance(getattr(sys, name), _RoutedStream):
+                setattr(sys, name, _RoutedStream(name, getattr(sys, name)))
+    prev = getattr(_job_local, "routes", None)
+    _job_local.routes = {"stdout": buffer, "stderr": buffer, "stdin": io.StringIO()}
+    try:
+        yield buffer
+    finally:
+        _job_local.routes = prev
+
+class Job:
+    def __init__(self, jid, line):
+        self.id = jid
+        self.line = line
+        self.output = _OutputBuffer()
+        self.status = "running"
+        self.code = None
+        self.started = time.time()
+        self.ended = None
+        self.thread = None
+        self.procs = set()
+        self.notified = False
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def finish(self, status, code):
+        self.status, self.code, self.ended = status, code, time.time()
+
+class JobManager:
+    """Background jobs started with a trailing `&!` in the shell (jobs / fg / wait / kill)."""
+    def __init__(self, dispatcher):
+        self.dispatcher = dispatcher
+        self.jobs = {}
+        self._next_id = 1
+
+    def start(self, line):
+        job = Job(self._next_id, line)
+        self._next_id += 1
+        self.jobs[job.id] = job
+        job.thread = threading.Thread(target=self._run, args=(job,), name=f"job-{job.id}", daemon=True)
+        job.thread.start()
+        return job
+
+    def _run(self, job):
+        _job_local.job = job
+        try:
+            # The shell keeps reading stdin, so a password prompt here would compete with it
+            with capture_output(job.output), no_password_prompts("run it in the foreground, without &!"):
+                code = self.dispatcher.run_line(job.line)
+            job.finish("done" if not code else "failed", code or 0)
+        except JobKilled:
+            job.finish("killed", 137)
+        except BaseException as e:
+            job.output.write(f"{Color.RED}[JOB ERROR] {e}{Color.RESET}\n")
+            job.finish("failed", 1)
+
+    def get(self, arg=None):
+        if arg is None:
+            return self.jobs[max(self.jobs)] if self.jobs else None
+        try:
+            return self.jobs.get(int(str(arg).lstrip("%")))
+        except ValueError:
             return None
 
-    def _load_settings(self):
-        if os.path.exists(self.settings_path):
+    def _status_line(self, job):
+        color = {"running": Color.YELLOW, "done": Color.GREEN}.get(job.status, Color.RED)
+        exit_str = "" if job.code is None else f" (exit {job.code})"
+        return f"[{job.id}] {color}{job.status}{exit_str}{Color.RESET} {job.line}"
+
+    def notify(self):
+        """Print one line for each job that finished since the last prompt."""
+        for job in list(self.jobs.values()):
+            if job.status != "running" and not job.notified:
+                job.notified = True
+                print(f"{Color.GRAY}{self._status_line(job)}{Color.RESET}")
+
+    def list(self):
+        if not self.jobs:
+            print(f"{Color.GRAY}No background jobs.{Color.RESET}")
+            return 0
+        for job in self.jobs.values():
+            elapsed = (job.ended or time.time()) - job.started
+            lines = job.output.getvalue().count("\n")
+            print(f"{self._status_line(job)} {Color.GRAY}{elapsed:.1f}s, {lines} line(s) of output{Color.RESET}")
+            if job.status != "running":
+                job.notified = True
+        return 0
+
+    def fg(self, arg=None):
+        """Show a job's output, following it until it ends (Ctrl+C detaches)."""
+        job = self.get(arg)
+        if job is None:
+            print(f"{Color.RED}[!] No such job: {arg}{Color.RESET}")
+            return 1
+        pos = 0
+        try:
+            while True:
+                done = not job.running
+                text, pos = job.output.read_from(pos)
+                if text:
+                    sys.stdout.write(text)
+                    sys.stdout.flush()
+                if done:
+                    break
+                job.thread.join(0.1)
+        except KeyboardInterrupt:
+            print(f"\n{Color.GRAY}[{job.id}] still running in the background{Color.RESET}")
+            return 0
+        print(f"{Color.GRAY}{self._status_line(job)}{Color.RESET}")
+        del self.jobs[job.id]
+        return job.code
+
+    def wait(self, arg=None):
+        jobs = [self.get(arg)] if arg is not None else list(self.jobs.values())
+        if None in jobs:
+            print(f"{Color.RED}[!] No such job: {arg}{Color.RESET}")
+            return 1
+        try:
+            for job in jobs:
+                job.thread.join()
+        except KeyboardInterrupt:
+            pass
+        self.notify()
+        codes = [job.code for job in jobs if job.code]
+        return codes[-1] if codes else 0
+
+    def kill(self, arg=None):
+        job = self.get(arg)
+        if job is None or not job.running:
+            print(f"{Color.RED}[!] No running job: {arg}{Color.RESET}")
+            return 1
+        for proc in list(job.procs):
+            ExternalExecutor.kill_tree(proc)
+        # Python code in the job thread stops at its next bytecode boundary
+        import ctypes
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(job.thread.ident), ctypes.py_object(JobKilled))
+        job.thread.join(2)
+        job.notified = not job.running
+        print(f"{Color.GRAY}{self._status_line(job)}{Color.RESET}")
+        return 0
+
+# --- ASYNC COMMANDS ---
+_NO_DEFAULT = object()
+
+class EventLoopThread:
+    """One long-lived asyncio loop on a daemon thread, shared by all async commands.
+
+    The loop (and asyncio itself) is only created when the first coroutine runs.
+    """
+    def __init__(self):
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self):
+        with self._lock:
+            if self._loop is None:
+                import asyncio
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(loop, ready), name="pscli-loop", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run(loop, ready):
+        import asyncio
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def in_loop_thread(self):
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def run(self, aw, timeout=None):
+        """Run awaitable `aw` on the loop from synchronous code and return its result.
+
+        The caller's output routing, format and job go with it. On timeout the
+        task is cancelled and TimeoutError raised; an interrupted caller (Ctrl+C,
+        `kill <n>`) cancels it as well.
+        """
+        if self.in_loop_thread():
+            if hasattr(aw, "close"):
+                aw.close()  # never started; avoids a "never awaited" warning
+            raise RuntimeError("run_async() called from the event loop; await the coroutine instead")
+        import asyncio
+        from concurrent.futures import wait
+        fut = asyncio.run_coroutine_threadsafe(_in_context(contextvars.copy_context(), aw), self.loop)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            # Short waits keep the caller responsive to KeyboardInterrupt and job kills
+            while not fut.done():
+                left = 0.2 if deadline is None else min(0.2, deadline - time.monotonic())
+                if left <= 0:
+                    raise TimeoutError(f"timed out after {timeout:g}s")
+                wait([fut], left)
+        except BaseException:
+            fut.cancel()
+            raise
+        return fut.result()
+
+    def close(self):
+        """Cancel pending tasks and stop the loop thread."""
+        with self._lock:
+            loop, thread, self._loop, self._thread = self._loop, self._thread, None, None
+        if loop is None:
+            return
+        import asyncio
+        def shutdown():
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+            loop.stop()
+        loop.call_soon_threadsafe(shutdown)
+        thread.join(2)
+
+async def _in_context(ctx, aw):
+    import asyncio
+    # A task copies the context it is created in
+    return await ctx.run(asyncio.ensure_future, aw)
+
+event_loop = EventLoopThread()
+
+def run_async(aw, timeout=None):
+    """Run a coroutine on the shared event loop from synchronous plugin code."""
+    return event_loop.run(aw, timeout)
+
+async def gather_limited(limit, *aws, return_exceptions=False):
+    """asyncio.gather() running at most `limit` awaitables at a time; results keep argument order."""
+    import asyncio
+    sem = asyncio.Semaphore(max(1, int(limit)))
+
+    async def one(aw):
+        try:
+            async with sem:
+                return await aw
+        except asyncio.CancelledError:
+            if asyncio.iscoroutine(aw):
+                aw.close()  # never started; avoids "was never awaited" warnings
+            raise
+    return await asyncio.gather(*(one(aw) for aw in aws), return_exceptions=return_exceptions)
+
+async def with_timeout(aw, seconds, default=_NO_DEFAULT):
+    """Await `aw` for at most `seconds` (None waits forever).
+
+    On timeout `aw` is cancelled and `default` returned, or TimeoutError raised
+    when no default is given.
+    """
+    import asyncio
+    try:
+        return await asyncio.wait_for(aw, seconds)
+    except asyncio.TimeoutError:
+        if default is _NO_DEFAULT:
+            raise
+        return default
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call (socket, subprocess, urllib) on the loop's thread pool.
+
+    Like asyncio.to_thread(), which needs Python 3.9: the call keeps the
+    caller's output routing and format.
+    """
+    import asyncio
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(ctx.run, func, *args, **kwargs))
+
+# --- PLUGIN WATCHER ---
+class PluginWatcher:
+    """Polls the source folders and applies incremental reloads while running."""
+    def __init__(self, dispatcher):
+        self.dispatcher = dispatcher
+        self.interval = 0
+        self._stop = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self, interval=1.0):
+        self.stop()
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(self._stop,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread = None
+
+    def _run(self, stop):
+        while not stop.wait(self.interval):
             try:
-                with open(self.settings_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                changed = self.dispatcher.reload_changed()
             except Exception as e:
-                print(f"{Color.RED}[ERROR] Could not load settings: {e}{Color.RESET}")
-        return {}
+                print(f"\n{Color.RED}[WATCH] Reload failed: {e}{Color.RESET}")
+                continue
+            if changed:
+                names = ", ".join(os.path.basename(p) for p in changed)
+                print(f"\n{Color.GRAY}[WATCH] Reloaded: {names}{Color.RESET}")
 
-    def _clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+# --- DISPATCHER CLASS (2026© Terminal psCLI) ---
+class Dispatcher:
+    def __init__(self, plugins_folder="plugins", metadata_folder="metadata", profiler=None):
+        self.profiler = profiler
+        if getattr(sys, "frozen", False):
+            self.root_dir = getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
+        else:
+            self.root_dir = os.path.dirname(os.path.abspath(__file__))
+        self.settings_path = os.path.join(SETTINGS_DIR, "terminal.json")
+        self.protected_path = os.path.join(SETTINGS_DIR, "protected.json")
+        with self._phase("settings"):
+            self.settings = self._load_settings()
+        
+        self.plugins_path = os.path.join(self.root_dir, self.settings.get("dispatcher", {}).get("plugins_folder", plugins_folder))
+        self.metadata_path = os.path.join(self.root_dir, self.settings.get("dispatcher", {}).get("metadata_folder", metadata_folder))
+        
+        self.lazy_plugins = self.settings.get("dispatcher", {}).get("lazy_plugins", True)
+        self.snapshot_path = os.path.join(SETTINGS_DIR, "registry.json")
+        self.index_path = os.path.join(self.root_dir, PLUGIN_INDEX_NAME)
+        self.sources = self.settings.get("dispatcher", {}).get("sources", DEFAULT_SOURCES)
+        self.catalog = None
+        
+        self.registry = CommandRegistry()
+        self.registry.index.pin(BUILTIN_COMMANDS)
+        self.net_status = NetworkStatus(self.settings)
+        self.metrics = CommandMetrics(os.path.join(SETTINGS_DIR, "metrics.jsonl"), self.settings)
+        self.executor = ExternalExecutor(os.path.join(SETTINGS_DIR, "logs"), self.settings)
+        self._snapshot_entries = []
+        self._meta_stamps = {}
+        self._game_modules = {}
+        self._reload_lock = threading.RLock()
+        self.watcher = PluginWatcher(self)
+        self.jobs = JobManager(self)
+        self.loop = event_loop
+        with self._phase("prepare_env"):
+            self._prepare_env()
+
+    def _phase(self, name):
+        return self.profiler.phase(name) if self.profiler is not None else contextlib.nullcontext()
+
+    def _load_settings(self):
+        try:
+            return load_json_cached(self.settings_path, {})
+        except Exception as e:
+            print(f"{Color.RED}[ERROR] Could not load settings: {e}{Color.RESET}")
+        return {}
 
     def _get_protected_commands(self):
         try:
-            path = os.path.expandvars(r"%userprofile%\.polsoft\psCli\settings\protected.json")
-            if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    lst = data.get("commands", [])
-                    if isinstance(lst, list):
-                        return set([str(x).lower() for x in lst])
+            data = load_json_cached(self.protected_path, {})
+            lst = data.get("commands", [])
+            if isinstance(lst, list):
+                return set([str(x).lower() for x in lst])
         except:
             pass
         return set()
@@ -124,7 +1906,7 @@ class Dispatcher:
                 self.plugins_path, 
                 self.metadata_path, 
                 os.path.dirname(self.settings_path),
-                os.path.expandvars(r"%userprofile%\.polsoft\psCli\Calculator")
+                user_path(r"%userprofile%\.polsoft\psCli\Calculator")
             ]
             for folder in folders:
                 if not os.path.exists(folder):
@@ -144,6 +1926,7 @@ class Dispatcher:
         """Open HTML report in default browser."""
         try:
             if os.path.exists(filepath):
+                import webbrowser
                 webbrowser.open(f"file:///{filepath.replace(chr(92), '/')}")
                 print(f"{Color.GREEN}[OK] Opening report in default browser...{Color.RESET}")
             else:
@@ -177,113 +1960,292 @@ class Dispatcher:
                 print(f"{Color.RED}[ERROR] Metadata {filename}: {e}{Color.RESET}")
         return meta
 
-    def get_all_groups(self):
-        return {str(f.meta.get('group', 'python')).lower() for f in self.commands.values()}
+    @property
+    def commands(self):
+        return self.registry.commands
+
+    @property
+    def aliases(self):
+        return self.registry.aliases
+
+    def get_all_groups(self):
+        return self.registry.groups()
+
+    def _snapshot_enabled(self):
+        # Snapshot entries rebuild lazy proxies, so they are only kept in lazy mode
+        return self.lazy_plugins and self.settings.get("dispatcher", {}).get("registry_snapshot", True)
+
+    def load_plugins(self, use_snapshot=False):
+        with self._reload_lock:
+            self.registry.clear()
+            self._game_modules.clear()
+            if use_snapshot and self._embedded_index_enabled() and self._load_embedded_index():
+                return
+            if use_snapshot and self._snapshot_enabled() and self._load_snapshot():
+                return
+
+            self._snapshot_entries = []
+            dir_stamps = self._dir_stamps()
+            self._meta_stamps = self._metadata_stamps()
+            self._scan_sources()
+            if self._snapshot_enabled():
+                self._save_snapshot(dir_stamps)
+
+    def reload_changed(self):
+        """Re-register only the source files added, modified or deleted since the last scan.
+
+        Commands from untouched files keep their current function objects.
+        Returns the sorted paths that were reloaded.
+        """
+        with self._reload_lock:
+            if self.catalog is None:
+                self.load_plugins()
+                return []
+            dir_stamps = self._dir_stamps()
+            catalog = self.scan_sources()
+            meta_stamps = self._metadata_stamps()
+            old = {item["path"]: item for item in self.catalog}
+            old_prints = {p: self._fingerprint(item, self._meta_stamps) for p, item in old.items()}
+            new_prints = {item["path"]: self._fingerprint(item, meta_stamps) for item in catalog}
+
+            stale = [p for p, fp in old_prints.items() if new_prints.get(p) != fp]
+            fresh = [item for item in catalog if old_prints.get(item["path"]) != new_prints[item["path"]]]
+            self.catalog = catalog
+            self._meta_stamps = meta_stamps
+            if not stale and not fresh:
+                return []
+
+            self._unload_sources([old[p] for p in stale])
+            for item in fresh:
+                self._load_item(item)
+            if self._snapshot_enabled():
+                self._save_snapshot(dir_stamps)
+            return sorted(set(stale) | {item["path"] for item in fresh})
+
+    @staticmethod
+    def _metadata_key(item):
+        if item["kind"] == "external":
+            return f"{item['filename']}.json"
+        if item["kind"] == "game":
+            return f"{item['name']}.json"
+        return None
+
+    def _fingerprint(self, item, meta_stamps):
+        return (item.get("stamp"), meta_stamps.get(self._metadata_key(item)))
+
+    def _metadata_stamps(self):
+        stamps = {}
+        try:
+            entries = os.scandir(self.metadata_path)
+        except OSError:
+            return stamps
+        with entries:
+            for de in entries:
+                if de.name.endswith(".json"):
+                    try:
+                        stamps[de.name] = de.stat().st_mtime_ns
+                    except OSError:
+                        pass
+        return stamps
+
+    def _unload_sources(self, items):
+        """Drop the commands registered from the given catalog items."""
+        paths = {item["path"] for item in items}
+        dropped = set()
+        kept = []
+        for entry in self._snapshot_entries:
+            if entry.get("source") in paths:
+                dropped.add(entry["name"])
+            else:
+                kept.append(entry)
+        self._snapshot_entries = kept
+        for name in dropped:
+            self.registry.remove(name)
+        # Another file may still provide a dropped name that it lost in a clash
+        for entry in kept:
+            if entry["name"] in dropped:
+                self._restore_entry(entry)
+
+        for item in items:
+            if item["kind"] == "python":
+                sys.modules.pop(f"plugins.{item['name']}", None)
+            elif item["kind"] == "game":
+                self._game_modules.pop(item["path"], None)
+                sys.modules.pop(item["name"], None)
+
+    def _snapshot_dirs(self):
+        return [self.metadata_path, self.root_dir] + [self._source_path(src) for src in self.sources]
+
+    def _dir_stamps(self):
+        stamps = {}
+        for d in self._snapshot_dirs():
+            try:
+                stamps[d] = os.stat(d).st_mtime_ns
+            except OSError:
+                stamps[d] = None
+        return stamps
+
+    def _load_snapshot(self):
+        """Rebuild the registry from the on-disk snapshot if no source file changed.
+
+        Folder mtimes only move when files are added or removed, so the source
+        folders are rescanned and every file's [mtime, size] stamp compared too.
+        """
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snap = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(snap, dict) or snap.get("version") != REGISTRY_SNAPSHOT_VERSION:
+            return False
+        if snap.get("root_dir") != self.root_dir or snap.get("dirs") != self._dir_stamps():
+            return False
+        meta_stamps = self._metadata_stamps()
+        if snap.get("metadata") != meta_stamps:
+            return False
+        catalog = self.scan_sources()
+        if snap.get("catalog") != catalog:
+            return False
+        try:
+            entries = snap["entries"]
+            for entry in entries:
+                self._restore_entry(entry)
+        except (KeyError, TypeError, ValueError):
+            self.registry.clear()
+            return False
+        self._snapshot_entries = entries
+        self._meta_stamps = meta_stamps
+        self.catalog = catalog
+        return True
+
+    def _save_snapshot(self, dir_stamps):
+        snap = {
+            "version": REGISTRY_SNAPSHOT_VERSION,
+            "root_dir": self.root_dir,
+            "dirs": dir_stamps,
+            "metadata": self._meta_stamps,
+            "catalog": self.catalog,
+            "entries": self._snapshot_entries
+        }
+        tmp_path = self.snapshot_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snap, f, ensure_ascii=False)
+            os.replace(tmp_path, self.snapshot_path)
+        except (OSError, TypeError, ValueError):
+            pass
 
-    def load_plugins(self):
-        self.commands.clear()
-        self.aliases.clear()
-        if not os.path.exists(self.plugins_path):
-            return
+    def _embedded_index_enabled(self):
+        # Bundled files cannot change, so a frozen build trusts the index written at build time
+        return (getattr(sys, "frozen", False) and self.lazy_plugins
+                and os.environ.get("PSCLI_EMBEDDED_INDEX", "1") != "0")
 
-        for filename in os.listdir(self.plugins_path):
-            name, ext = os.path.splitext(filename)
-            ext = ext.lower()
-            full_path = os.path.join(self.plugins_path, filename)
-            
-            if os.path.isdir(full_path) or filename.startswith("__"):
-                continue
+    def _index_layout(self):
+        return {
+            "plugins": os.path.relpath(self.plugins_path, self.root_dir),
+            "metadata": os.path.relpath(self.metadata_path, self.root_dir),
+            "sources": self.sources
+        }
 
-            try:
-                if ext == ".py":
-                    self._load_python_module(name)
-                elif ext in [".bat", ".cmd", ".ps1", ".exe", ".vbs"]:
-                    self._register_external_binary(filename, name, ext, full_path)
-            except Exception as e:
-                print(f"{Color.RED}[ERROR] Loading {filename}: {e}{Color.RESET}")
-        
-        # Load games
-        games_path = os.path.join(self.root_dir, "games")
-        if os.path.exists(games_path):
-            for filename in os.listdir(games_path):
-                name, ext = os.path.splitext(filename)
-                ext = ext.lower()
-                full_path = os.path.join(games_path, filename)
-                
-                if os.path.isdir(full_path) or filename.startswith("__"):
-                    continue
-                
-                try:
-                    if ext == ".py":
-                        self._load_game_module(name, full_path)
-                except Exception as e:
-                    print(f"{Color.RED}[ERROR] Loading game {filename}: {e}{Color.RESET}")
-        
-        # Load ASCII tools
-        ascii_path = os.path.join(self.root_dir, "ascii")
-        if os.path.exists(ascii_path):
-            for filename in os.listdir(ascii_path):
-                name, ext = os.path.splitext(filename)
-                ext = ext.lower()
-                full_path = os.path.join(ascii_path, filename)
-                
-                if os.path.isdir(full_path) or filename.startswith("__"):
-                    continue
-                
-                try:
-                    if ext in [".bat", ".cmd", ".ps1", ".exe", ".vbs"]:
-                        self._register_external_binary(filename, name, ext, full_path)
-                except Exception as e:
-                    print(f"{Color.RED}[ERROR] Loading ASCII tool {filename}: {e}{Color.RESET}")
+    @staticmethod
+    def _map_paths(catalog, entries, fn):
+        """Copy catalog items and registry entries with every file path passed through fn."""
+        catalog = [dict(item, path=fn(item["path"])) for item in catalog]
+        mapped = []
+        for entry in entries:
+            entry = dict(entry)
+            if entry.get("source"):
+                entry["source"] = fn(entry["source"])
+            target = list(entry["target"])
+            i = {"external": 3, "game": 2, "game_entry": 2}.get(target[0])
+            if i is not None:
+                target[i] = fn(target[i])
+            entry["target"] = target
+            mapped.append(entry)
+        return catalog, mapped
 
-        
-        tools_path = os.path.join(self.root_dir, "tools")
-        if os.path.exists(tools_path):
-            for filename in os.listdir(tools_path):
-                name, ext = os.path.splitext(filename)
-                ext = ext.lower()
-                full_path = os.path.join(tools_path, filename)
-                
-                if os.path.isdir(full_path) or filename.startswith("__"):
-                    continue
-                
-                try:
-                    if ext in [".bat", ".cmd", ".ps1", ".exe", ".vbs"]:
-                        self._register_external_binary(filename, name, ext, full_path)
-                except Exception as e:
-                    print(f"{Color.RED}[ERROR] Loading tool {filename}: {e}{Color.RESET}")
-
-        health_path = os.path.join(self.root_dir, "health")
-        if os.path.exists(health_path):
-            for filename in os.listdir(health_path):
-                name, ext = os.path.splitext(filename)
-                ext = ext.lower()
-                full_path = os.path.join(health_path, filename)
-                
-                if os.path.isdir(full_path) or filename.startswith("__"):
-                    continue
-                
-                try:
-                    if ext in [".bat", ".cmd", ".ps1", ".exe", ".vbs"]:
-                        self._register_external_binary(filename, name, ext, full_path)
-                except Exception as e:
-                    print(f"{Color.RED}[ERROR] Loading health tool {filename}: {e}{Color.RESET}")
-
-        install_path = os.path.join(self.root_dir, "install")
-        if os.path.exists(install_path):
-            for filename in os.listdir(install_path):
-                name, ext = os.path.splitext(filename)
-                ext = ext.lower()
-                full_path = os.path.join(install_path, filename)
-                
-                if os.path.isdir(full_path) or filename.startswith("__"):
-                    continue
-                
-                try:
-                    if ext in [".bat", ".cmd", ".ps1", ".exe", ".vbs"]:
-                        self._register_external_binary(filename, name, ext, full_path)
-                except Exception as e:
-                    print(f"{Color.RED}[ERROR] Loading installer {filename}: {e}{Color.RESET}")
+    def build_index(self, out_path):
+        """Scan every source and write a relocatable registry index to out_path.
+
+        Returns the number of commands written.
+        """
+        with self._reload_lock:
+            # Lazy discovery records every command without importing plugins
+            self.lazy_plugins = True
+            self.registry.clear()
+            self._game_modules.clear()
+            self._snapshot_entries = []
+            self._scan_sources()
+        # Only files from the source folders are bundled (not the root build script)
+        bundled = {item["path"] for item in self.catalog}
+        entries = [e for e in self._snapshot_entries if e.get("source") in bundled]
+        rel = lambda p: os.path.relpath(p, self.root_dir)
+        catalog, entries = self._map_paths(self.catalog, entries, rel)
+        for item in catalog:
+            # Extraction resets file times, so build-time stamps would never match
+            item["stamp"] = None
+        index = {
+            "version": REGISTRY_SNAPSHOT_VERSION,
+            "layout": self._index_layout(),
+            "catalog": catalog,
+            "entries": entries
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        return len(entries)
+
+    def _load_embedded_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(index, dict) or index.get("version") != REGISTRY_SNAPSHOT_VERSION:
+            return False
+        if index.get("layout") != self._index_layout():
+            return False
+        absolute = lambda p: os.path.normpath(os.path.join(self.root_dir, p))
+        try:
+            catalog, entries = self._map_paths(index["catalog"], index["entries"], absolute)
+            for entry in entries:
+                self._restore_entry(entry)
+        except (KeyError, TypeError, ValueError, IndexError):
+            self.registry.clear()
+            return False
+        self._snapshot_entries = entries
+        self._meta_stamps = {}
+        self.catalog = catalog
+        return True
+
+    def compile_sources(self):
+        """Precompile plugin and game sources to hash-checked bytecode.
+
+        Hash-based .pyc files stay valid after the bundle is extracted with new
+        file times, and are still rebuilt when a source actually changes.
+        """
+        import compileall
+        import py_compile
+        ok = True
+        for source in self.sources:
+            if source.get("type") in ("plugins", "games"):
+                ok &= bool(compileall.compile_dir(
+                    self._source_path(source), maxlevels=0, quiet=1,
+                    invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH))
+        return ok
+
+    def _restore_entry(self, entry):
+        name, aliases = entry["name"], entry["aliases"]
+        func = self._command_from_target(entry["target"], name, aliases)
+        func.meta = dict(entry["meta"])
+        self.registry.add(name, func)
+        for alias in aliases:
+            self.registry.add_alias(alias, name)
+
+    def _scan_sources(self):
+        self.catalog = self.scan_sources()
+        for item in self.catalog:
+            self._load_item(item)
 
         # Register root build script as command
         build_script = os.path.join(self.root_dir, "build.ps1")
@@ -293,9 +2255,86 @@ class Dispatcher:
             except Exception as e:
                 print(f"{Color.RED}[ERROR] Loading build.ps1: {e}{Color.RESET}")
 
+    def _load_item(self, item):
+        if self.profiler is not None:
+            with self.profiler.item(item["path"], lambda: len(self._snapshot_entries)):
+                self._register_item(item)
+        else:
+            self._register_item(item)
+
+    def _register_item(self, item):
+        try:
+            if item["kind"] == "python":
+                self._load_python_module(item["name"])
+            elif item["kind"] == "game":
+                self._load_game_module(item["name"], item["path"])
+            else:
+                self._register_external_binary(item["filename"], item["name"], item["ext"], item["path"])
+        except Exception as e:
+            print(f"{Color.RED}[ERROR] Loading {item['filename']}: {e}{Color.RESET}")
+
+    def _source_path(self, source):
+        if source.get("type") == "plugins":
+            return self.plugins_path
+        return os.path.join(self.root_dir, source.get("folder", ""))
+
+    def scan_sources(self):
+        """Walk every configured source folder once and classify its files by extension."""
+        catalog = []
+        for source in self.sources:
+            src_type = source.get("type", "tools")
+            try:
+                entries = os.scandir(self._source_path(source))
+            except OSError:
+                continue
+            with entries:
+                for de in entries:
+                    if de.name.startswith("__"):
+                        continue
+                    try:
+                        if de.is_dir():
+                            continue
+                        st = de.stat()
+                    except OSError:
+                        continue
+                    name, ext = os.path.splitext(de.name)
+                    ext = ext.lower()
+                    if ext == ".py" and src_type in ("plugins", "games"):
+                        kind = "python" if src_type == "plugins" else "game"
+                    elif ext in BINARY_EXTS and src_type in ("plugins", "tools"):
+                        kind = "external"
+                    else:
+                        continue
+                    catalog.append({
+                        "folder": source.get("folder"), "kind": kind, "name": name,
+                        "ext": ext, "filename": de.name, "path": de.path,
+                        "stamp": [st.st_mtime_ns, st.st_size]
+                    })
+        return catalog
+
     def _load_python_module(self, name):
         try:
             mod_name = f"plugins.{name}"
+            source = os.path.join(self.plugins_path, f"{name}.py")
+            if self.lazy_plugins:
+                spec = discover_plugin(source)
+                if spec is not None:
+                    # Drop any stale copy so the first call imports the current source
+                    sys.modules.pop(mod_name, None)
+                    attrs = spec["attrs"]
+                    base_meta = {
+                        "author": attrs.get("__author__", "Unknown"),
+                        "category": attrs.get("__category__", "general"),
+                        "group": attrs.get("__group__", "python"),
+                        "desc": attrs.get("__desc__", None)
+                    }
+                    for c in spec["commands"]:
+                        target = ["plugin", mod_name, c["attr"]]
+                        proxy = self._command_from_target(target, c["name"], c["aliases"])
+                        self._register_plugin_command(c["name"], proxy, c["aliases"], base_meta, c["doc"], "No description", target, source,
+                                                      c.get("output_flags", True))
+                    return
+
             if mod_name in sys.modules:
                 del sys.modules[mod_name]
             
@@ -308,99 +2347,162 @@ class Dispatcher:
                 "desc": getattr(module, "__desc__", None)
             }
 
+            import inspect
             for _, obj in inspect.getmembers(module):
                 if inspect.isfunction(obj) and hasattr(obj, "is_command"):
                     cmd_name = getattr(obj, "command_name", _)
-                    cmd_meta = base_meta.copy()
-                    
                     doc = (obj.__doc__ or "").strip().split('\n')[0]
-                    if doc:
-                        cmd_meta["desc"] = doc
-                    elif not cmd_meta["desc"]:
-                        cmd_meta["desc"] = "No description"
-
-                    obj.meta = cmd_meta
-                    self.commands[cmd_name] = obj
-                    
-                    for alias in getattr(obj, "aliases", []):
-                        self.aliases[alias] = cmd_name
+                    self._register_plugin_command(cmd_name, obj, getattr(obj, "aliases", []), base_meta, doc, "No description",
+                                                  ["plugin", mod_name, _], source, getattr(obj, "output_flags", True))
         except Exception as e:
             print(f"{Color.RED}[ERROR] Module {name}.py: {e}{Color.RESET}")
 
+    def _register_plugin_command(self, cmd_name, func, aliases, base_meta, doc, fallback_desc, target=None, source=None,
+                                 output_flags=True):
+        cmd_meta = base_meta.copy()
+        if doc:
+            cmd_meta["desc"] = doc
+        elif not cmd_meta["desc"]:
+            cmd_meta["desc"] = fallback_desc
+        if not output_flags:
+            # Kept in the snapshot so lazily restored commands still get their raw flags
+            cmd_meta["output_flags"] = False
+
+        func.meta = cmd_meta
+        self.registry.add(cmd_name, func)
+        
+        for alias in aliases:
+            self.registry.add_alias(alias, cmd_name)
+
+        if target is not None:
+            self._snapshot_entries.append({
+                "name": cmd_name, "aliases": list(aliases), "meta": cmd_meta,
+                "target": target, "source": source
+            })
+
+    def _command_from_target(self, target, cmd_name, aliases):
+        """Build a callable for a registry target without importing its module."""
+        kind = target[0]
+        if kind == "external":
+            return self._external_command(*target[1:])
+        if kind == "plugin":
+            mod_name, attr = target[1:]
+            resolve = lambda: getattr(importlib.import_module(mod_name), attr)
+        elif kind == "game":
+            name, full_path, attr = target[1:]
+            resolve = lambda: getattr(self._game_module(name, full_path), attr)
+        elif kind == "game_entry":
+            name, full_path, entry = target[1:]
+            resolve = lambda: self._game_wrapper(getattr(self._game_module(name, full_path), entry))
+        else:
+            raise ValueError(f"unknown command target: {kind}")
+        return self._lazy_command(cmd_name, aliases, resolve)
+
+    def _lazy_command(self, cmd_name, aliases, resolve):
+        """Placeholder command that imports the real one on first invocation."""
+        def lazy_call(*args):
+            func = resolve()
+            func.meta = lazy_call.meta
+            with self._reload_lock:
+                if self.commands.get(cmd_name) is lazy_call:
+                    self.registry.replace(cmd_name, func)
+            return func(*args)
+
+        lazy_call.is_command = True
+        lazy_call.is_lazy = True
+        lazy_call.command_name = cmd_name
+        lazy_call.aliases = aliases
+        return lazy_call
+
+    def _import_game_module(self, name, full_path):
+        # Add games path to sys.path temporarily
+        games_path = os.path.dirname(full_path)
+        if games_path not in sys.path:
+            sys.path.insert(0, games_path)
+        
+        # Import the game module
+        if name in sys.modules:
+            del sys.modules[name]
+        
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(name, full_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        return module
+
+    def _game_module(self, name, full_path):
+        module = self._game_modules.get(full_path)
+        if module is None:
+            module = self._game_modules[full_path] = self._import_game_module(name, full_path)
+        return module
+
+    def _game_wrapper(self, entry_point):
+        def game_wrapper(*args):
+            entry_point()
+        game_wrapper.is_command = True
+        return game_wrapper
+
     def _load_game_module(self, name, full_path):
         """Load a game module from the games directory."""
         try:
-            # Add games path to sys.path temporarily
-            games_path = os.path.dirname(full_path)
-            if games_path not in sys.path:
-                sys.path.insert(0, games_path)
-            
-            # Import the game module
-            if name in sys.modules:
-                del sys.modules[name]
-            
-            spec = importlib.util.spec_from_file_location(name, full_path)
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[name] = module
-            spec.loader.exec_module(module)
+            spec = discover_plugin(full_path) if self.lazy_plugins else None
+            if spec is not None:
+                module = None
+                attrs = spec["attrs"]
+            else:
+                module = self._import_game_module(name, full_path)
+                attrs = {k: getattr(module, k) for k in _MODULE_ATTRS if hasattr(module, k)}
             
             # Try to load metadata from JSON first, then fallback to module attributes
             meta = self._get_metadata_from_json(name)
             
             # If JSON metadata is empty/default, try module attributes
             if meta.get("desc") == "No description":
-                 meta["author"] = getattr(module, "__author__", "Unknown")
-                 meta["category"] = getattr(module, "__category__", "games")
-                 meta["group"] = getattr(module, "__group__", "games")
-                 meta["desc"] = getattr(module, "__desc__", None)
+                 meta["author"] = attrs.get("__author__", "Unknown")
+                 meta["category"] = attrs.get("__category__", "games")
+                 meta["group"] = attrs.get("__group__", "games")
+                 meta["desc"] = attrs.get("__desc__", None)
             
             # Ensure group is set correctly if read from JSON
             if "group" not in meta:
-                meta["group"] = getattr(module, "__group__", "games")
+                meta["group"] = attrs.get("__group__", "games")
 
             base_meta = meta
+
+            if module is None:
+                # Static discovery: defer executing the game until it is launched
+                for c in spec["commands"]:
+                    target = ["game", name, full_path, c["attr"]]
+                    proxy = self._command_from_target(target, c["name"], c["aliases"])
+                    self._register_plugin_command(c["name"], proxy, c["aliases"], base_meta, c["doc"], f"Game: {name}", target, full_path)
+                entry = spec["entry_point"]
+                if not spec["commands"] and entry:
+                    target = ["game_entry", name, full_path, entry]
+                    proxy = self._command_from_target(target, name, base_meta.get("aliases", []))
+                    self._register_plugin_command(name, proxy, base_meta.get("aliases", []), base_meta, None, f"Game: {name}", target, full_path)
+                return
+
             found_command = False
 
+            import inspect
             for _, obj in inspect.getmembers(module):
                 if inspect.isfunction(obj) and hasattr(obj, "is_command"):
                     found_command = True
                     cmd_name = getattr(obj, "command_name", name)
-                    cmd_meta = base_meta.copy()
-                    
                     doc = (obj.__doc__ or "").strip().split('\n')[0]
-                    if doc:
-                        cmd_meta["desc"] = doc
-                    elif not cmd_meta["desc"]:
-                        cmd_meta["desc"] = f"Game: {name}"
-
-                    obj.meta = cmd_meta
-                    self.commands[cmd_name] = obj
-                    
-                    for alias in getattr(obj, "aliases", []):
-                        self.aliases[alias] = cmd_name
+                    self._register_plugin_command(cmd_name, obj, getattr(obj, "aliases", []), base_meta, doc, f"Game: {name}",
+                                                  ["game", name, full_path, _], full_path)
             
             # If no explicit command found, try to register main entry point
             if not found_command:
-                entry_point = getattr(module, "main", getattr(module, "menu", None))
+                entry = "main" if hasattr(module, "main") else "menu"
+                entry_point = getattr(module, entry, None)
                 if callable(entry_point):
-                    def game_wrapper(*args):
-                        entry_point()
-                    
-                    game_wrapper.is_command = True
+                    game_wrapper = self._game_wrapper(entry_point)
                     game_wrapper.command_name = name
-                    game_wrapper.meta = base_meta.copy()
-                    if not game_wrapper.meta.get("desc"):
-                        game_wrapper.meta["desc"] = f"Game: {name}"
-                    
-                    self.commands[name] = game_wrapper
-                    
-                    # Register aliases from metadata if any
-                    for alias in base_meta.get("aliases", []):
-                        self.aliases[alias] = name
-            
-            # Legacy fallback (can be removed if above covers all cases)
-            if not found_command and name not in self.commands and hasattr(module, 'main'):
-                 pass # Already handled above
+                    self._register_plugin_command(name, game_wrapper, base_meta.get("aliases", []), base_meta, None, f"Game: {name}",
+                                                  ["game_entry", name, full_path, entry], full_path)
                 
         except Exception as e:
             print(f"{Color.RED}[ERROR] Loading game {name}.py: {e}{Color.RESET}")
@@ -408,34 +2510,34 @@ class Dispatcher:
     def _register_external_binary(self, filename, name, ext, full_path):
         """Register external binary files (.bat, .cmd, .ps1, .exe, .vbs)."""
         meta = self._get_metadata_from_json(filename)
+        external_call = self._external_command(name, ext, full_path)
+        external_call.meta = meta
+        self.registry.add(name, external_call)
         
+        for alias in meta.get("aliases", []):
+            self.registry.add_alias(alias, name)
+
+        self._snapshot_entries.append({
+            "name": name, "aliases": list(meta.get("aliases", [])), "meta": meta,
+            "target": ["external", name, ext, full_path], "source": full_path
+        })
+
+    def _external_command(self, name, ext, full_path):
         def external_call(*args):
-            if ext == ".ps1":
-                cmd_args = ["powershell", "-NoProfile", "-ExecutionPolicy", "Bypass", "-File", full_path]
-                use_shell = False
-            elif ext == ".vbs":
-                cmd_args = ["cscript", "//nologo", full_path]
-                use_shell = False
-            elif ext in [".bat", ".cmd"]:
-                cmd_args = ["cmd", "/c", full_path]
-                use_shell = False
-            else:
-                cmd_args = [full_path]
-                use_shell = False
-            try:
-                subprocess.run(cmd_args + list(args), shell=use_shell, check=True)
-            except Exception as e:
-                print(f"{Color.RED}[ERROR] Execution: {e}{Color.RESET}")
+            meta = getattr(external_call, "meta", {})
+            result = self.executor.run(name, ext, full_path, args, timeout=meta.get("timeout"), capture=meta.get("capture"))
+            if result["code"]:
+                reason = f"timed out after {result['duration']:.1f}s" if result["timed_out"] else f"exit code {result['code']}"
+                print(f"{Color.RED}[ERROR] Execution: {name} {reason} (log: {result['log']}){Color.RESET}")
+            return result["code"]
 
         external_call.is_command = True
-        external_call.meta = meta
-        self.commands[name] = external_call
-        
-        for alias in meta.get("aliases", []):
-            self.aliases[alias] = name
+        external_call.external = (name, ext, full_path)
+        return external_call
 
     def _get_metadata_from_json(self, filename):
         """Extract metadata from JSON file."""
+        start = time.perf_counter()
         meta = {"desc": "No description", "aliases": [], "group": "utility", "category": "tool", "author": "Unknown"}
         base = f"{filename}.json"
         json_path = os.path.join(self.metadata_path, base)
@@ -448,269 +2550,578 @@ class Dispatcher:
                         meta.update(data)
             except Exception:
                 pass
+        if self.profiler is not None:
+            self.profiler.add_meta(time.perf_counter() - start)
         return meta
 
     def display_all_modules(self):
         """Display all modules, tools and aliases from all directories."""
-        if self.settings.get("ui", {}).get("clear_on_menu", True):
-            self._clear_screen()
-        
-        print(f"{Color.CYAN}{Color.BOLD}ALL AVAILABLE MODULES, COMMANDS & ALIASES{Color.RESET}\n")
-        print(f"{Color.BOLD}{'NAME/COMMAND':<25} | {'DESCRIPTION':<45} | {'ALIASES':<25}{Color.RESET}")
-        print(f"{Color.GRAY}{'-' * 100}{Color.RESET}")
-        
+        if current_format() != "table":
+            emit_rows(self._module_rows())
+            return
+        width = terminal_width()
+        with self._reload_lock:
+            body = self.registry.view(("render-all", width), lambda: self._render_all_modules(width))
+        emit(f"{Color.CYAN}{Color.BOLD}ALL AVAILABLE MODULES, COMMANDS & ALIASES{Color.RESET}\n\n" + body,
+             clear=self.settings.get("ui", {}).get("clear_on_menu", True))
+
+    def _module_sections(self):
+        """(title, colour, [(name, meta), ...]) for every section of the `modules` view."""
+        # The plugin watcher changes the registry and catalog under this lock
+        with self._reload_lock:
+            return self._collect_module_sections()
+
+    def _collect_module_sections(self):
+        by_meta = lambda x: (str(x[1].get('group', '')).lower(), str(x[1].get('category', '')).lower(), x[0].lower())
         # Python Modules (loaded commands)
-        py_modules = []
-        for name, func in self.commands.items():
-            if str(func.meta.get('group', '')).lower() != "menu":
-                aliases_str = ', '.join(func.meta.get('aliases', []))
-                py_modules.append((name, func, aliases_str))
-        
-        if py_modules:
-            print(f"{Color.CYAN}--- Python Modules ---{Color.RESET}")
-        sorted_py = sorted(py_modules, key=lambda x: (
-            str(x[1].meta.get('group', '')).lower(),
-            str(x[1].meta.get('category', '')).lower(),
+        py_modules = [(name, func.meta) for name, func in self.commands.items()
+                      if str(func.meta.get('group', '')).lower() != "menu"]
+        sections = [("Python Modules", Color.CYAN, sorted(py_modules, key=by_meta))]
+
+        if self.catalog is None:
+            self.catalog = self.scan_sources()
+        by_folder = {}
+        for item in self.catalog:
+            if item["kind"] in ("external", "game"):
+                by_folder.setdefault(item["folder"], []).append(item)
+
+        # Tool folders (health, tools, games, ascii, install)
+        for source in self.sources:
+            items = by_folder.get(source.get("folder"))
+            if not source.get("title") or not items:
+                continue
+            tools = []
+            for item in items:
+                func = self.commands.get(item["name"])
+                meta = func.meta if func is not None else self._get_metadata_from_json(item["filename"])
+                tools.append((item["name"], meta))
+            color = getattr(Color, str(source.get("color", "WHITE")).upper(), Color.WHITE)
+            sections.append((source["title"], color, sorted(tools, key=by_meta)))
+        return sections
+
+    def _module_rows(self):
+        for title, _, entries in self._module_sections():
+            for name, meta in entries:
+                yield {"section": title, "name": name, "group": meta.get("group"), "category": meta.get("category"),
+                       "description": meta.get("desc"), "aliases": list(meta.get("aliases", []))}
+
+    def _render_all_modules(self, width):
+        table = Table([("NAME/COMMAND", 25), ("DESCRIPTION", 45), ("ALIASES", 25)], flex=1)
+        for i, (title, color, entries) in enumerate(self._module_sections()):
+            if not entries:
+                continue
+            # Loaded Python commands come first; tool folders are set apart by a blank line
+            gap, name_color = ("\n", Color.WHITE) if i else ("", Color.CYAN)
+            table.add_line(f"{gap}{color}--- {title} ---{Color.RESET}")
+            for name, meta in entries:
+                table.add_row((name, name_color), str(meta.get('desc') or 'No description'),
+                              ', '.join(meta.get('aliases', [])))
+        return table.render(max_width=width, top_rule=False)
+
+    def _sorted_commands(self, filter_group=None):
+        if filter_group:
+            names = self.registry.group_members(filter_group)
+        else:
+            names = [n for g in self.registry.groups() if g != "menu" for n in self.registry.group_members(g)]
+        return sorted(((n, self.commands[n]) for n in names), key=lambda x: (
+            str(x[1].meta.get('group', '')).lower(), 
+            str(x[1].meta.get('category', '')).lower(), 
             x[0].lower()
         ))
-        for name, func, aliases_str in sorted_py:
-            desc = func.meta.get('desc', 'No description')[:45]
-            print(f"{Color.CYAN}{name:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-        
-        # Health Tools
-        health_dir = os.path.join(self.root_dir, "health")
-        if os.path.exists(health_dir):
-            health_tools = []
-            for f in os.listdir(health_dir):
-                if os.path.splitext(f)[1].lower() in [".bat", ".cmd", ".ps1", ".vbs", ".exe"]:
-                    name = os.path.splitext(f)[0]
-                    meta = self._get_metadata_from_json(f)
-                    health_tools.append((name, meta))
-            
-            if health_tools:
-                print(f"\n{Color.YELLOW}--- Health Tools ---{Color.RESET}")
-            sorted_health = sorted(health_tools, key=lambda x: (
-                str(x[1].get('group', '')).lower(),
-                str(x[1].get('category', '')).lower(),
-                x[0].lower()
-            ))
-            for name, meta in sorted_health:
-                aliases_str = ', '.join(meta.get('aliases', []))
-                desc = meta.get('desc', 'No description')[:45]
-                print(f"{Color.WHITE}{name:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-        
-        # System Tools
-        tools_dir = os.path.join(self.root_dir, "tools")
-        if os.path.exists(tools_dir):
-            system_tools = []
-            for f in os.listdir(tools_dir):
-                if os.path.splitext(f)[1].lower() in [".bat", ".cmd", ".ps1", ".vbs", ".exe"]:
-                    name = os.path.splitext(f)[0]
-                    meta = self._get_metadata_from_json(f)
-                    system_tools.append((name, meta))
-            
-            if system_tools:
-                print(f"\n{Color.MAGENTA}--- System Tools ---{Color.RESET}")
-            sorted_system = sorted(system_tools, key=lambda x: (
-                str(x[1].get('group', '')).lower(),
-                str(x[1].get('category', '')).lower(),
-                x[0].lower()
-            ))
-            for name, meta in sorted_system:
-                aliases_str = ', '.join(meta.get('aliases', []))
-                desc = meta.get('desc', 'No description')[:45]
-                print(f"{Color.WHITE}{name:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-        
-        # Games
-        games_dir = os.path.join(self.root_dir, "games")
-        if os.path.exists(games_dir):
-            games = []
-            for f in os.listdir(games_dir):
-                if f.endswith('.py') and not f.startswith('__'):
-                    name = os.path.splitext(f)[0]
-                    meta = self._get_metadata_from_json(name)
-                    games.append((name, meta))
-            
-            if games:
-                print(f"\n{Color.GREEN}--- Games ---{Color.RESET}")
-            sorted_games = sorted(games, key=lambda x: (
-                str(x[1].get('group', '')).lower(),
-                str(x[1].get('category', '')).lower(),
-                x[0].lower()
-            ))
-            for name, meta in sorted_games:
-                aliases_str = ', '.join(meta.get('aliases', []))
-                desc = meta.get('desc', 'No description')[:45]
-                print(f"{Color.WHITE}{name:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-        
-        # ASCII Tools
-        ascii_dir = os.path.join(self.root_dir, "ascii")
-        if os.path.exists(ascii_dir):
-            ascii_tools = []
-            for f in os.listdir(ascii_dir):
-                if os.path.splitext(f)[1].lower() in [".bat", ".cmd", ".ps1", ".vbs", ".exe"]:
-                    name = os.path.splitext(f)[0]
-                    meta = self._get_metadata_from_json(f)
-                    ascii_tools.append((name, meta))
-            
-            if ascii_tools:
-                print(f"\n{Color.BLUE}--- ASCII Tools ---{Color.RESET}")
-            sorted_ascii = sorted(ascii_tools, key=lambda x: (
-                str(x[1].get('group', '')).lower(),
-                str(x[1].get('category', '')).lower(),
-                x[0].lower()
-            ))
-            for name, meta in sorted_ascii:
-                aliases_str = ', '.join(meta.get('aliases', []))
-                desc = meta.get('desc', 'No description')[:45]
-                print(f"{Color.WHITE}{name:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-        
-        install_dir = os.path.join(self.root_dir, "install")
-        if os.path.exists(install_dir):
-            install_tools = []
-            for f in os.listdir(install_dir):
-                if os.path.splitext(f)[1].lower() in [".bat", ".cmd", ".ps1", ".vbs", ".exe"]:
-                    name = os.path.splitext(f)[0]
-                    meta = self._get_metadata_from_json(f)
-                    install_tools.append((name, meta))
-            
-            if install_tools:
-                print(f"\n{Color.CYAN}--- Installers ---{Color.RESET}")
-            sorted_install = sorted(install_tools, key=lambda x: (
-                str(x[1].get('group', '')).lower(),
-                str(x[1].get('category', '')).lower(),
-                x[0].lower()
-            ))
-            for name, meta in sorted_install:
-                aliases_str = ', '.join(meta.get('aliases', []))
-                desc = meta.get('desc', 'No description')[:45]
-                print(f"{Color.WHITE}{name:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-        
-        print(f"\n{Color.GRAY}{'-' * 100}{Color.RESET}")
 
     def display_list(self, filter_group=None):
-        if self.settings.get("ui", {}).get("clear_on_menu", True):
-            self._clear_screen()
-            
-        all_cmds = self.commands.items()
-        
         if filter_group:
             filter_group = filter_group.lower()
-            cmds_to_show = [(n, f) for n, f in all_cmds if str(f.meta.get('group', '')).lower() == filter_group]
             
             if filter_group == "menu":
                 title = "2026© Terminal psCLI MENU (Type 'all' to see all available modules or a group name.)"
             else:
                 title = f"GROUP VIEW: {filter_group.upper()}"
         else:
-            cmds_to_show = [(n, f) for n, f in all_cmds if str(f.meta.get('group', '')).lower() != "menu"]
             title = "ALL MODULES (HIDDEN: MENU)"
 
-        if not cmds_to_show:
+        with self._reload_lock:
+            sorted_cmds = self.registry.view(("list", filter_group), lambda: self._sorted_commands(filter_group))
+            rows = [{"name": name, "group": func.meta.get("group"), "category": func.meta.get("category"),
+                     "description": (func.meta.get("desc") or "").strip() or None,
+                     "aliases": list(self.registry.aliases_for(name))} for name, func in sorted_cmds]
+        if current_format() != "table":
+            emit_rows(rows)
+            return
+        if not sorted_cmds:
             print(f"{Color.RED}[!] No modules in group: {filter_group if filter_group else 'general'}.{Color.RESET}")
             return
 
-        w = {"group": 10, "cmd": 15, "desc": 45, "cat": 12}
-        sorted_cmds = sorted(cmds_to_show, key=lambda x: (
-            str(x[1].meta.get('group', '')).lower(), 
-            str(x[1].meta.get('category', '')).lower(), 
-            x[0].lower()
-        ))
-
-        print(f"{Color.CYAN}{Color.BOLD}{title}{Color.RESET}")
+        out = [f"{Color.CYAN}{Color.BOLD}{title}{Color.RESET}"]
+        ni = self.net_status.snapshot()
+        if ni is None:
+            net_line = "Network: checking..."
+        else:
+            net_line = f"Network: {'Online' if ni.get('online') else 'Offline'}"
+            if ni.get("local_ip"): net_line += f" | Local IP: {ni['local_ip']}"
+            if ni.get("public_ip"): net_line += f" | Public IP: {ni['public_ip']}"
+            if ni.get("mac"): net_line += f" | MAC: {ni['mac']}"
+            if ni.get("stale"): net_line += " (updating)"
+        out.append(f"{Color.GRAY}{net_line}{Color.RESET}")
         try:
-            owner_mod = importlib.import_module("plugins.owner")
-            ni = owner_mod.get_network_info()
-            online = bool(ni.get("online"))
-            local_ip = ni.get("local_ip")
-            public_ip = ni.get("public_ip")
-            mac = owner_mod.get_preferred_mac() or ni.get("mac")
-        except Exception:
-            online = self._is_online()
-            local_ip = self._local_ip()
-            public_ip = self._public_ip() if online else None
-            mac = None
-        net_line = f"Network: {'Online' if online else 'Offline'}"
-        if local_ip: net_line += f" | Local IP: {local_ip}"
-        if public_ip: net_line += f" | Public IP: {public_ip}"
-        if mac: net_line += f" | MAC: {mac}"
-        print(f"{Color.GRAY}{net_line}{Color.RESET}")
-        try:
-            oi = owner_mod.get_os_info()
+            oi = self.net_status.os_info
             os_line = f"OS: {oi.get('system')} {oi.get('release')}"
             if oi.get('build'): os_line += f" | Build: {oi.get('build')}"
             os_line += f" | Arch: {oi.get('machine')}"
             os_line += f" | Python: {oi.get('python_version')}"
         except Exception:
+            import platform
             os_line = f"OS: {platform.system()} {platform.release()} | Python: {sys.version.split()[0]}"
         os_line = os_line + " | " + Color.WHITE + Color.BOLD + "[f5] refresh" + Color.RESET
-        print(f"{Color.GRAY}{os_line}{Color.RESET}")
-        
-        header = f"{'GROUP':<{w['group']}} | {'COMMAND':<{w['cmd']}} | {'DESCRIPTION':<{w['desc']}} | {'CATEGORY':<{w['cat']}} | ALIASES"
-        sep_width = len(header) + 12
-        full_line = f"{Color.GRAY}{'-' * sep_width}{Color.RESET}"
-        
-        print(full_line + "\n" + Color.BOLD + header + Color.RESET + "\n" + full_line)
+        out.append(f"{Color.GRAY}{os_line}{Color.RESET}")
+
+        # The status lines change between redraws; the table only when the registry does
+        width = terminal_width()
+        with self._reload_lock:
+            out.append(self.registry.view(("render-list", filter_group, width),
+                                          lambda: self._render_list(sorted_cmds, filter_group, width)))
+        emit("\n".join(out) + "\n", clear=self.settings.get("ui", {}).get("clear_on_menu", True))
 
+    def _render_list(self, sorted_cmds, filter_group, width):
+        table = Table([("GROUP", 10), ("COMMAND", 15), ("DESCRIPTION", 45), ("CATEGORY", 12), ("ALIASES", None)],
+                      sep=f" {Color.GRAY}|{Color.RESET} ", flex=2)
         last_group = None
         for name, func in sorted_cmds:
             m = func.meta
             curr_group = str(m.get('group', 'python')).lower()
             if last_group is not None and last_group != curr_group and not filter_group:
-                print(f"{Color.GRAY}{'-' * sep_width}{Color.RESET}")
+                table.add_rule()
             last_group = curr_group
 
-            desc = (m.get("desc") or "None").strip()[:w['desc']]
-            aliases = ", ".join([a for a, t in self.aliases.items() if t == name]) or "-"
-            
-            print(f"{Color.BLUE}{str(m.get('group')):<{w['group']}}{Color.RESET} {Color.GRAY}|{Color.RESET} "
-                  f"{Color.GREEN}{Color.BOLD}{name:<{w['cmd']}}{Color.RESET} {Color.GRAY}|{Color.RESET} "
-                  f"{desc:<{w['desc']}} {Color.GRAY}|{Color.RESET} "
-                  f"{Color.CYAN}{str(m.get('category')):<{w['cat']}}{Color.RESET} {Color.GRAY}|{Color.RESET} "
-                  f"{Color.YELLOW}{aliases}{Color.RESET}")
-        print(full_line + "\n")
+            table.add_row((str(m.get('group')), Color.BLUE),
+                          (name, Color.GREEN + Color.BOLD),
+                          (m.get("desc") or "None").strip(),
+                          (str(m.get('category')), Color.CYAN),
+                          (", ".join(self.registry.aliases_for(name)) or "-", Color.YELLOW))
+        return table.render(max_width=width)
+
+    def reload(self, full=False):
+        """Re-read settings, reload changed plugins and redraw the menu (refresh / f5).
+
+        With full=True every source is rescanned and re-imported from scratch.
+        """
+        self.settings = self._load_settings()
+        self.net_status.configure(self.settings)
+        self.net_status.invalidate()
+        self.metrics.configure(self.settings)
+        self.executor.configure(self.settings)
+        if full:
+            self.load_plugins()
+        else:
+            self.reload_changed()
+        groups = self.get_all_groups()
+        self.display_list("menu" if "menu" in groups else None)
+
+    def split_flags(self, words):
+        """split_output_flags(), except for commands registered with output_flags=False."""
+        fmt, rest = split_output_flags(words)
+        if fmt is not None and rest:
+            with self._reload_lock:
+                target = self.registry.resolve(rest[0].lower())
+                func = self.commands.get(target) if target is not None else None
+            if func is not None and func.meta.get("output_flags") is False:
+                return None, list(words)
+        return fmt, rest
 
     def execute(self, trigger, *args):
+        """Run a command; returns an exit code (0 ok, 1 failed, 126 denied, 127 unknown)."""
+        fmt, words = self.split_flags((trigger,) + args)
+        if fmt is not None:
+            with output_format(fmt):
+                return self.execute(*(words or ["all"]))
         if trigger.lower() == "all":
             self.display_list()
-            return
+            return 0
         if trigger.lower() in self.get_all_groups():
             self.display_list(trigger.lower())
-            return
+            return 0
         if trigger.lower() in ["refresh", "f5", "reload", "r"]:
-            self.settings = self._load_settings()
-            self.load_plugins()
-            groups = self.get_all_groups()
-            self.display_list("menu" if "menu" in groups else None)
-            return
-        target = self.aliases.get(trigger, trigger)
-        if target in self.commands:
+            self.reload(full="--full" in args)
+            return 0
+        if trigger.lower() == "watch":
+            self.watch(*args)
+            return 0
+        if trigger.lower() == "stats":
+            self.show_stats(*args)
+            return 0
+        if trigger.lower() == "cache":
+            return self.cache_command(*args)
+        if trigger.lower() == "run-many":
+            return self.run_many(*args)
+        if trigger.lower() == "jobs":
+            return self.jobs.list()
+        if trigger.lower() in ("fg", "wait", "kill"):
+            return getattr(self.jobs, trigger.lower())(*args[:1])
+        # Look the command up under the watcher's lock; it runs outside of it
+        with self._reload_lock:
+            target = self.registry.resolve(trigger)
+            func = self.commands.get(target) if target is not None else None
+        if func is not None:
             try:
-                func = self.commands[target]
                 grp = str(func.meta.get("group", "")).lower()
                 protected = self._get_protected_commands()
+                if target.lower() in protected or grp == "mainte.":
+                    hint = getattr(_job_local, "no_prompt", None)
+                    if hint:
+                        print(f"{Color.YELLOW}[!] '{target}' asks for a password; {hint}{Color.RESET}")
+                        return 126
+                    import getpass
                 if target.lower() in protected:
                     try:
                         pm = importlib.import_module("plugins.passwd")
                         if not getattr(pm, "verify_once")():
                             print(f"{Color.RED}[!] Incorrect password{Color.RESET}")
-                            return
+                            return 126
                     except Exception:
                         entered = getpass.getpass(f"{Color.YELLOW}Password:{Color.RESET} ").strip()
                         if not entered:
                             print(f"{Color.RED}[!] Incorrect password{Color.RESET}")
-                            return
+                            return 126
                 if grp == "mainte.":
                     expected = os.environ.get("PSCLI_MAINTE_PASS") or self.settings.get("security", {}).get("mainte_password") or "polsoft"
                     entered = getpass.getpass(f"{Color.YELLOW}Password:{Color.RESET} ").strip()
                     if entered != expected:
                         print(f"{Color.RED}[!] Incorrect password{Color.RESET}")
-                        return
-                func(*args)
+                        return 126
+                with self.metrics.measure(target, grp) as status:
+                    result = func(*args)
+                    if hasattr(result, "__await__"):
+                        # async def commands (also behind lazy proxies) run on the shared loop
+                        result = self.loop.run(result, timeout=self.settings.get("dispatcher", {}).get("async_timeout"))
+                    # Commands may report failure through a non-zero exit code
+                    if isinstance(result, int) and not isinstance(result, bool) and result != 0:
+                        status["ok"] = False
+                return 0 if status["ok"] else 1
             except Exception as e:
                 print(f"{Color.RED}[RUNTIME ERROR] '{trigger}': {e}{Color.RESET}")
+                return 1
         else:
             print(f"{Color.RED}[?] Unknown command or group: '{trigger}'{Color.RESET}")
+            with self._reload_lock:
+                suggestions = self.registry.index.suggest(trigger)
+            if suggestions:
+                print(f"{Color.YELLOW}    Did you mean: {', '.join(suggestions)}?{Color.RESET}")
+            return 127
+
+    def run_line(self, line):
+        """Run one shell line, including `&`-chained commands.
+
+        Returns the exit code of the last failing command (0 if all succeeded),
+        or None when the line asks to leave the shell.
+        """
+        line = line.strip()
+        if line.endswith("&!"):
+            line = line[:-2].strip()
+            if line:
+                job = self.jobs.start(line)
+                print(f"{Color.GRAY}[{job.id}] started: {job.line}{Color.RESET}")
+            return 0
+
+        # Support command chaining with '&'
+        # Handle quoted strings to avoid splitting '&' inside quotes could be complex, 
+        # but for simple usage split('&') is a good start.
+        status = 0
+        for cmd_str in line.split('&'):
+            cmd_str = cmd_str.strip()
+            if cmd_str.startswith("(") and cmd_str.endswith(")"):
+                status = self.run_parallel([c for c in cmd_str[1:-1].split("|") if c.strip()]) or status
+                continue
+            fmt, user_input = self.split_flags(cmd_str.split())
+            if not user_input:
+                if fmt is None:
+                    continue
+                user_input = ["all"]
+
+            cmd = user_input[0]
+            # Treat '#' as alias for 'menu' - check before .lower()
+            if cmd == "#":
+                cmd = "menuallweb"
+            else:
+                cmd = cmd.lower()
+            args = user_input[1:]
+
+            if cmd in ["exit", "quit"]:
+                return None
+            with output_format(fmt):
+                if cmd in ["modules", "mod"]:
+                    self.display_all_modules()
+                    code = 0
+                elif cmd == "menu":
+                    self.display_list("menu")
+                    code = 0
+                else:
+                    code = self.execute(cmd, *args)
+            status = code or status
+        return status
+
+    def run_parallel(self, commands):
+        """Run a `( a | b | c )` group concurrently on a bounded pool.
+
+        Each command's output is captured and printed in order once all of them
+        have finished. Returns the last non-zero exit code, or 0.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        if not commands:
+            return 0
+        parent_job = getattr(_job_local, "job", None)
+
+        def run_one(cmd):
+            _job_local.job = parent_job
+            # A prompt would be captured with the output, and members would prompt at once
+            with capture_output(_OutputBuffer()) as buf, no_password_prompts("run it on its own, outside ( | )"):
+                t0 = time.perf_counter()
+                code = self.run_line(cmd) or 0
+            return code, buf.getvalue(), time.perf_counter() - t0
+
+        max_workers = max(1, int(self.settings.get("jobs", {}).get("max_workers", 4)))
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(commands))) as pool:
+            results = list(pool.map(run_one, commands))
+
+        status = 0
+        for cmd, (code, output, elapsed) in zip(commands, results):
+            color = Color.GREEN if code == 0 else Color.RED
+            print(f"{Color.GRAY}--- {cmd.strip()} {color}(exit {code}){Color.GRAY} {elapsed:.2f}s ---{Color.RESET}")
+            sys.stdout.write(output)
+            status = code or status
+        return status
+
+    def run_many(self, *args):
+        """run-many [-j N] [--timeout S] <tool|folder>... - run external tools concurrently."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        usage = f"{Color.YELLOW}Usage: run-many [-j N] [--timeout S] <tool|folder>...{Color.RESET}"
+        workers, timeout, names = self.executor.max_concurrent, None, []
+        it = iter(args)
+        try:
+            for arg in it:
+                if arg == "-j":
+                    workers = max(1, int(next(it)))
+                elif arg == "--timeout":
+                    timeout = float(next(it))
+                else:
+                    names.append(arg)
+        except (StopIteration, ValueError):
+            print(usage)
+            return 2
+        if not names:
+            print(usage)
+            return 2
+
+        with self._reload_lock:
+            if self.catalog is None:
+                self.catalog = self.scan_sources()
+            folders = {str(src.get("folder", "")).lower() for src in self.sources}
+            tools = {}
+            for arg in names:
+                if arg.lower() in folders:
+                    for item in self.catalog:
+                        if item["kind"] == "external" and str(item["folder"]).lower() == arg.lower():
+                            func = self.commands.get(item["name"])
+                            tools[item["path"]] = (item["name"], item["ext"], item["path"], getattr(func, "meta", {}))
+                    continue
+                target = self.registry.resolve(arg)
+                func = self.commands.get(target) if target else None
+                if func is None or not hasattr(func, "external"):
+                    print(f"{Color.RED}[?] Not an external tool or folder: '{arg}'{Color.RESET}")
+                    return 127
+                name, ext, path = func.external
+                tools[path] = (name, ext, path, func.meta)
+        # Password-protected tools are left to the interactive checks in execute()
+        protected = self._get_protected_commands()
+        for path, (name, ext, _, meta) in list(tools.items()):
+            if name.lower() in protected or str(meta.get("group", "")).lower() == "mainte.":
+                print(f"{Color.YELLOW}[!] Skipping '{name}': it asks for a password, run it on its own{Color.RESET}")
+                del tools[path]
+        if not tools:
+            print(f"{Color.GRAY}No external tools matched.{Color.RESET}")
+            return 0
+
+        emit(f"{Color.CYAN}Running {len(tools)} tool(s), {min(workers, len(tools))} at a time...{Color.RESET}\n")
+        results = []
+        with ThreadPoolExecutor(max_workers=min(workers, len(tools))) as pool:
+            futures = [pool.submit(self.executor.run, name, ext, path, (), timeout or meta.get("timeout"), True, False)
+                       for name, ext, path, meta in tools.values()]
+            for fut in as_completed(futures):
+                r = fut.result()
+                results.append(r)
+                meta = tools[r["path"]][3]
+                self.metrics.record(r["name"], str(meta.get("group", "")).lower(), r["duration"], 0.0, r["code"] == 0)
+                color = Color.GREEN if r["code"] == 0 else Color.RED
+                emit(f"  {color}{'done' if r['code'] == 0 else 'FAIL'}{Color.RESET} {r['name']} ({r['duration']:.1f}s)\n")
+
+        table = Table([("TOOL", 22), ("EXIT", 4), ("TIME s", 7), ("LOG", None)], flex=0)
+        for r in sorted(results, key=lambda r: r["name"].lower()):
+            exit_str = "T/O" if r["timed_out"] else str(r["code"])
+            table.add_row(r["name"], (f"{exit_str:>4}", Color.GREEN if r["code"] == 0 else Color.RED),
+                          f"{r['duration']:>7.2f}", (r["log"], Color.GRAY))
+        failed = [r for r in results if r["code"]]
+        emit("\n" + table.render(max_width=terminal_width(), top_rule=False)
+             + f"\n{len(results) - len(failed)} ok, {len(failed)} failed\n")
+        return failed[-1]["code"] if failed else 0
+
+    def run_script(self, lines, fail_fast=False, source="<stdin>"):
+        """Run script lines one by one (`cli.py -f`), reporting each line's exit status.
+
+        Status lines and the timing summary go to stderr so stdout carries only
+        command output. Returns the last non-zero exit code, or 0.
+        """
+        results = []
+        started = time.perf_counter()
+        for lineno, raw in enumerate(lines, 1):
+            line = strip_script_comment(raw)
+            if not line:
+                continue
+            t0 = time.perf_counter()
+            code = self.run_line(line)
+            elapsed = time.perf_counter() - t0
+            if code is None:
+                break
+            results.append((lineno, line, code, elapsed))
+            color = Color.GREEN if code == 0 else Color.RED
+            emit(f"{Color.GRAY}[{source}:{lineno}]{Color.RESET} {color}exit {code}{Color.RESET} "
+                 f"{Color.GRAY}({elapsed * 1000:.1f} ms) {line}{Color.RESET}\n", stream=sys.stderr)
+            if code and fail_fast:
+                emit(f"{Color.RED}[!] Stopped at line {lineno} (--fail-fast){Color.RESET}\n", stream=sys.stderr)
+                break
+
+        failed = [r for r in results if r[2]]
+        total = time.perf_counter() - started
+        out = [f"\n{Color.BOLD}{len(results)} line(s){Color.RESET}: {Color.GREEN}{len(results) - len(failed)} ok{Color.RESET}, "
+               f"{Color.RED if failed else Color.GRAY}{len(failed)} failed{Color.RESET} in {total:.2f} s"]
+        if len(results) > 1:
+            out.append(f"{Color.GRAY}Slowest lines:{Color.RESET}")
+            for lineno, line, code, elapsed in sorted(results, key=lambda r: -r[3])[:5]:
+                out.append(f"  {Color.GRAY}{elapsed * 1000:>9.1f} ms  line {lineno:<5}{Color.RESET} {line}")
+        emit("\n".join(out) + "\n", stream=sys.stderr)
+        return failed[-1][2] if failed else 0
+
+    def show_stats(self, *args):
+        """stats [group|command | reset] - latency percentiles per command and group."""
+        if args and args[0].lower() == "reset":
+            self.metrics.reset()
+            print(f"{Color.GREEN}[OK] Command metrics cleared{Color.RESET}")
+            return
+        flt = args[0].lower() if args else None
+        data = self.metrics.load()
+        if flt:
+            data = {n: s for n, s in data.items() if n.lower() == flt or str(s["group"]).lower() == flt}
+        structured = current_format() != "table"
+        if not data and not structured:
+            print(f"{Color.GRAY}No command metrics recorded yet.{Color.RESET}")
+            return
+
+        groups = {}
+        for s in data.values():
+            g = groups.setdefault(s["group"] or "-", {"count": 0, "failures": 0, "samples": []})
+            g["count"] += s["count"]
+            g["failures"] += s["failures"]
+            g["samples"].extend(s["samples"])
+
+        if structured:
+            def row(kind, name, group, s):
+                m = CommandMetrics.summarize(s["count"], s["failures"], s["samples"])
+                return {"kind": kind, "name": name, "group": group, "calls": m["calls"], "failures": m["failures"],
+                        "p50_ms": round(m["p50"] * 1000, 3), "p95_ms": round(m["p95"] * 1000, 3),
+                        "max_ms": round(m["max"] * 1000, 3), "cpu_ms": round(m["cpu"] * 1000, 3),
+                        "total_s": round(m["total"], 6)}
+            emit_rows([row("command", n, s["group"], s) for n, s in sorted(data.items())]
+                      + [row("group", n, n, g) for n, g in sorted(groups.items())])
+            return
+
+        columns = [("CALLS", 6), ("FAIL", 4), ("P50 ms", 8), ("P95 ms", 8), ("MAX ms", 8), ("CPU ms", 7), ("TOTAL s", None)]
+        def cells(s):
+            m = CommandMetrics.summarize(s["count"], s["failures"], s["samples"])
+            return (f"{m['calls']:>6}", (f"{m['failures']:>4}", Color.RED if m["failures"] else ""),
+                    f"{m['p50'] * 1000:>8.1f}", f"{m['p95'] * 1000:>8.1f}", f"{m['max'] * 1000:>8.1f}",
+                    f"{m['cpu'] * 1000:>7.1f}", f"{m['total']:>8.2f}")
+        by_total = lambda item: -CommandMetrics.summarize(item[1]["count"], item[1]["failures"], item[1]["samples"])["total"]
+
+        commands = Table([("COMMAND", 20), ("GROUP", 10)] + columns, flex=0)
+        for name, s in sorted(data.items(), key=by_total):
+            commands.add_row((name, Color.GREEN), (str(s["group"]), Color.CYAN), *cells(s))
+        group_table = Table([("GROUP", 33)] + columns, flex=0)
+        for name, g in sorted(groups.items(), key=by_total):
+            group_table.add_row((name, Color.CYAN), *cells(g))
+
+        width = terminal_width()
+        emit(f"{Color.CYAN}{Color.BOLD}COMMAND METRICS{Color.RESET} {Color.GRAY}(percentiles over the last {self.metrics.ring_size} calls){Color.RESET}\n\n"
+             + commands.render(max_width=width, top_rule=False) + "\n"
+             + group_table.render(max_width=width, top_rule=False) + "\n")
+
+    def cache_command(self, *args):
+        """cache [stats] | cache clear [name] - inspect or drop memoized plugin data."""
+        mode = args[0].lower() if args else "stats"
+        if mode == "clear":
+            pattern = args[1] if len(args) > 1 else None
+            n = cache_clear(pattern)
+            print(f"{Color.GREEN}[OK] Cleared {n} cache(s){' matching ' + repr(pattern) if pattern else ''}{Color.RESET}")
+            return 0
+        if mode != "stats":
+            print(f"{Color.YELLOW}[?] Usage: cache [stats] | cache clear [name]{Color.RESET}")
+            return 1
+        stats = cache_stats()
+        if not stats:
+            print(f"{Color.GRAY}No plugin caches in use yet.{Color.RESET}")
+            return 0
+        table = Table([("CACHE", None), ("SIZE", 9), ("HITS", 7), ("MISSES", 7), ("HIT %", 6),
+                       ("EVICT", 6), ("TTL s", 7), ("DISK", None)], flex=0)
+        for st in sorted(stats, key=lambda x: x["name"]):
+            calls = st["hits"] + st["misses"]
+            ratio = f"{100.0 * st['hits'] / calls:5.1f}" if calls else "    -"
+            ttl = "-" if st["ttl"] is None else f"{st['ttl']:g}"
+            table.add_row((st["name"], Color.GREEN), f"{st['size']:>4}/{st['maxsize']:<4}", f"{st['hits']:>7}",
+                          f"{st['misses']:>7}", f"{ratio:>6}", f"{st['evictions']:>6}", f"{ttl:>7}",
+                          ("yes", Color.CYAN) if st["persist"] else "no")
+        emit(f"{Color.CYAN}{Color.BOLD}PLUGIN DATA CACHES{Color.RESET}\n" + table.render(max_width=terminal_width(), top_rule=False))
+        return 0
+
+    def watch(self, *args):
+        """watch [on [seconds] | off] - reload changed plugins automatically."""
+        mode = args[0].lower() if args else ""
+        if mode == "on":
+            try:
+                interval = float(args[1]) if len(args) > 1 else 1.0
+            except ValueError:
+                print(f"{Color.RED}[!] Invalid interval: {args[1]}{Color.RESET}")
+                return
+            self.watcher.start(max(interval, 0.1))
+        elif mode == "off":
+            self.watcher.stop()
+        elif mode:
+            print(f"{Color.YELLOW}Usage: watch [on [seconds] | off]{Color.RESET}")
+            return
+        if self.watcher.running:
+            print(f"{Color.GREEN}[WATCH] Watching plugin folders every {self.watcher.interval:g}s{Color.RESET}")
+        else:
+            print(f"{Color.GRAY}[WATCH] Off{Color.RESET}")
+
+    def enable_completion(self):
+        """Tab-complete command names in the interactive shell when readline is available."""
+        try:
+            import readline
+        except ImportError:
+            return False
+        index = self.registry.index
+        matches = []
+
+        def complete(text, state):
+            if state == 0:
+                head = readline.get_line_buffer()[:readline.get_begidx()].rstrip()
+                # Only complete the command position: line start or after '&', '(' or '|'
+                matches[:] = index.complete(text) if not head or head[-1] in "&(|" else []
+            return matches[state] if state < len(matches) else None
+
+        readline.set_completer_delims(" \t&|()")
+        readline.set_completer(complete)
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        return True
 
     def _check_f1_key(self):
         """Check for F1 key press in non-blocking way."""
@@ -741,12 +3152,314 @@ class Dispatcher:
             pass
         return False
 
+# --- SCRIPT RUNNER ---
+def strip_script_comment(line):
+    """Remove a `# comment` from a script line; lines starting with '#' are comments."""
+    line = line.strip()
+    if line.startswith("#"):
+        return ""
+    m = re.search(r"\s#", line)
+    return line[:m.start()].rstrip() if m else line
+
+# --- DAEMON ---
+def _has_fileno(stream):
+    try:
+        stream.fileno()
+        return True
+    except (AttributeError, OSError, ValueError):
+        return False
+
+class _ConnWriter(io.TextIOBase):
+    """Text stream forwarding writes to a daemon client as ("out"|"err", text) messages."""
+    def __init__(self, conn, kind, tty=False):
+        self.conn = conn
+        self.kind = kind
+        self.tty = tty
+        self.closed_by_peer = False
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        # Mirrors the client's console so tables keep their colours
+        return self.tty
+
+    def write(self, s):
+        if s and not self.closed_by_peer:
+            try:
+                self.conn.send((self.kind, s))
+            except (OSError, EOFError):
+                # Client went away; keep running the command without output
+                self.closed_by_peer = True
+        return len(s)
+
+class DaemonServer:
+    """Keeps a loaded Dispatcher warm and serves `client.py` invocations one at a time.
+
+    Requests run sequentially because each one switches the process cwd,
+    environment and standard streams to those of its client.
+    """
+    def __init__(self, dispatcher):
+        import client
+        self.dispatcher = dispatcher
+        settings_dir = os.path.dirname(dispatcher.settings_path)
+        self.address = client.daemon_address(settings_dir)
+        self.key_path = client.daemon_key_path(settings_dir)
+        self._client = client
+
+    def _write_key(self):
+        key = os.urandom(32)
+        fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key)
+        return key
+
+    def serve(self):
+        from multiprocessing.connection import Listener
+        from multiprocessing import AuthenticationError
+
+        conn = self._client.connect(os.path.dirname(self.dispatcher.settings_path))
+        if conn is not None:
+            conn.close()
+            print(f"{Color.YELLOW}[DAEMON] Already running on {self.address}{Color.RESET}")
+            return 1
+        if sys.platform != "win32" and os.path.exists(self.address):
+            os.remove(self.address)  # stale socket left by a killed daemon
+
+        with Listener(self.address, authkey=self._write_key()) as listener:
+            print(f"{Color.GREEN}[DAEMON] Listening on {self.address} (stop with: client.py --stop){Color.RESET}")
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                with conn:
+                    if self._handle(conn) == "stop":
+                        break
+        try:
+            os.remove(self.key_path)
+        except OSError:
+            pass
+        print(f"{Color.GRAY}[DAEMON] Stopped{Color.RESET}")
+        return 0
+
+    def _handle(self, conn):
+        try:
+            msg = conn.recv()
+        except (OSError, EOFError):
+            return None
+        kind = msg[0] if isinstance(msg, tuple) and msg else None
+        if kind == "run":
+            code = self._run(conn, *msg[1:])
+        elif kind == "ping":
+            code = 0
+        elif kind == "stop":
+            code = 0
+        else:
+            code = 2
+        try:
+            conn.send(("exit", code))
+        except (OSError, EOFError):
+            pass
+        return kind
+
+    def _run(self, conn, argv, cwd, env):
+        d = self.dispatcher
+        # Pick up settings and plugin edits made since the previous request
+        d.settings = d._load_settings()
+        d.metrics.configure(d.settings)
+        d.executor.configure(d.settings)
+        d.reload_changed()
+
+        saved = (os.getcwd(), dict(os.environ), sys.stdout, sys.stderr, sys.stdin)
+        try:
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(env)
+            tty = env.get("PSCLI_TTY", "")
+            sys.stdout, sys.stderr = _ConnWriter(conn, "out", "o" in tty), _ConnWriter(conn, "err", "e" in tty)
+            # Prompts get EOF instead of blocking on the daemon's console
+            sys.stdin = io.StringIO()
+            if not argv:
+                d.display_list()
+                return 0
+            # Enforced in execute(), so flags such as --json before the command cannot skip it
+            with no_password_prompts("run it with cli.py directly"):
+                return d.execute(*argv)
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            print(f"{Color.RED}[DAEMON ERROR] {e}{Color.RESET}")
+            return 1
+        finally:
+            sys.stdout, sys.stderr, sys.stdin = saved[2:]
+            os.environ.clear()
+            os.environ.update(saved[1])
+            os.chdir(saved[0])
+
+def profile_startup(argv):
+    """Run a cold startup with timings and print the report (`--profile-startup [--profile-json PATH]`)."""
+    json_path = None
+    for i, arg in enumerate(argv):
+        if arg.startswith("--profile-json="):
+            json_path = arg.split("=", 1)[1]
+        elif arg == "--profile-json" and i + 1 < len(argv):
+            json_path = argv[i + 1]
+
+    profiler = StartupProfiler()
+    with profiler.phase("dispatcher_init"):
+        cli = Dispatcher(profiler=profiler)
+    with profiler.phase("load_plugins"):
+        cli.load_plugins()
+    if cli.lazy_plugins:
+        with profiler.phase("plugin_imports"):
+            profiler.time_imports(cli)
+    profiler.report()
+
+    if json_path:
+        try:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(profiler.to_dict(), f, indent=2)
+            print(f"{Color.GREEN}[OK] Profile written to {json_path}{Color.RESET}")
+        except OSError as e:
+            print(f"{Color.RED}[ERROR] Could not write profile: {e}{Color.RESET}")
+            return 1
+    return 0
+
+# --- IMPORT BUDGET ---
+# Modules that must stay off the warm-start path; commands import them when they run
+DEFERRED_MODULES = ("ast", "inspect", "subprocess", "platform", "getpass", "locale", "socket", "ssl", "asyncio",
+                    "urllib.request", "http.client", "http.cookiejar", "webbrowser", "sqlite3", "csv", "uuid")
+IMPORT_BUDGET_MS = 50.0
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+def parse_importtime(text):
+    """Parse `python -X importtime` output into (module, self_us, cumulative_us, depth) rows."""
+    rows = []
+    for line in text.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m:
+            rows.append((m.group(4), int(m.group(1)), int(m.group(2)), (len(m.group(3)) - 1) // 2))
+    return rows
+
+def _import_chain(rows, i):
+    """Module names from rows[i] up to the top-level import that pulled it in."""
+    chain = [rows[i][0]]
+    depth = rows[i][3]
+    # -X importtime prints a module after everything it imported
+    for name, _, _, d in rows[i + 1:]:
+        if d < depth:
+            chain.append(name)
+            depth = d
+    return chain
+
+def check_import_budget(argv):
+    """Fail when a warm start imports a deferred module or exceeds the time budget.
+
+    `--check-import-budget [--budget-ms N] [--runs N]`: starts `import cli` plus a
+    snapshot load in fresh interpreters under `-X importtime` and keeps the fastest run.
+    """
+    import subprocess
+    budget_ms, runs = IMPORT_BUDGET_MS, 3
+    for i, arg in enumerate(argv[:-1]):
+        try:
+            if arg == "--budget-ms":
+                budget_ms = float(argv[i + 1])
+            elif arg == "--runs":
+                runs = max(1, int(argv[i + 1]))
+        except ValueError:
+            print(f"{Color.RED}[!] Invalid value for {arg}: {argv[i + 1]}{Color.RESET}")
+            return 2
+
+    root = os.path.dirname(os.path.abspath(__file__))
+    code = ("import sys; sys.path.insert(0, %r); import cli; "
+            "cli.Dispatcher().load_plugins(use_snapshot=True)" % root)
+    # Python's own startup modules are not ours to budget
+    baseline = {r[0] for r in parse_importtime(subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True).stderr)}
+    # The first run writes bytecode and the registry snapshot, as any earlier launch would
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    best = None
+    for _ in range(runs + 1):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                              capture_output=True, text=True, env=env)
+        if proc.returncode != 0:
+            print(f"{Color.RED}[ERROR] Startup failed:{Color.RESET}\n{proc.stderr[-2000:]}")
+            return 1
+        rows = [r for r in parse_importtime(proc.stderr) if r[0] not in baseline]
+        total = sum(r[1] for r in rows) / 1000.0
+        if best is None or total < best[0]:
+            best = (total, rows)
+    total, rows = best
+
+    print(f"{Color.CYAN}{Color.BOLD}STARTUP IMPORTS{Color.RESET} {Color.GRAY}(fastest of {runs} warm runs, "
+          f"{len(rows)} modules beyond the interpreter's own){Color.RESET}\n")
+    table = Table([("MODULE", 40), ("SELF ms", 8), ("CUMUL ms", None)])
+    for name, self_us, cum_us, _ in sorted(rows, key=lambda r: -r[1])[:15]:
+        table.add_row((name, Color.GREEN), f"{self_us / 1000:>8.2f}", f"{cum_us / 1000:>8.2f}")
+    emit(table.render(top_rule=False))
+
+    ok = True
+    names = [r[0] for r in rows]
+    for mod in DEFERRED_MODULES:
+        if mod in names:
+            ok = False
+            chain = " <- ".join(_import_chain(rows, names.index(mod)))
+            print(f"{Color.RED}[FAIL] {mod} is imported at startup: {chain}{Color.RESET}")
+    colour = Color.GREEN if total <= budget_ms else Color.RED
+    print(f"{colour}Total import time: {total:.1f} ms (budget {budget_ms:g} ms){Color.RESET}")
+    if total > budget_ms:
+        ok = False
+    print(f"{Color.GREEN}[OK] Import budget met{Color.RESET}" if ok else f"{Color.RED}[FAIL] Import budget exceeded{Color.RESET}")
+    return 0 if ok else 1
+
+def build_index(argv):
+    """Write the embedded plugin index and bytecode for a frozen build (`--build-index [PATH]`)."""
+    i = argv.index("--build-index")
+    cli = Dispatcher()
+    out_path = argv[i + 1] if i + 1 < len(argv) else os.path.join(cli.root_dir, "build", PLUGIN_INDEX_NAME)
+    try:
+        count = cli.build_index(out_path)
+    except OSError as e:
+        print(f"{Color.RED}[ERROR] Could not write plugin index: {e}{Color.RESET}")
+        return 1
+    print(f"{Color.GREEN}[OK] Indexed {count} commands from {len(cli.catalog)} files -> {out_path}{Color.RESET}")
+    if not cli.compile_sources():
+        print(f"{Color.RED}[ERROR] Some plugins failed to compile{Color.RESET}")
+        return 1
+    print(f"{Color.GREEN}[OK] Plugins precompiled to bytecode{Color.RESET}")
+    return 0
+
 # --- EXECUTION ---
 if __name__ == "__main__":
+    if "--check-import-budget" in sys.argv[1:]:
+        sys.exit(check_import_budget(sys.argv[1:]))
+    if "--build-index" in sys.argv[1:]:
+        sys.exit(build_index(sys.argv[1:]))
+    if "--profile-startup" in sys.argv[1:]:
+        sys.exit(profile_startup(sys.argv[1:]))
+    if "--daemon" in sys.argv[1:]:
+        daemon_cli = Dispatcher()
+        daemon_cli.load_plugins(use_snapshot=True)
+        sys.exit(DaemonServer(daemon_cli).serve())
+
     cli = Dispatcher()
-    cli.load_plugins()
+    cli.load_plugins(use_snapshot=True)
+    # Only the shell outlives a background probe; one-shot runs wait for it
+    cli.net_status.blocking = len(sys.argv) >= 2
     
     if len(sys.argv) < 2:
+        watch_interval = cli.settings.get("dispatcher", {}).get("watch_interval", 0)
+        if watch_interval:
+            cli.watcher.start(watch_interval)
+        cli.enable_completion()
+
         groups = cli.get_all_groups()
         if "menu" in groups:
             cli.display_list("menu")
@@ -760,70 +3473,46 @@ if __name__ == "__main__":
                     cli.display_list("core")
                     continue
                 if hasattr(cli, "_check_f5_key") and cli._check_f5_key():
-                    cli.settings = cli._load_settings()
-                    cli.load_plugins()
-                    groups = cli.get_all_groups()
-                    cli.display_list("menu" if "menu" in groups else None)
+                    cli.reload()
                     continue
                 
+                cli.jobs.notify()
                 prompt_fmt = cli.settings.get("ui", {}).get("default_prompt", "{root_dir} > ")
                 prompt_text = prompt_fmt.format(root_dir=os.path.basename(cli.root_dir))
                 prompt = f"{Color.CYAN}{prompt_text}{Color.RESET}"                
                 raw_input = input(prompt).strip()
                 if not raw_input: continue
                 
-                # Support command chaining with '&'
-                # Handle quoted strings to avoid splitting '&' inside quotes could be complex, 
-                # but for simple usage split('&') is a good start.
-                commands = [c.strip() for c in raw_input.split('&') if c.strip()]
-                
-                should_break = False
-                for cmd_str in commands:
-                    user_input = cmd_str.split()
-                    if not user_input: continue
-                    
-                    cmd = user_input[0]
-                    # Treat '#' as alias for 'menu' - check before .lower()
-                    if cmd == "#":
-                        cmd = "menuallweb"
-                    else:
-                        cmd = cmd.lower()
-                    
-                    args = user_input[1:]
-                    
-                    if cmd in ["exit", "quit"]: 
-                        should_break = True
-                        break
-                    
-                    if cmd == "all":
-                        cli.display_list()
-                        continue
-                    
-                    if cmd in ["modules", "mod"]:
-                        cli.display_all_modules()
-                        continue
-                    
-                    if cmd == "menu":
-                        cli.display_list("menu")
-                        continue
-
-                    if cmd in ["reload", "r", "refresh", "f5"]: 
-                        cli.settings = cli._load_settings()
-                        cli.load_plugins()
-                        groups = cli.get_all_groups()
-                        cli.display_list("menu" if "menu" in groups else None)
-                        continue
-
-                    if cmd in cli.get_all_groups():
-                        cli.display_list(cmd)
-                        continue
-                    
-                    cli.execute(cmd, *args)
-                
-                if should_break:
+                if cli.run_line(raw_input) is None:
                     break
 
             except (EOFError, KeyboardInterrupt):
                 break
+    elif sys.argv[1] == "-f":
+        opts = sys.argv[2:]
+        if not opts:
+            print(f"{Color.YELLOW}Usage: cli.py -f <script.pscli | -> [--fail-fast | --continue]{Color.RESET}")
+            sys.exit(2)
+        fail_fast = "--fail-fast" in opts and "--continue" not in opts
+        if opts[0] == "-":
+            # Commands must not consume the script as their input: read it from a copy
+            # of fd 0 and give fd 0 / sys.stdin an empty stream (prompts get EOF)
+            try:
+                script = os.fdopen(os.dup(sys.stdin.fileno()), "r", encoding=sys.stdin.encoding or "utf-8")
+                devnull = os.open(os.devnull, os.O_RDONLY)
+                os.dup2(devnull, 0)
+                os.close(devnull)
+            except (AttributeError, ValueError, OSError):
+                script = sys.stdin
+            sys.stdin = io.StringIO()
+            with script:
+                sys.exit(cli.run_script(script, fail_fast=fail_fast))
+        try:
+            script = open(opts[0], "r", encoding="utf-8")
+        except OSError as e:
+            print(f"{Color.RED}[ERROR] Could not open script: {e}{Color.RESET}")
+            sys.exit(2)
+        with script:
+            sys.exit(cli.run_script(script, fail_fast=fail_fast, source=os.path.basename(opts[0])))
     else:
-        cli.execute(sys.argv[1], *sys.argv[2:])
+        sys.exit(cli.execute(sys.argv[1], *sys.argv[2:]))
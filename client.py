@@ -0,0 +1,103 @@
+"""Thin client for the psCLI daemon (`python cli.py --daemon`).
+
+Forwards argv, the working directory and the environment to a running daemon
+and streams its output and exit code back. Runs cli.py in-process when no
+daemon is reachable, so it can be used in place of `cli.py` in scripts:
+
+    python client.py <command> [args...]
+    python client.py --stop
+"""
+import os
+import sys
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+
+def _settings_dir():
+    path = os.path.expandvars(r"%userprofile%\.polsoft\psCli\settings")
+    if "%userprofile%" in path.lower():
+        # Not expanded outside Windows; same per-user folder as cli.SETTINGS_DIR
+        path = os.path.join(os.path.expanduser("~"), ".polsoft", "psCli", "settings")
+    return path
+
+
+SETTINGS_DIR = _settings_dir()
+
+
+def daemon_address(settings_dir=SETTINGS_DIR):
+    if sys.platform == "win32":
+        return r"\\.\pipe\pscli-" + os.environ.get("USERNAME", "user")
+    return os.path.join(settings_dir, "daemon.sock")
+
+
+def daemon_key_path(settings_dir=SETTINGS_DIR):
+    return os.path.join(settings_dir, "daemon.key")
+
+
+def connect(settings_dir=SETTINGS_DIR):
+    """Return a connection to the running daemon, or None if there is none."""
+    try:
+        with open(daemon_key_path(settings_dir), "rb") as f:
+            key = f.read()
+        return Client(daemon_address(settings_dir), authkey=key)
+    except (OSError, EOFError, AuthenticationError):
+        return None
+
+
+def request(conn, message):
+    """Send one request and relay streamed output until the daemon reports an exit code."""
+    conn.send(message)
+    while True:
+        kind, payload = conn.recv()
+        if kind == "out":
+            sys.stdout.write(payload)
+            sys.stdout.flush()
+        elif kind == "err":
+            sys.stderr.write(payload)
+            sys.stderr.flush()
+        elif kind == "exit":
+            return payload
+
+
+def run_local(argv):
+    import runpy
+    cli_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+    sys.argv = [cli_path] + list(argv)
+    runpy.run_path(cli_path, run_name="__main__")
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv == ["--stop"]:
+        conn = connect()
+        if conn is None:
+            print("psCLI daemon is not running")
+            return 1
+        with conn:
+            return request(conn, ("stop",))
+
+    # The interactive shell and cli.py's own options always run in-process;
+    # the output format flags (--json, --format=...) belong to the command
+    own_option = argv and argv[0].startswith("--") and argv[0] != "--json" and not argv[0].startswith("--format")
+    conn = connect() if argv and not own_option else None
+    if conn is None:
+        return run_local(argv)
+    env = dict(os.environ)
+    # Let the daemon render colours and table widths for this console
+    env["PSCLI_TTY"] = ("o" if sys.stdout.isatty() else "") + ("e" if sys.stderr.isatty() else "")
+    if sys.stdout.isatty() and "COLUMNS" not in env:
+        try:
+            env["COLUMNS"] = str(os.get_terminal_size(sys.stdout.fileno()).columns)
+        except OSError:
+            pass
+    try:
+        with conn:
+            return request(conn, ("run", argv, os.getcwd(), env))
+    except (EOFError, OSError) as e:
+        print(f"psCLI daemon connection lost: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
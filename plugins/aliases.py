@@ -3,7 +3,7 @@ import sys
 import re
 import importlib
 import inspect
-from cli import command, Color
+from cli import command, Color, Table, emit, emit_rows, current_format, terminal_width
 
 __author__ = "Sebastian Januchowski"
 __category__ = "utilities"
@@ -161,92 +161,55 @@ def get_ascii_tools():
         pass
     return tools
 
-def display_all():
-    """Display all loaded modules, tools and aliases."""
-    os.system('cls' if os.name == 'nt' else 'clear')
-    
-    print(f"{Color.CYAN}{Color.BOLD}ALL AVAILABLE MODULES, COMMANDS & ALIASES{Color.RESET}\n")
-    print(f"{Color.BOLD}{'NAME/COMMAND':<25} | {'DESCRIPTION':<45} | {'ALIASES':<25}{Color.RESET}")
-    print(f"{Color.GRAY}{'-' * 100}{Color.RESET}")
-    
-    # Load all data
-    py_modules = get_python_modules()
-    health_tools = get_health_tools()
-    system_tools = get_system_tools()
-    games = get_games()
-    ascii_tools = get_ascii_tools()
-    
-    # Display Python Modules
-    if py_modules:
-        print(f"{Color.CYAN}--- Python Modules ---{Color.RESET}")
-        sorted_py = sorted(py_modules, key=lambda x: (
-            str(x.get('group', '')).lower(),
-            str(x.get('category', '')).lower(),
-            x.get('command', '').lower()
-        ))
-        for mod in sorted_py:
-            aliases_str = ', '.join(mod['aliases']) if mod['aliases'] else ""
-            desc = mod['desc'][:45]
-            print(f"{Color.CYAN}{mod['command']:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-    
-    # Display Health Tools
-    if health_tools:
-        print(f"\n{Color.YELLOW}--- Health Tools ---{Color.RESET}")
-        sorted_health = sorted(health_tools, key=lambda x: (
-            str(x.get('group', '')).lower(),
-            str(x.get('category', '')).lower(),
-            x.get('name', '').lower()
-        ))
-        for tool in sorted_health:
-            aliases_str = ', '.join(tool['aliases']) if tool['aliases'] else ""
-            desc = tool['desc'][:45]
-            print(f"{Color.WHITE}{tool['name']:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-    
-    # Display System Tools
-    if system_tools:
-        print(f"\n{Color.MAGENTA}--- System Tools ---{Color.RESET}")
-        sorted_system = sorted(system_tools, key=lambda x: (
+def get_all_sections():
+    """(title, title colour, name colour, name key, sorted entries) for every section."""
+    sections = [
+        ("Python Modules", Color.CYAN, Color.CYAN, "command", get_python_modules()),
+        ("Health Tools", Color.YELLOW, Color.WHITE, "name", get_health_tools()),
+        ("System Tools", Color.MAGENTA, Color.WHITE, "name", get_system_tools()),
+        ("Games", Color.GREEN, Color.WHITE, "name", get_games()),
+        ("ASCII Tools", Color.BLUE, Color.WHITE, "name", get_ascii_tools()),
+    ]
+    for title, title_color, name_color, key, entries in sections:
+        entries.sort(key=lambda x: (
             str(x.get('group', '')).lower(),
             str(x.get('category', '')).lower(),
-            x.get('name', '').lower()
+            x.get(key, '').lower()
         ))
-        for tool in sorted_system:
-            aliases_str = ', '.join(tool['aliases']) if tool['aliases'] else ""
-            desc = tool['desc'][:45]
-            print(f"{Color.WHITE}{tool['name']:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-    
-    # Display Games
-    if games:
-        print(f"\n{Color.GREEN}--- Games ---{Color.RESET}")
-        sorted_games = sorted(games, key=lambda x: (
-            str(x.get('group', '')).lower(),
-            str(x.get('category', '')).lower(),
-            x.get('name', '').lower()
-        ))
-        for game in sorted_games:
-            aliases_str = ', '.join(game['aliases']) if game['aliases'] else ""
-            desc = game['desc'][:45]
-            print(f"{Color.WHITE}{game['name']:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
-    
-    # Display ASCII Tools
-    if ascii_tools:
-        print(f"\n{Color.BLUE}--- ASCII Tools ---{Color.RESET}")
-        sorted_ascii = sorted(ascii_tools, key=lambda x: (
-            str(x.get('group', '')).lower(),
-            str(x.get('category', '')).lower(),
-            x.get('name', '').lower()
-        ))
-        for tool in sorted_ascii:
-            aliases_str = ', '.join(tool['aliases']) if tool['aliases'] else ""
-            desc = tool['desc'][:45]
-            print(f"{Color.WHITE}{tool['name']:<25}{Color.RESET} | {desc:<45} | {aliases_str:<25}")
+    return sections
+
+def get_rows():
+    """One plain dict per module, tool and game (for --json / --format=jsonl)."""
+    for title, _, _, key, entries in get_all_sections():
+        for entry in entries:
+            yield {"section": title, "name": entry[key], "file": entry['file'], "group": entry['group'],
+                   "category": entry['category'], "description": entry['desc'], "aliases": list(entry['aliases'])}
+
+def display_all():
+    """Display all loaded modules, tools and aliases."""
+    if current_format() != "table":
+        emit_rows(get_rows())
+        return
+
+    table = Table([("NAME/COMMAND", 25), ("DESCRIPTION", 45), ("ALIASES", 25)], flex=1)
+    for title, title_color, name_color, key, entries in get_all_sections():
+        if not entries:
+            continue
+        gap = "\n" if len(table) else ""
+        table.add_line(f"{gap}{title_color}--- {title} ---{Color.RESET}")
+        for entry in entries:
+            aliases_str = ', '.join(entry['aliases']) if entry['aliases'] else ""
+            table.add_row((entry[key], name_color), entry['desc'], aliases_str)
     
-    print(f"\n{Color.GRAY}{'-' * 100}{Color.RESET}")
+    emit(f"{Color.CYAN}{Color.BOLD}ALL AVAILABLE MODULES, COMMANDS & ALIASES{Color.RESET}\n\n"
+         + table.render(max_width=terminal_width(), top_rule=False), clear=True)
 
 @command(name="aliases", aliases=["mod", "modules", "list"])
 def aliases_dispatcher(*args):
     """Display all available modules, commands and their aliases."""
     display_all()
+    if current_format() != "table":
+        return
     input(f"\n{Color.CYAN}Press Enter to continue...{Color.RESET}")
 
 if __name__ == "__main__":
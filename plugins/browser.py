@@ -1,6 +1,3 @@
-import urllib.request
-import urllib.parse
-import http.cookiejar
 import html.parser
 import textwrap
 import shutil
@@ -26,12 +23,21 @@ for path in [BASE_DIR, SCREENSHOT_DIR, DOWNLOAD_DIR]:
     if not os.path.exists(path): os.makedirs(path)
 
 # --- SESSION CONFIGURATION ---
-cookie_jar = http.cookiejar.MozillaCookieJar(COOKIE_FILE)
-if os.path.exists(COOKIE_FILE):
-    try: cookie_jar.load(ignore_discard=True, ignore_expires=True)
-    except: pass
-opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(cookie_jar))
-urllib.request.install_opener(opener)
+cookie_jar = None
+
+def _session():
+    """Load cookies and install the cookie-aware opener on the first request."""
+    global cookie_jar
+    if cookie_jar is None:
+        import http.cookiejar
+        import urllib.request
+        jar = http.cookiejar.MozillaCookieJar(COOKIE_FILE)
+        if os.path.exists(COOKIE_FILE):
+            try: jar.load(ignore_discard=True, ignore_expires=True)
+            except: pass
+        urllib.request.install_opener(urllib.request.build_opener(urllib.request.HTTPCookieProcessor(jar)))
+        cookie_jar = jar
+    return cookie_jar
 
 def save_history(url):
     history_data = []
@@ -85,6 +91,8 @@ class FullParser(html.parser.HTMLParser):
         return "\n\n".join(wrapped)
 
 def download_file(url):
+    import urllib.request
+    _session()
     try:
         local_filename = os.path.join(DOWNLOAD_DIR, url.split('/')[-1].split('?')[0])
         print(f"{Color.YELLOW}[DOWNLOAD]{Color.RESET} Downloading: {url}...")
@@ -95,7 +103,10 @@ def download_file(url):
         print(f"{Color.RED}[ERROR]{Color.RESET} {e}")
 
 def fetch_content(url):
+    import urllib.parse
+    import urllib.request
     if not url.startswith("http"): url = "http://" + url
+    jar = _session()
     try:
         req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
         with urllib.request.urlopen(req, timeout=10) as response:
@@ -104,7 +115,7 @@ def fetch_content(url):
                 download_file(url)
                 return "DOWNLOAD", None, [], [], ""
             
-            cookie_jar.save(ignore_discard=True, ignore_expires=True)
+            jar.save(ignore_discard=True, ignore_expires=True)
             real_url = response.geturl()
             save_history(real_url)
             raw_data = response.read().decode('utf-8', errors='ignore')
@@ -129,6 +140,7 @@ def show_about():
 @command(name="browser", aliases=["web", "www"])
 def browse(url=None):
     """psBrowser CLI: [Nr] Link, [S(nr)] Search, [h] History, [snap] Screenshot, [u] Back."""
+    import urllib.parse
     history_stack = []
     current_url = url or "google.com"
 
@@ -637,8 +637,9 @@ class BatchTemplateGenerator:
         """)
 
 
-def main():
+def main(*argv):
     import argparse
+    from cli import emit_rows, current_format
     
     parser = argparse.ArgumentParser(description='dbbatch - Zarządzanie skryptami BAT/CMD')
     parser.add_argument('command', help='Komenda')
@@ -649,7 +650,7 @@ def main():
     parser.add_argument('--tags', help='Tagi')
     parser.add_argument('--logo', help='Ścieżka do logo PNG')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     db = BatchScriptDatabase()
     command = args.command.lower()
     
@@ -665,7 +666,9 @@ def main():
     
     elif command == 'list':
         scripts = db.list_scripts(category=args.category)
-        if scripts:
+        if current_format() != 'table':
+            emit_rows([dict(s) for s in scripts])
+        elif scripts:
             print(f"{Colors.CYAN}Znaleziono {len(scripts)} skryptów:{Colors.RESET}\n")
             for s in scripts:
                 print(f"{Colors.GREEN}[{s['id']}]{Colors.RESET} {s['filename']}")
@@ -734,4 +737,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # cli.py z katalogu nadrzędnego daje wspólne --json / --format
+    sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from cli import split_output_flags, output_format
+    fmt, argv = split_output_flags(sys.argv[1:])
+    with output_format(fmt):
+        main(*argv)
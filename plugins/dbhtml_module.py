@@ -37,13 +37,9 @@ GitHub: https://github.com/seb07uk
 import sys
 import os
 import json
-import sqlite3
-import csv
 import datetime
-import hashlib
 import re
 from pathlib import Path
-from urllib.parse import urlparse, urljoin
 
 # Import HTMLParser before any local html module
 try:
@@ -103,6 +99,7 @@ class HTMLDatabase:
         
     def connect(self):
         """Połącz z bazą danych"""
+        import sqlite3
         try:
             self.conn = sqlite3.connect(self.db_path)
             self.conn.row_factory = sqlite3.Row
@@ -211,6 +208,8 @@ class HTMLDatabase:
         
         try:
             # Parsuj URL
+            from urllib.parse import urlparse
+            import hashlib
             parsed = urlparse(url)
             domain = parsed.netloc
             
@@ -299,6 +298,7 @@ class HTMLDatabase:
     
     def create_library(self, name, description=None, lib_type='collection'):
         """Utwórz bibliotekę/kolekcję"""
+        import sqlite3
         if not self.connect():
             return False
         
@@ -443,6 +443,7 @@ class HTMLDatabase:
                 print(f"{Colors.YELLOW}Brak danych do eksportu{Colors.RESET}")
                 return False
             
+            import csv
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
                 
@@ -1085,7 +1086,7 @@ def _get_command_decorator():
 # Apply decorator when first accessed
 _dbhtml_func = None
 
-def main(*args):
+def main(*argv):
     """Główna funkcja CLI"""
     import argparse
     
@@ -1097,6 +1098,7 @@ Przykłady użycia:
   dbhtml init
   dbhtml add "https://example.com" --title "Przykład" --tags "web,test"
   dbhtml list --limit 10
+  dbhtml list --json
   dbhtml search "python"
   dbhtml export html output.html
   dbhtml generate basic > template.html
@@ -1114,7 +1116,7 @@ Przykłady użycia:
     parser.add_argument('--limit', type=int, help='Limit wyników')
     parser.add_argument('--db', help='Ścieżka do bazy danych')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Inicjalizacja bazy
     db = HTMLDatabase(args.db)
@@ -1144,7 +1146,11 @@ Przykłady użycia:
             category=args.category,
             tags=args.tags
         )
-        if pages:
+        # --json / --format=jsonl są obsługiwane przez terminal (cli.emit_rows)
+        from cli import emit_rows, current_format
+        if current_format() != 'table':
+            emit_rows([dict(page) for page in pages])
+        elif pages:
             print(f"{Colors.CYAN}Znaleziono {len(pages)} stron:{Colors.RESET}\n")
             for page in pages:
                 print(f"{Colors.GREEN}[{page['id']}]{Colors.RESET} {page['title'] or 'Bez tytułu'}")
@@ -1262,4 +1268,9 @@ except ImportError:
 
 
 if __name__ == "__main__":
-    main()
+    # Uruchomienie z plugins/: cli.py daje wspólne --json / --format
+    sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from cli import split_output_flags, output_format
+    fmt, argv = split_output_flags(sys.argv[1:])
+    with output_format(fmt):
+        main(*argv)
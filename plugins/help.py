@@ -34,7 +34,12 @@ import os
 import sys
 import shutil
 import textwrap
+import functools
+import itertools
 import json
+import math
+import re
+import zlib
 
 # --- METADATA (Read by cli.py) ---
 __author__ = "Sebastian Januchowski"
@@ -47,7 +52,7 @@ __config__ = r"%userprofile%\.polsoft\psCli\settings\terminal.json"
 
 # Handle both direct execution and import from cli.py
 try:
-    from cli import command, Color
+    from cli import command, Color, emit, emit_rows, current_format, cached, use_color, strip_ansi, CACHE_DIR
     # Add MAGENTA if not available
     if not hasattr(Color, 'MAGENTA'):
         Color.MAGENTA = '\033[95m'
@@ -69,6 +74,30 @@ except (ImportError, ModuleNotFoundError):
             return func
         return decorator
 
+    def emit(text, stream=None, clear=False):
+        stream = sys.stdout if stream is None else stream
+        stream.write(text)
+        stream.flush()
+
+    def current_format():
+        return "table"
+
+    def cached(maxsize=128, **kwargs):
+        return functools.lru_cache(maxsize=maxsize)
+
+    def use_color(stream=None):
+        stream = sys.stdout if stream is None else stream
+        return not os.environ.get("NO_COLOR") and stream.isatty()
+
+    def strip_ansi(text):
+        return re.sub(r"\x1b\[[0-9;?]*[A-Za-z]", "", text)
+
+    if "%userprofile%" in os.path.expandvars(__config__).lower():
+        # Not expanded outside Windows; same per-user folder as cli.CACHE_DIR
+        CACHE_DIR = os.path.join(os.path.expanduser("~"), ".polsoft", "psCli", "settings", "cache")
+    else:
+        CACHE_DIR = os.path.join(os.path.dirname(os.path.expandvars(__config__)), "cache")
+
 # Short references for cleaner code
 BOLD, RESET = Color.BOLD, Color.RESET
 CYAN, GREEN, YELLOW = Color.CYAN, Color.GREEN, Color.YELLOW
@@ -77,815 +106,12 @@ MAGENTA = getattr(Color, 'MAGENTA', '\033[95m')
 
 # ======================== PLUGIN DOCUMENTATION DATABASE ========================
 
-PLUGINS_DB = {
-    "cd": {
-        "name": "cd",
-        "category": "file system",
-        "description": "Changes the current working directory with support for shortcuts and environment variables",
-        "aliases": ["chdir", "jump"],
-        "syntax": ["cd <path>", "cd ..", "cd ~", "cd -", "cd %VAR%"],
-        "examples": [
-            ("cd plugins", "Enter the plugins folder"),
-            ("cd ..", "Go to parent directory"),
-            ("cd -", "Toggle between directories"),
-            ("cd %TEMP%", "Jump to temporary folder"),
-            ("cd ~", "Return to home directory")
-        ],
-        "tips": ["Use 'cd -' to quickly switch back", "Environment variables work like %TEMP%", "Path completion with Tab key available"]
-    },
-    
-    "pwd": {
-        "name": "pwd",
-        "category": "file system",
-        "description": "Professional Directory Auditor & Path Telemetry Tool - displays comprehensive directory analysis",
-        "aliases": ["path", "where"],
-        "syntax": ["pwd [path]", "where [path]"],
-        "examples": [
-            ("pwd", "Analyze current directory"),
-            ("where %TEMP%", "Inspect Temp folder"),
-            ("pwd ..", "Check parent directory size")
-        ],
-        "tips": ["Shows disk space and file distribution at a glance", "Displays file count and total size", "Color-coded output for easy reading"],
-        "output": "Displays directory path, file count, total size, and subdirectory breakdown"
-    },
-    
-    "dir": {
-        "name": "dir",
-        "category": "file system",
-        "description": "Dynamic directory explorer with sorting and type-based coloring - list files with various options",
-        "aliases": ["ls", "list"],
-        "syntax": ["dir [path] [option]", "ls [path] [option]"],
-        "options": [
-            "-t (Sort by Type)",
-            "-n (Sort by Name - default)",
-            "-s (Sort by Size)",
-            "-d (Sort by Date)",
-            "-r (Reverse order)"
-        ],
-        "examples": [
-            ("dir", "List current directory"),
-            ("dir -s", "Sort by largest files"),
-            ("ls -d", "Show newest files first"),
-            ("dir plugins", "List specific directory"),
-            ("dir -t", "Group by file type")
-        ],
-        "tips": ["Supports sorting by size, name, date, and type", "Pagination for large folders", "Color-coded file types"]
-    },
-    
-    "cls": {
-        "name": "cls",
-        "category": "system",
-        "description": "Clears the console screen instantly and refreshes the display",
-        "aliases": ["clear", "clean", "c"],
-        "syntax": ["cls", "clear", "c"],
-        "examples": [("cls", "Clear the entire screen")],
-        "tips": ["Keyboard shortcuts for quick access", "Useful after large outputs"],
-        "performance": "Instantaneous screen clear"
-    },
-    
-    "echo": {
-        "name": "echo",
-        "category": "output",
-        "description": "Displays the provided text in green",
-        "aliases": ["say", "repeat", "e"],
-        "syntax": ["echo <text>", "say <text>"],
-        "examples": [
-            ("echo Hello World", "Prints text in green"),
-            ("say Process completed", "Display message")
-        ],
-        "tips": ["Output is colored green by default", "Supports multi-word messages", "Useful in scripts for feedback"]
-    },
-    
-    "calculator": {
-        "name": "calculator",
-        "category": "math",
-        "description": "Professional scientific calculator with history logging and mathematical functions",
-        "aliases": ["calc", "math", "kalk"],
-        "syntax": ["calculator", "calc", "math"],
-        "storage": r"%userprofile%\.polsoft\psCli\Calculator\history.txt",
-        "features": [
-            "Basic arithmetic (+, -, *, /)",
-            "Power operations (**)",
-            "Trigonometric functions (sin, cos, tan - in degrees)",
-            "Square root and logarithms",
-            "Persistent history logging",
-            "Interactive mode"
-        ],
-        "examples": [("calc", "Launch interactive mode")],
-        "tips": ["Trigonometry uses degrees, not radians", "View history with [h] command", "History saved automatically"]
-    },
-    
-    "print": {
-        "name": "print",
-        "category": "file operations",
-        "description": "Display file contents with syntax highlighting and optional text search",
-        "aliases": ["cat", "type"],
-        "syntax": ["print <file>", "cat <file>", "cat <file> <search_term>"],
-        "supported_types": [".json", ".py", ".log", ".md", ".csv", ".txt", ".xml", ".yaml"],
-        "examples": [
-            ("print script.py", "View Python code with highlighting"),
-            ("cat log.txt ERROR", "Search for 'ERROR' in log"),
-            ("print metadata.json", "Display formatted JSON"),
-            ("cat CHANGELOG.md", "View markdown file")
-        ],
-        "tips": ["Supports syntax highlighting for code files", "Pagination: 20 lines per screen", "Search results are highlighted"],
-        "pagination": "Press [space] for next page, [q] to quit"
-    },
-    
-    "notepad": {
-        "name": "notepad",
-        "category": "text editing",
-        "description": "Interactive text editor with AutoSave and note management - full-featured text editor",
-        "aliases": ["note", "n"],
-        "syntax": ["notepad", "note [filename]", "edit [filename]"],
-        "storage": r"%userprofile%\.polsoft\psCLI\Notepad",
-        "shortcuts": [
-            "CTRL+Z then ENTER to save",
-            "CTRL+X to cut",
-            "CTRL+C to copy",
-            "CTRL+V to paste",
-            "ESC to cancel/exit"
-        ],
-        "examples": [
-            ("note", "Open editor with new file"),
-            ("note filename.txt", "Edit specific file")
-        ],
-        "tips": ["Auto-saves with timestamps", "Files stored with date/time naming", "Supports basic text formatting"]
-    },
-    
-    "browser": {
-        "name": "browser",
-        "category": "web browser",
-        "description": "psBrowser CLI: Full Suite with History & Quick Links - Full-featured CLI web browser with history, cookies, and screenshot functionality",
-        "aliases": ["web", "www"],
-        "syntax": ["browser [url]", "web [url]", "www [url]"],
-        "features": [
-            "Full HTML rendering in CLI",
-            "Numbered link navigation",
-            "Cookie and session persistence",
-            "History tracking (last 50 URLs)",
-            "Screenshot capability",
-            "Back/forward navigation"
-        ],
-        "examples": [
-            ("web google.com", "Open Google"),
-            ("browser github.com", "Browse GitHub"),
-            ("web", "Open home page")
-        ],
-        "shortcuts": [
-            "[u] - Go back",
-            "[snap] - Take screenshot",
-            "[h] - Show history",
-            "[q] - Quit"
-        ],
-        "tips": ["Links are numbered for easy clicking", "Cookies stored automatically", "Screenshots saved to Browser folder"],
-        "storage": r"%userprofile%\.polsoft\psCli\Browser"
-    },
-    
-    "venv": {
-        "name": "venv",
-        "category": "environment",
-        "description": "Virtual environment manager - create, activate, deactivate, and manage Python virtual environments",
-        "aliases": ["virtualenv", "env"],
-        "syntax": [
-            "venv create <name>",
-            "venv activate <name>",
-            "venv deactivate",
-            "venv list",
-            "venv delete <name>"
-        ],
-        "features": [
-            "Create isolated Python environments",
-            "Activate/deactivate environments",
-            "List all environments",
-            "Delete environments",
-            "Install packages in venv",
-            "Environment persistence"
-        ],
-        "examples": [
-            ("venv create myenv", "Create new environment"),
-            ("venv activate myenv", "Activate environment"),
-            ("venv list", "Show all environments"),
-            ("venv deactivate", "Exit current environment")
-        ],
-        "tips": ["Environments isolated for each project", "Dependencies don't conflict", "Always activate before installing packages"],
-        "storage": r"%userprofile%\.polsoft\psCli\venv"
-    },
-    
-    "games": {
-        "name": "games",
-        "category": "entertainment",
-        "description": "Games Center - dynamic launcher for console games with multiple play options",
-        "aliases": ["play", "game"],
-        "syntax": ["games", "play [game_name]"],
-        "available_games": [
-            "Rock-Paper-Scissors",
-            "Tic-Tac-Toe",
-            "Snake CLI",
-            "Hangman",
-            "Racer CLI",
-            "Tetris Mini"
-        ],
-        "examples": [
-            ("games", "Show available games"),
-            ("play rock-paper-scissors", "Launch game"),
-            ("play hangman", "Play Hangman")
-        ],
-        "tips": ["Press [q] to quit any game", "Games are fully interactive", "High scores may be tracked", "6 games available: Rock-Paper-Scissors, Tic-Tac-Toe, Snake CLI, Hangman, Racer CLI, Tetris Mini"],
-        "storage": r"%projectroot%\games"
-    },
-    
-    "ascii": {
-        "name": "ascii",
-        "category": "ascii art",
-        "description": "ASCII Center - launcher for ASCII animations and scripts from the /ascii folder",
-        "aliases": ["art", "a"],
-        "syntax": ["ascii", "ascii <asset_name>", "ascii <ID>"],
-        "features": [
-            "Scans the /ascii folder",
-            "Supports .cmd, .bat, .ps1, .vbs, .exe, .py",
-            "Launches in a new console window",
-            "Descriptions loaded from metadata files in /metadata"
-        ],
-        "examples": [
-            ("ascii", "Show the list of available assets"),
-            ("ascii parrot", "Launch the Parrot animation"),
-            ("ascii 1", "Launch the asset with ID 1")
-        ],
-        "tips": [
-            "Type the asset name or ID",
-            "For .cmd/.bat scripts, cmd /c is used",
-            "For .ps1, PowerShell with Bypass is used",
-            "Add descriptions in metadata/<filename>.json"
-        ],
-        "storage": r"%userprofile%\.polsoft\psCLI\ascii"
-    },
-    
-    "core": {
-        "name": "core",
-        "category": "system",
-        "description": "Core Module Viewer - displays essential system plugins and core functionality",
-        "aliases": ["sys", "base"],
-        "syntax": ["core", "sys"],
-        "examples": [("core", "Show core modules")],
-        "tips": ["Shows system-critical plugins", "Foundation of CLI operation"]
-    },
-    
-    "office": {
-        "name": "office",
-        "category": "office",
-        "description": "Office Suite - manages documents and metadata previews",
-        "aliases": ["docs", "work"],
-        "syntax": ["office", "docs"],
-        "features": [
-            "Document management",
-            "Metadata viewing",
-            "File organization",
-            "Office tools access"
-        ],
-        "examples": [("office", "Show office tools")],
-        "tips": ["Centralizes document operations", "Metadata preview functionality"]
-    },
-    
-    "save": {
-        "name": "save",
-        "category": "system",
-        "description": "Saves file list with detailed folder summary to save directory with timestamp",
-        "aliases": ["/s"],
-        "syntax": ["save", "save -h"],
-        "storage": r"%userprofile%\.polsoft\psCli\Save",
-        "output_format": "Text file with command-style format (print file.txt # description)",
-        "examples": [("save", "Create snapshot of current directory")],
-        "tips": ["Files automatically timestamped", "Useful for project snapshots", "Naming: save_YYYY-MM-DD_HH-MM-SS.txt"],
-        "automation": "Perfect for scheduled backups and documentation"
-    },
-    
-    "paint": {
-        "name": "paint",
-        "category": "paint cli",
-        "description": "Paint application for drawing in terminal - ASCII art creation with multiple colors",
-        "aliases": ["p"],
-        "syntax": ["paint", "draw"],
-        "features": [
-            "Terminal-based drawing",
-            "Multiple colors available",
-            "Save artwork as ASCII",
-            "Interactive brush controls",
-            "Palette selection"
-        ],
-        "color_palette": [
-            "1 - Green (#)",
-            "2 - Red (#)",
-            "3 - Blue (#)",
-            "4 - Yellow (#)",
-            "5 - Magenta (#)"
-        ],
-        "examples": [("paint", "Launch paint application")],
-        "tips": ["Arrow keys for navigation", "Select color from palette", "Save your creations"],
-        "storage": r"%userprofile%\.polsoft\psCli\Paint"
-    },
-    
-    "hack": {
-        "name": "hack",
-        "category": "hacking",
-        "description": "Hacking Tools - dynamic launcher for system tools",
-        "aliases": ["tools", "exploit"],
-        "syntax": ["hack", "hack <tool_name>"],
-        "features": [
-            "Dynamic system tools launcher",
-            "Metadata-driven tool management",
-            "Tool categorization and organization",
-            "Easy tool execution",
-            "Tool information display"
-        ],
-        "examples": [
-            ("hack", "Show available tools"),
-            ("hack pmas", "Execute PMAS activation tool"),
-            ("hack Office_365", "Execute Office 365 batch script"),
-            ("hack mas", "Execute Microsoft Activation Scripts"),
-            ("hack fido", "Launch Windows ISO downloader")
-        ],
-        "tips": ["Tools are loaded from /tools/ directory", "Metadata stored in /metadata/", "Easy integration of new tools"],
-        "storage": r"v:\tools"
-    },
-    
-    "pmas": {
-        "name": "pmas",
-        "category": "activation",
-        "description": "PowerShell Multi Activation System - Windows activation tool",
-        "aliases": ["activate"],
-        "syntax": ["pmas"],
-        "authors": ["Abdullah Ertürk", "mephistooo2", "Dark Vador", "Windows_Addict"],
-        "features": [
-            "Windows activation",
-            "Multi-activation system",
-            "PowerShell-based automation",
-            "Secure script verification"
-        ],
-        "examples": [
-            ("pmas", "Launch PowerShell Multi Activation System"),
-            ("activate", "Quick activation tool (alias)")
-        ],
-        "tips": ["Requires administrator privileges", "Script includes integrity verification", "Supports multiple languages"],
-        "group": "microsoft"
-    },
-
-    "office_365": {
-        "name": "office_365",
-        "category": "microsoft",
-        "description": "Microsoft Office 365 installation and activation tool",
-        "aliases": ["ms365", "msoffice"],
-        "syntax": ["office_365.bat"],
-        "features": [
-            "Office 365 deployment",
-            "Automatic download and extraction",
-            "Configuration-based installation",
-            "64-bit Office support"
-        ],
-        "examples": [
-            ("office_365.bat", "Install Microsoft Office 365"),
-            ("ms365", "Quick launch (alias)")
-        ],
-        "tips": ["Downloads Office Deployment Tool automatically", "Requires internet connection", "Creates configuration files dynamically"],
-        "group": "microsoft",
-        "requires": "Administrator privileges, Internet connection"
-    },
-    
-    "file": {
-        "name": "file",
-        "category": "file manager",
-        "description": "CMD Cli File Manager: full suite with history and quick links",
-        "aliases": ["fm", "fileman"],
-        "syntax": ["file"],
-        "features": [
-            "Navigate directories and parent path",
-            "Disk usage information",
-            "Create/delete files and folders",
-            "Rename, copy, move items",
-            "Backup (mirror) directories",
-            "Search files recursively",
-            "Save file list reports",
-            "Open saved reports folder"
-        ],
-        "examples": [("file", "Launch the File Manager")],
-        "tips": ["Use menu options [1-18]", "Reports saved with timestamps"],
-        "storage": r"%userprofile%\.polsoft\psCLI\FileList"
-    },
-    
-    "lg2txt": {
-        "name": "lg2txt",
-        "category": "file list",
-        "description": "Terminal file list generator with global settings sync",
-        "aliases": ["lg", "listgen"],
-        "syntax": ["lg2txt"],
-        "features": [
-            "Generate lists of files and folders",
-            "Files-only mode",
-            "Extension filter mode",
-            "Preview generated output",
-            "Sync settings in terminal.json"
-        ],
-        "examples": [("lg2txt", "Open interactive list generator")],
-        "tips": ["Change source/output paths from menu", "Logs written to List.log"],
-        "storage": r"%userprofile%\.polsoft\psCLI\Log\List.log"
-    },
-    
-    "edit": {
-        "name": "edit",
-        "category": "editor",
-        "description": "Edit - terminal text editor (external binary)",
-        "aliases": ["ed"],
-        "syntax": ["edit"],
-        "features": [
-            "Runs as an external binary",
-            "Integrated via metadata file edit.exe.json",
-            "Quick editing of text files"
-        ],
-        "examples": [
-            ("edit", "Launch the text editor in terminal")
-        ],
-        "tips": [
-            "Requires edit.exe to be available in plugins/",
-            "Alias: ed"
-        ]
-    },
-    
-    "mas": {
-        "name": "mas",
-        "category": "microsoft",
-        "description": "Microsoft Activation Scripts (MAS) - Windows/Office activation tool",
-        "aliases": ["mas", "activation", "kms"],
-        "syntax": ["mas", "MAS.cmd"],
-        "features": [
-            "Windows activation",
-            "Office activation",
-            "Multiple activation methods"
-        ],
-        "examples": [("hack mas", "Execute Microsoft Activation Scripts")],
-        "tips": ["Requires administrator privileges", "Loaded via hack tools menu"],
-        "group": "hacking"
-    },
-    
-    "wat": {
-        "name": "wat",
-        "category": "microsoft",
-        "description": "Windows Activation Tools (WAT) - zarządzanie licencją i aktywacją",
-        "aliases": ["wat", "winact"],
-        "syntax": ["wat"],
-        "features": [
-            "Activation status",
-            "License information (basic/detailed)",
-            "BIOS/UEFI product key",
-            "Restart licensing service",
-            "Enter product key",
-            "Activate system"
-        ],
-        "examples": [
-            ("hack wat", "Launch WAT from tools menu"),
-            ("wat", "Run directly from tools directory")
-        ],
-        "tips": [
-            "Administrator privileges required for some operations",
-            "Operates under hacking group (Microsoft tools)"
-        ],
-        "group": "microsoft"
-    },
-    
-    "activstatus": {
-        "name": "activstatus",
-        "category": "microsoft",
-        "description": "Windows Activation Status - quick check of system activation state",
-        "aliases": ["activstatus", "stats"],
-        "syntax": ["activstatus"],
-        "features": [
-            "Windows activation check",
-            "License status report"
-        ],
-        "examples": [
-            ("hack activstatus", "Launch activation status from hack menu"),
-            ("activstatus", "Run script directly from tools")
-        ],
-        "tips": [
-            "Requires console with appropriate privileges",
-            "Fast license diagnostics"
-        ],
-        "group": "microsoft"
-    },
-    
-    "sudo": {
-        "name": "sudo",
-        "category": "system",
-        "description": "Execute programs with administrator privileges",
-        "aliases": ["admin", "elevate"],
-        "syntax": ["sudo <command> [args]"],
-        "examples": [
-            ("sudo calc", "Run Calculator as administrator"),
-            ("sudo notepad.exe README.md", "Open Notepad with admin rights")
-        ],
-        "tips": ["Triggers UAC elevation prompt", "Actions are logged to terminal.json"],
-        "storage": r"%userprofile%\.polsoft\psCli\settings\terminal.json"
-    },
-    
-    "passwd": {
-        "name": "passwd",
-        "category": "system",
-        "description": "Password manager and protected launcher for modules and CLI commands",
-        "aliases": ["password", "pass"],
-        "syntax": [
-            "passwd",
-            "passwd help",
-            "passwd protect <command...>",
-            "passwd unprotect <command...>",
-            "passwd list",
-            "passwd clear",
-            "passwd module <name>"
-        ],
-        "features": [
-            "Manage master password (change/reset)",
-            "Protect CLI commands (requires password on run)",
-            "Protect Python modules under modules/",
-            "Interactive menu to run and toggle protection",
-            "Persistent storage in protected.json"
-        ],
-        "examples": [
-            ("passwd", "Open interactive password manager"),
-            ("passwd protect directx jawa vcredis", "Protect selected commands"),
-            ("passwd list", "Show protected commands"),
-            ("passwd module mymod", "Run protected Python module from modules/")
-        ],
-        "tips": [
-            "Protected commands require password before execution",
-            "Modules protection stored under 'modules' section in protected.json",
-            "Use 'clear' to remove all protection",
-            "Aliases: password, pass"
-        ],
-        "storage": r"%userprofile%\.polsoft\psCli\settings\protected.json"
-    },
-    
-    "fido": {
-        "name": "fido",
-        "category": "microsoft",
-        "description": "Fido - Microsoft Windows ISO downloader (PowerShell script)",
-        "aliases": ["fido", "iso", "win-iso"],
-        "syntax": ["fido.ps1"],
-        "features": [
-            "Download Windows 10/11 official ISO",
-            "Command-line mode support",
-            "Locale, edition and architecture selection"
-        ],
-        "examples": [
-            ("hack fido", "Launch Fido ISO downloader"),
-            ("fido.ps1", "Run as standalone PowerShell script")
-        ],
-        "tips": ["Requires PowerShell", "Internet connection needed"],
-        "group": "microsoft"
-    },
-    
-    "owner": {
-        "name": "owner",
-        "category": "info",
-        "description": "Owner and environment information viewer with network status and optional metadata save",
-        "aliases": ["about", "me", "whoami"],
-        "syntax": ["owner", "owner save", "owner mac", "owner mac <adapter_name>", "owner mac set <adapter_name>"],
-        "features": [
-            "Display username, host, home directory and OS",
-            "Show local IP, online status and public IP (if available)",
-            "Detailed OS info: release, version, build, machine, processor, Python",
-            "Display MAC address",
-            "List adapters and set preferred adapter for MAC display in CLI",
-            "Save metadata to user profile",
-            "Simple CLI output with color"
-        ],
-        "examples": [
-            ("owner", "Show owner and environment information"),
-            ("owner save", "Save metadata to echo.json"),
-            ("owner mac", "List adapters and MAC addresses"),
-            ("owner mac set Ethernet", "Set preferred adapter to 'Ethernet'")
-        ],
-        "tips": [
-            "Use 'owner save' to persist info",
-            "Use 'owner mac set <name>' to change adapter (shown in CLI)",
-            "Network detection uses DNS connectivity check",
-            "MAC discovery falls back to 'ipconfig /all' if 'getmac' unavailable",
-            "Supports localized 'Adres fizyczny' in ipconfig output"
-        ],
-        "storage": r"%userprofile%\.polsoft\psCLI\metadata\echo.json"
-    },
-
-    "installer": {
-        "name": "installer",
-        "category": "utilities",
-        "description": "Installer Manager - launcher for installer modules and scripts with metadata support",
-        "aliases": ["install", "ins"],
-        "syntax": ["installer", "install [module_name]"],
-        "features": [
-            "Display available installers",
-            "Execute installer scripts",
-            "Load metadata from JSON files",
-            "Support .py, .bat, .cmd, .ps1, .vbs, .exe files",
-            "Interactive installer selection"
-        ],
-        "examples": [
-            ("installer", "Show available installers"),
-            ("install DirectX", "Execute DirectX installer")
-        ],
-        "tips": ["Installers stored in /install/ directory", "Metadata files in /metadata/", "Easy integration of new installers"],
-        "storage": r"%projectroot%\install"
-    },
-
-    "health": {
-        "name": "health",
-        "category": "system",
-        "description": "Health Tools - system health check and maintenance utilities",
-        "aliases": ["check", "restore"],
-        "syntax": ["health [tool_name]"],
-        "features": [
-            "System health diagnostics",
-            "Performance monitoring",
-            "Health restoration scripts",
-            "System cleanup utilities"
-        ],
-        "examples": [
-            ("health", "Show health tools"),
-            ("health restore", "Run restoration utility")
-        ],
-        "tips": ["Health tools in /health/ directory", "Scripts with metadata support", "Safe system maintenance"],
-        "storage": r"%projectroot%\health"
-    },
-
-    "reboot": {
-        "name": "reboot",
-        "category": "system",
-        "description": "System reboot utility with optional delayed restart functionality",
-        "aliases": ["restart", "r"],
-        "syntax": ["reboot", "restart [seconds]"],
-        "features": [
-            "Immediate system restart",
-            "Delayed restart with countdown",
-            "Clean shutdown",
-            "Process termination before restart"
-        ],
-        "examples": [
-            ("reboot", "Restart system immediately"),
-            ("restart 60", "Restart after 60 seconds")
-        ],
-        "tips": ["Close applications before reboot", "Save your work first", "Countdown can be interrupted"],
-        "requires": "Administrator privileges"
-    },
-
-    "shutdown": {
-        "name": "shutdown",
-        "category": "system",
-        "description": "System shutdown utility with optional delayed shutdown and message display",
-        "aliases": ["power", "off", "stop"],
-        "syntax": ["shutdown", "power [seconds]", "shutdown -c"],
-        "features": [
-            "Immediate system shutdown",
-            "Delayed shutdown with countdown",
-            "Cancel scheduled shutdown",
-            "Message display before shutdown"
-        ],
-        "examples": [
-            ("shutdown", "Shutdown system immediately"),
-            ("power 120", "Shutdown after 120 seconds"),
-            ("shutdown -c", "Cancel scheduled shutdown")
-        ],
-        "tips": ["Save work before shutdown", "Use -c to cancel", "Supports countdown timer"],
-        "requires": "Administrator privileges"
-    },
-
-    "tcp_ip": {
-        "name": "tcp_ip",
-        "category": "network",
-        "description": "Network diagnostics and TCP/IP utilities - connectivity testing and network analysis",
-        "aliases": ["net", "network", "ping", "ipconfig"],
-        "syntax": ["tcp_ip", "tcp_ip [host]", "tcp_ip analyze"],
-        "features": [
-            "Network connectivity testing",
-            "IP configuration display",
-            "DNS resolution",
-            "Route analysis",
-            "Network adapter information"
-        ],
-        "examples": [
-            ("tcp_ip", "Show network status"),
-            ("tcp_ip google.com", "Test connectivity to host"),
-            ("tcp_ip analyze", "Analyze network configuration")
-        ],
-        "tips": ["Displays local and public IP", "Network status check", "DNS and routing information"],
-        "storage": r"%userprofile%\.polsoft\psCli\network"
-    },
-
-    "tree": {
-        "name": "tree",
-        "category": "file system",
-        "description": "Directory tree viewer - displays folder structure in visual tree format",
-        "aliases": ["dtree", "filetree"],
-        "syntax": ["tree [path] [depth]"],
-        "features": [
-            "Visual directory tree display",
-            "Configurable depth limit",
-            "File and folder counts",
-            "ASCII art formatting",
-            "Recursive folder traversal"
-        ],
-        "examples": [
-            ("tree", "Show current directory tree"),
-            ("tree .", "Show tree of current folder"),
-            ("tree . 3", "Show tree 3 levels deep")
-        ],
-        "tips": ["Limit depth for large folders", "Visual ASCII representation", "Shows folder structure clearly"],
-        "output": "ASCII tree with folders and file counts"
-    },
-
-    "aliases": {
-        "name": "aliases",
-        "category": "configuration",
-        "description": "Command aliases management - view and manage command shortcuts",
-        "aliases": ["alias", "shortcuts"],
-        "syntax": ["aliases", "aliases list", "aliases add <alias> <command>"],
-        "features": [
-            "List all command aliases",
-            "View alias definitions",
-            "Add custom aliases",
-            "Remove aliases",
-            "Save alias configuration"
-        ],
-        "examples": [
-            ("aliases", "Show all aliases"),
-            ("aliases list", "Display alias list"),
-            ("aliases add g games", "Create shortcut 'g' for 'games'")
-        ],
-        "tips": ["Aliases reduce typing", "Case-insensitive", "Persist across sessions"],
-        "storage": r"%userprofile%\.polsoft\psCli\aliases.json"
-    },
-
-    "html": {
-        "name": "html",
-        "category": "reports",
-        "description": "HTML Reports & Hub - manage, open and view generated reports (offline-ready)",
-        "aliases": ["report", "export", "reports", "show-reports"],
-        "syntax": [
-            "reports",
-            "show-report <number|name>",
-            "reports-hub",
-            "reports-setup"
-        ],
-        "features": [
-            "List and open generated HTML reports",
-            "Interactive Reports Hub dashboard",
-            "Offline assets installer (CSS/JS stored locally)",
-            "Local styling via Pico.css and Highlight.js",
-            "Automatic asset fallback if download fails"
-        ],
-        "examples": [
-            ("reports", "Show available HTML reports"),
-            ("show-report 1", "Open the latest report by index"),
-            ("reports-hub", "Open Reports Hub dashboard"),
-            ("reports-setup", "Download local CSS/JS assets for offline mode")
-        ],
-        "tips": [
-            "Use 'reports-setup' once to install local assets",
-            "Reports are saved under the Reports folder",
-            "Reports Hub references local assets for offline viewing",
-            "If asset download fails, minimal inline styles are used"
-        ],
-        "storage": r"%userprofile%\.polsoft\psCli\reports",
-        "assets": r"%userprofile%\.polsoft\psCli\reports\assets"
-    },
-    
-    "integrate": {
-        "name": "integrate",
-        "category": "maintenance",
-        "description": "Automatyczna integracja: wykrywa moduły, tworzy metadane i rejestruje",
-        "aliases": ["autometadata", "genmeta"],
-        "syntax": ["integrate", "autometadata", "genmeta"],
-        "examples": [
-            ("integrate", "Detect and integrate new modules")
-        ],
-        "tips": [
-            "Automatically creates metadata in the metadata directory",
-            "Supports: plugins/, games/, ascii/, health/, tools/, install/"
-        ]
-    },
-    
-    "build": {
-        "name": "build",
-        "category": "build",
-        "description": "Build standalone psCLI.exe (PyInstaller onefile)",
-        "aliases": ["pack", "compress"],
-        "syntax": ["build", "pack", "compress"],
-        "examples": [
-            ("build", "Build psCLI.exe")
-        ],
-        "tips": [
-            "Adds icon if icon.ico exists",
-            "Includes data: plugins, games, metadata, ascii, health, tools, install"
-        ]
-    }
-}
-
+# The corpus lives in help_db.json; tools documented only by metadata/*.json are
+# added when the help cache is built.
 _root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+HELP_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "help_db.json")
+HELP_CACHE_DIR = CACHE_DIR
+HELP_INDEX_VERSION = 2
 _meta_dir = os.path.join(_root, "metadata")
 _dirs = {
     "ascii": os.path.join(_root, "ascii"),
@@ -893,58 +119,340 @@ _dirs = {
     "tools": os.path.join(_root, "tools"),
     "install": os.path.join(_root, "install"),
 }
+_TOOL_EXTS = (".bat", ".cmd", ".ps1", ".exe", ".vbs")
 
-def _augment_metadata_docs():
-    try:
-        if not os.path.exists(_meta_dir):
-            return
-        for mf in os.listdir(_meta_dir):
-            if not mf.lower().endswith(".json"):
-                continue
-            mp = os.path.join(_meta_dir, mf)
+class HelpIndex:
+    """The help corpus compiled into an indexed on-disk cache.
+
+    Entries are written one per line to help_entries.jsonl; help_index.json maps
+    every command and alias to its line's byte offset and lists the commands of
+    each category. Showing one entry reads the small index and a single line.
+    The cache is rebuilt when help_db.json, metadata/ or a tool folder changes;
+    load(deep=True) also notices metadata files edited in place.
+    """
+    def __init__(self, db_path=HELP_DB_PATH, cache_dir=HELP_CACHE_DIR, meta_dir=_meta_dir, tool_dirs=_dirs):
+        self.db_path = db_path
+        self.cache_dir = cache_dir
+        self.meta_dir = meta_dir
+        self.tool_dirs = tool_dirs
+        self.entries_path = os.path.join(cache_dir, "help_entries.jsonl")
+        self.index_path = os.path.join(cache_dir, "help_index.json")
+        self._index = None
+        self._memory = None
+
+    def _source_stamp(self):
+        stamp = []
+        for path in [self.db_path, self.meta_dir] + list(self.tool_dirs.values()):
             try:
-                with open(mp, "r", encoding="utf-8") as fh:
-                    md = json.load(fh)
-            except:
+                st = os.stat(path)
+                stamp.append([st.st_mtime_ns, st.st_size])
+            except OSError:
+                stamp.append(None)
+        return stamp
+
+    def _metadata_stamps(self):
+        stamps = {}
+        try:
+            with os.scandir(self.meta_dir) as it:
+                for de in it:
+                    if de.name.lower().endswith(".json"):
+                        st = de.stat()
+                        stamps[de.name] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            pass
+        return stamps
+
+    def load(self, deep=False):
+        """The index (offsets, aliases, categories), rebuilt if its sources changed.
+
+        Folder mtimes only change when files are added or removed; deep=True
+        also stats every metadata file.
+        """
+        stamp = self._source_stamp()
+        index = self._index if self._index is not None and self._index["stamp"] == stamp else None
+        if index is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                if (index.get("version") != HELP_INDEX_VERSION or index.get("stamp") != stamp
+                        or os.path.getsize(self.entries_path) != index.get("size")):
+                    index = None
+            except (OSError, ValueError):
+                index = None
+        if index is not None and deep and index["files"] != self._metadata_stamps():
+            index = None
+        if index is not None and index is self._index:
+            return index
+        if index is None:
+            index = self._build(stamp)
+        else:
+            self._memory = None
+        self._index = index
+        return index
+
+    def _metadata_entries(self, known):
+        """Entries for tools described only by metadata/*.json."""
+        listings = {}
+        for dname, dpath in self.tool_dirs.items():
+            try:
+                listings[dname] = {f.lower() for f in os.listdir(dpath)}
+            except OSError:
+                pass
+        entries = {}
+        try:
+            files = os.listdir(self.meta_dir)
+        except OSError:
+            return entries
+        for mf in files:
+            if not mf.lower().endswith(".json"):
                 continue
             base = os.path.splitext(mf)[0]
             k = base.lower()
             k_nice = k.replace(".bat", "").replace(".cmd", "").replace(".ps1", "").replace(".exe", "").replace(".vbs", "")
-            if k in PLUGINS_DB or k_nice in PLUGINS_DB:
+            if k in known or k_nice in known:
                 continue
-            found_path = None
-            for dname, dpath in _dirs.items():
-                candidates = [
-                    os.path.join(dpath, base),
-                    os.path.join(dpath, k_nice + ".bat"),
-                    os.path.join(dpath, k_nice + ".cmd"),
-                    os.path.join(dpath, k_nice + ".ps1"),
-                    os.path.join(dpath, k_nice + ".exe"),
-                    os.path.join(dpath, k_nice + ".vbs"),
-                ]
-                if any(os.path.exists(p) for p in candidates):
-                    found_path = dname
-                    break
+            candidates = [k] + [k_nice + ext for ext in _TOOL_EXTS]
+            found_path = next((d for d, names in listings.items() if any(c in names for c in candidates)), None)
             if not found_path:
                 continue
+            try:
+                with open(os.path.join(self.meta_dir, mf), "r", encoding="utf-8") as fh:
+                    md = json.load(fh)
+            except Exception:
+                continue
             name_key = k_nice
             syntax = [name_key]
             if base != name_key:
                 syntax.append(base)
-            PLUGINS_DB[name_key] = {
+            entries[name_key] = {
                 "name": name_key,
                 "category": md.get("category", found_path),
                 "description": md.get("desc", "Tool"),
                 "aliases": md.get("aliases", []),
                 "syntax": syntax,
-                "examples": [(f"{'hack' if found_path=='tools' else found_path} {name_key}", "Launch")],
+                "examples": [[f"{'hack' if found_path=='tools' else found_path} {name_key}", "Launch"]],
                 "tips": ["Auto-documented from metadata", f"Loaded from /{found_path}/"],
                 "group": md.get("group", found_path)
             }
-    except:
-        pass
+        return entries
+
+    def _build(self, stamp):
+        with open(self.db_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        entries.update(self._metadata_entries(entries))
+        entries = dict(sorted(entries.items()))
+
+        offsets, aliases, categories, checksums = {}, {}, {}, {}
+        lines = []
+        pos = 0
+        for key, info in entries.items():
+            line = (json.dumps(info, ensure_ascii=False) + "\n").encode("utf-8")
+            offsets[key] = [pos, len(line)]
+            checksums[key] = zlib.crc32(line)
+            pos += len(line)
+            lines.append(line)
+            categories.setdefault(info.get("category", "other"), []).append([key, info.get("description", "")])
+            for alias in info.get("aliases", []):
+                aliases.setdefault(str(alias).lower(), key)
+        # checksums let the search index re-read only the entries that changed
+        index = {"version": HELP_INDEX_VERSION, "stamp": stamp, "size": pos, "offsets": offsets,
+                 "aliases": aliases, "categories": categories, "checksums": checksums,
+                 "files": self._metadata_stamps()}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for path, data in ((self.entries_path, b"".join(lines)),
+                               (self.index_path, json.dumps(index, ensure_ascii=False).encode("utf-8"))):
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            self._memory = None
+        except OSError:
+            # Read-only settings folder: serve this session from memory
+            self._memory = entries
+        return index
 
-_augment_metadata_docs()
+    def resolve(self, name):
+        """Documented command for a command name or alias, or None."""
+        index = self.load()
+        key = str(name).lower()
+        if key in index["offsets"]:
+            return key
+        return index["aliases"].get(key)
+
+    def get(self, name):
+        """Help entry for a command name or alias, or None."""
+        key = self.resolve(name)
+        if key is None:
+            return None
+        if self._memory is not None:
+            return self._memory[key]
+        offset, length = self._index["offsets"][key]
+        try:
+            with open(self.entries_path, "rb") as f:
+                f.seek(offset)
+                return json.loads(f.read(length).decode("utf-8"))
+        except (OSError, ValueError):
+            # Replaced under us by another process; rebuild and serve from memory
+            self._index = self._build(self._source_stamp())
+            return self._memory[key] if self._memory is not None else self.get(name)
+
+    def names(self):
+        return list(self.load()["offsets"])
+
+    def categories(self):
+        """{category: [[command, description], ...]} without loading any entry."""
+        return self.load()["categories"]
+
+    def entries(self):
+        """Yield (command, entry) in name order, reading the cache line by line."""
+        self.load()
+        if self._memory is not None:
+            yield from self._memory.items()
+            return
+        with open(self.entries_path, "r", encoding="utf-8") as f:
+            for key, line in zip(self._index["offsets"], f):
+                yield key, json.loads(line)
+
+HELP = HelpIndex()
+
+# ======================== FULL-TEXT SEARCH ========================
+
+_TOKEN_RE = re.compile(r"\w+")
+SEARCH_INDEX_VERSION = 1
+
+def _tokens(text):
+    return [t for t in _TOKEN_RE.findall(str(text).lower()) if len(t) > 1 or t.isdigit()]
+
+def _field_texts(info):
+    """(field, text) pairs of an entry that are searched and quoted in snippets."""
+    yield "name", info.get("name", "")
+    for alias in info.get("aliases", []):
+        yield "aliases", alias
+    yield "description", info.get("description", "")
+    for field in ("syntax", "options", "features", "tips"):
+        for text in info.get(field, []):
+            yield field, text
+    for example in info.get("examples", []):
+        yield "examples", " - ".join(example)
+
+class HelpSearch:
+    """BM25-ranked search over the help corpus (`help search <terms>`).
+
+    The inverted index is kept in help_search.json next to the help cache and
+    updated entry by entry: only entries whose checksum in the help index
+    changed are re-read and re-tokenized.
+    """
+    K1 = 1.2
+    B = 0.75
+    FIELD_WEIGHTS = {"name": 3.0, "aliases": 3.0, "description": 2.0}
+
+    def __init__(self, help_index):
+        self.help = help_index
+        self.path = os.path.join(help_index.cache_dir, "help_search.json")
+        self._data = None
+
+    def _load(self):
+        if self._data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != SEARCH_INDEX_VERSION:
+                    raise ValueError("old search index")
+            except (OSError, ValueError):
+                data = {"version": SEARCH_INDEX_VERSION, "docs": {}, "postings": {}}
+            self._data = data
+        return self._data
+
+    def _remove(self, key):
+        data = self._data
+        doc = data["docs"].pop(key, None)
+        for term in (doc or {}).get("terms", []):
+            posting = data["postings"].get(term)
+            if posting is not None:
+                posting.pop(key, None)
+                if not posting:
+                    del data["postings"][term]
+
+    def _add(self, key, info, checksum):
+        weights = {}
+        for field, text in _field_texts(info):
+            w = self.FIELD_WEIGHTS.get(field, 1.0)
+            for term in _tokens(text):
+                weights[term] = weights.get(term, 0.0) + w
+        for term, tf in weights.items():
+            self._data["postings"].setdefault(term, {})[key] = tf
+        self._data["docs"][key] = {"checksum": checksum, "length": sum(weights.values()), "terms": sorted(weights)}
+
+    def sync(self):
+        """Bring the index up to date with the help corpus; returns the number of entries updated."""
+        checksums = self.help.load(deep=True)["checksums"]
+        data = self._load()
+        docs = data["docs"]
+        removed = [k for k in docs if k not in checksums]
+        changed = [k for k, c in checksums.items() if docs.get(k, {}).get("checksum") != c]
+        for key in removed + changed:
+            self._remove(key)
+        for key in changed:
+            self._add(key, self.help.get(key), checksums[key])
+        if removed or changed:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                tmp = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                os.replace(tmp, self.path)
+            except OSError:
+                pass
+        return len(removed) + len(changed)
+
+    def _expand(self, term):
+        """The term itself, or the indexed terms it is a prefix of (e.g. "netw" -> "network")."""
+        postings = self._data["postings"]
+        if term in postings:
+            return [term]
+        return [t for t in postings if t.startswith(term)]
+
+    def search(self, query, limit=10):
+        """[(score, command, matched terms)] best first."""
+        self.sync()
+        data = self._data
+        docs = data["docs"]
+        if not docs:
+            return []
+        n = len(docs)
+        avg_len = sum(d["length"] for d in docs.values()) / n or 1.0
+        scores, matched = {}, {}
+        for qterm in dict.fromkeys(_tokens(query)):
+            for term in self._expand(qterm):
+                posting = data["postings"][term]
+                idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+                for key, tf in posting.items():
+                    norm = tf + self.K1 * (1 - self.B + self.B * docs[key]["length"] / avg_len)
+                    scores[key] = scores.get(key, 0.0) + idf * tf * (self.K1 + 1) / norm
+                    matched.setdefault(key, set()).add(term)
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+        return [(score, key, matched[key]) for key, score in ranked]
+
+def _snippet(info, terms, width=70, color=True):
+    """The entry text matching most of `terms`, cut to `width` around the first hit and highlighted."""
+    best, best_hits = info.get("description", ""), 0
+    for field, text in _field_texts(info):
+        if field in ("name", "aliases"):
+            continue
+        hits = len(terms & set(_tokens(text)))
+        if hits > best_hits:
+            best, best_hits = text, hits
+    text = " ".join(str(best).split())
+    if len(text) > width:
+        first = next((m.start() for m in _TOKEN_RE.finditer(text) if m.group().lower() in terms), 0)
+        start = max(0, min(first - width // 4, len(text) - width))
+        text = ("…" if start else "") + text[start:start + width].rstrip() + ("…" if start + width < len(text) else "")
+    if not color:
+        return text
+    return _TOKEN_RE.sub(lambda m: f"{YELLOW}{BOLD}{m.group()}{RESET}{GRAY}" if m.group().lower() in terms else m.group(), text)
+
+SEARCH = HelpSearch(HELP)
 
 # ======================== HELP ENGINE ========================
 
@@ -958,8 +466,8 @@ def _term_width(default=76):
 def format_section(title):
     return f"{YELLOW}{title.upper()}:{RESET}"
 
-def format_command(cmd, desc):
-    width = _term_width()
+def format_command(cmd, desc, width=None):
+    width = width or _term_width()
     cmd_col = 25
     prefix = f"  {GREEN}{cmd.ljust(cmd_col)}{RESET} "
     wrap_width = max(20, width - (cmd_col + 3))
@@ -972,8 +480,8 @@ def format_command(cmd, desc):
         lines.append(subsequent_indent + line)
     return "\n".join(lines)
 
-def format_tip(tip):
-    width = _term_width()
+def format_tip(tip, width=None):
+    width = width or _term_width()
     bullet = f"  {MAGENTA}-{RESET} "
     wrap_width = max(20, width - 6)
     return textwrap.fill(tip, width=wrap_width, initial_indent=bullet, subsequent_indent="    ")
@@ -983,189 +491,389 @@ def print_separator(char="=", length=75):
     print(f"{GRAY}{char * length}{RESET}")
 
 @command(name="help", aliases=["?", "h"])
-def show_help(cmd_name=None):
+def show_help(*args):
     """
     Main help command logic with comprehensive documentation.
     
     Usage:
         help              - Show all commands
-        help <command>    - Show detailed help for command
+        help <command>    - Show detailed help for command (or alias)
+        help <category>   - List the commands of a category
+        help search <terms> - Ranked full-text search
         ? <command>       - Shorthand for help
     """
+    cmd_name = " ".join(args).strip()
     
     if not cmd_name:
         # Show all commands grouped by category
         box_width = 82
-        print(f"\n{CYAN}{BOLD}{'╔' + '═' * 80 + '╗'}{RESET}")
+        out = []
+        out.append(f"\n{CYAN}{BOLD}{'╔' + '═' * 80 + '╗'}{RESET}")
         
         line1 = f"  🚀 TERMINAL CLI - HELP SYSTEM v{__version__}  "
         padding1 = 82 - len(line1) - 4
-        print(f"{CYAN}{BOLD}║ {line1}{' ' * max(0, padding1)}║{RESET}")
+        out.append(f"{CYAN}{BOLD}║ {line1}{' ' * max(0, padding1)}║{RESET}")
         
-        module_count = len(PLUGINS_DB)
+        categories = HELP.categories()
+        module_count = sum(len(cmds) for cmds in categories.values())
         line2 = f"  Professional CLI with {module_count} documented modules - Updated 2026-01-19  "
         padding2 = 82 - len(line2) - 4
-        print(f"{CYAN}{BOLD}║ {line2}{' ' * max(0, padding2)}║{RESET}")
+        out.append(f"{CYAN}{BOLD}║ {line2}{' ' * max(0, padding2)}║{RESET}")
         
-        print(f"{CYAN}{BOLD}{'╚' + '═' * 80 + '╝'}{RESET}\n")
+        out.append(f"{CYAN}{BOLD}{'╚' + '═' * 80 + '╝'}{RESET}\n")
         
         # Quick start section
-        print(f"{YELLOW}{BOLD}⭐ QUICK START:{RESET}")
-        print(f"  {GREEN}help{RESET}                - Show all available commands")
-        print(f"  {GREEN}help <cmd>{RESET}         - Get detailed help for a command")
-        print(f"  {GREEN}? <cmd>{RESET}            - Quick help shorthand")
-        print(f"  {GREEN}help all{RESET}           - Show complete help for all commands\n")
-        
-        # Group commands by category
-        categories = {}
-        for cmd, data in PLUGINS_DB.items():
-            cat = data.get("category", "other")
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append((cmd, data['description']))
+        out.append(f"{YELLOW}{BOLD}⭐ QUICK START:{RESET}")
+        out.append(f"  {GREEN}help{RESET}                - Show all available commands")
+        out.append(f"  {GREEN}help <cmd>{RESET}         - Get detailed help for a command")
+        out.append(f"  {GREEN}? <cmd>{RESET}            - Quick help shorthand")
+        out.append(f"  {GREEN}help search <terms>{RESET} - Find commands by keyword")
+        out.append(f"  {GREEN}help all{RESET}           - Show complete help for all commands\n")
         
         # Display categories with visual separators
         for cat in sorted(categories.keys()):
-            print(f"{MAGENTA}{BOLD}▶ {cat.upper()}{RESET}")
-            for cmd, desc in sorted(categories[cat]):
-                print(format_command(cmd, desc))
-            print()
+            out.extend(_render_category(cat, categories[cat]))
         
         # Footer information
-        print(f"{CYAN}{BOLD}{'─' * 82}{RESET}")
-        print(f"{GRAY}💡 Tip: Type {GREEN}'help <command>'{RESET}{GRAY} for detailed information about a command.{RESET}")
-        print(f"{GRAY}📚 All commands are case-insensitive and support aliases!{RESET}\n")
-        print(f"{GRAY}Type 'help all' to see complete documentation for all commands.{RESET}\n")
+        out.append(f"{CYAN}{BOLD}{'─' * 82}{RESET}")
+        out.append(f"{GRAY}💡 Tip: Type {GREEN}'help <command>'{RESET}{GRAY} for detailed information about a command.{RESET}")
+        out.append(f"{GRAY}📚 All commands are case-insensitive and support aliases!{RESET}\n")
+        out.append(f"{GRAY}Type 'help all' to see complete documentation for all commands.{RESET}\n")
+        emit("\n".join(out) + "\n")
         return
     
+    if args and args[0].lower() == "search":
+        return search_help(" ".join(args[1:]))
+
     # Show help for "all" command
     if cmd_name.lower() == "all":
-        print(f"\n{CYAN}{BOLD}📖 COMPLETE COMMAND DOCUMENTATION{RESET}")
-        print(f"{CYAN}{BOLD}{'═' * 82}{RESET}\n")
-        
-        for cmd_name_sorted in sorted(PLUGINS_DB.keys()):
-            _display_command_help(cmd_name_sorted)
-        return
+        return show_all()
     
-    # Show help for specific command
+    # Show help for specific command (or alias), else for a whole category
     cmd_name = cmd_name.lower()
-    _display_command_help(cmd_name)
+    if HELP.resolve(cmd_name) is None:
+        categories = {cat.lower(): (cat, cmds) for cat, cmds in HELP.categories().items()}
+        if cmd_name in categories:
+            emit("\n" + "\n".join(_render_category(*categories[cmd_name])) + "\n")
+            return
+    emit(_render_command_help(cmd_name))
 
-def _display_command_help(cmd_name):
-    """Display detailed help for a specific command."""
-    if cmd_name not in PLUGINS_DB:
-        print(f"\n{RED}❌ Error: Command '{cmd_name}' is not yet documented.{RESET}")
-        print(f"{GRAY}Available commands: {', '.join(sorted(PLUGINS_DB.keys()))}{RESET}\n")
-        return
-    
-    info = PLUGINS_DB[cmd_name]
-    print(f"{CYAN}{BOLD}{'╔' + '═' * 80 + '╗'}{RESET}")
-    print(f"{CYAN}{BOLD}║  📚 {info['name'].upper().ljust(75)} ║{RESET}")
-    print(f"{CYAN}{BOLD}{'╚' + '═' * 80 + '╝'}{RESET}\n")
+def search_help(query):
+    """help search <terms> - ranked matches with highlighted snippets."""
+    if not _tokens(query):
+        print(f"{YELLOW}Usage: help search <terms>{RESET}")
+        return 1
+    results = SEARCH.search(query)
+    if current_format() != "table":
+        emit_rows({"rank": i, "name": key, "category": HELP.get(key).get("category"), "score": round(score, 3),
+                   "snippet": _snippet(HELP.get(key), terms, color=False)}
+                  for i, (score, key, terms) in enumerate(results, 1))
+        return 0
+    if not results:
+        print(f"{GRAY}No help entries match '{query}'.{RESET}")
+        return 0
+    width = _term_width()
+    out = [f"\n{CYAN}{BOLD}🔍 HELP SEARCH:{RESET} {query}\n"]
+    for i, (score, key, terms) in enumerate(results, 1):
+        info = HELP.get(key)
+        out.append(f"{GRAY}{i:>3}.{RESET} {GREEN}{BOLD}{key}{RESET} {GRAY}({info.get('category', 'other')}) {score:.2f}{RESET}")
+        out.append(f"     {GRAY}{_snippet(info, terms, width=max(30, width - 8))}{RESET}")
+    out.append(f"\n{GRAY}Type 'help <command>' for the full entry.{RESET}\n")
+    emit("\n".join(out) + "\n")
+    return 0
+
+def _render_category(cat, commands):
+    """Heading and one line per command of a category (overview and `help <category>`)."""
+    out = [f"{MAGENTA}{BOLD}▶ {cat.upper()}{RESET}"]
+    for cmd, desc in sorted(commands):
+        out.append(format_command(cmd, desc))
+    out.append("")
+    return out
+
+def _render_command_help(cmd_name):
+    """Detailed help for a specific command (or alias) as one string."""
+    key = HELP.resolve(cmd_name)
+    if key is None:
+        out = [f"\n{RED}❌ Error: Command '{cmd_name}' is not yet documented.{RESET}"]
+        out.append(f"{GRAY}Available commands: {', '.join(HELP.names())}{RESET}\n")
+        return "\n".join(out) + "\n"
+    return render_entry(key)
+
+def _render_entry(info, width=None):
+    width = width or _term_width()
+    out = []
+    out.append(f"{CYAN}{BOLD}{'╔' + '═' * 80 + '╗'}{RESET}")
+    out.append(f"{CYAN}{BOLD}║  📚 {info['name'].upper().ljust(75)} ║{RESET}")
+    out.append(f"{CYAN}{BOLD}{'╚' + '═' * 80 + '╝'}{RESET}\n")
     
     # Description
-    width = _term_width()
     desc_wrapped = textwrap.fill(info['description'], width=max(40, width - 2))
-    print(f"{WHITE}{BOLD}{desc_wrapped}{RESET}\n")
+    out.append(f"{WHITE}{BOLD}{desc_wrapped}{RESET}\n")
     
     # Aliases if available
     if "aliases" in info and info["aliases"]:
         aliases_str = ", ".join(f"{GREEN}{a}{RESET}" for a in info["aliases"])
-        print(f"{YELLOW}🏷️  Aliases:{RESET} {aliases_str}\n")
+        out.append(f"{YELLOW}🏷️  Aliases:{RESET} {aliases_str}\n")
     
     # Authors if available
     if "authors" in info and info["authors"]:
         authors_str = ", ".join(info["authors"])
-        print(f"{YELLOW}✍️  Authors:{RESET} {authors_str}\n")
+        out.append(f"{YELLOW}✍️  Authors:{RESET} {authors_str}\n")
     
     # Syntax
-    print(format_section("💻 Syntax"))
+    out.append(format_section("💻 Syntax"))
     for syntax_line in info['syntax']:
-        syn_wrapped = textwrap.fill(syntax_line, width=max(40, _term_width() - 4), initial_indent="  ", subsequent_indent="  ")
-        print(f"{GREEN}{syn_wrapped}{RESET}")
-    print()
+        syn_wrapped = textwrap.fill(syntax_line, width=max(40, width - 4), initial_indent="  ", subsequent_indent="  ")
+        out.append(f"{GREEN}{syn_wrapped}{RESET}")
+    out.append("")
     
     # Options
     if "options" in info:
-        print(format_section("⚙️  Options"))
+        out.append(format_section("⚙️  Options"))
         for opt in info['options']:
-            opt_wrapped = textwrap.fill(opt, width=max(40, _term_width() - 4), initial_indent="  ", subsequent_indent="  ")
-            print(f"{BLUE}{opt_wrapped}{RESET}")
-        print()
+            opt_wrapped = textwrap.fill(opt, width=max(40, width - 4), initial_indent="  ", subsequent_indent="  ")
+            out.append(f"{BLUE}{opt_wrapped}{RESET}")
+        out.append("")
     
     # Features
     if "features" in info:
-        print(format_section("✨ Features"))
+        out.append(format_section("✨ Features"))
         for feature in info['features']:
-            print(format_tip(feature))
-        print()
+            out.append(format_tip(feature, width))
+        out.append("")
     
     # Supported types
     if "supported_types" in info:
-        print(format_section("📄 Supported Types"))
+        out.append(format_section("📄 Supported Types"))
         types_str = ", ".join(info["supported_types"])
-        types_wrapped = textwrap.fill(types_str, width=max(40, _term_width() - 4), initial_indent="  ", subsequent_indent="  ")
-        print(f"{types_wrapped}\n")
+        types_wrapped = textwrap.fill(types_str, width=max(40, width - 4), initial_indent="  ", subsequent_indent="  ")
+        out.append(f"{types_wrapped}\n")
     
     # Color palette
     if "color_palette" in info:
-        print(format_section("🎨 Color Palette"))
+        out.append(format_section("🎨 Color Palette"))
         for color in info["color_palette"]:
-            print(format_tip(color))
-        print()
+            out.append(format_tip(color, width))
+        out.append("")
     
     # Examples
-    print(format_section("📋 Examples"))
+    out.append(format_section("📋 Examples"))
     for cmd, desc in info['examples']:
-        print(format_command(cmd, desc))
-    print()
+        out.append(format_command(cmd, desc, width))
+    out.append("")
     
     # Shortcuts
     if "shortcuts" in info:
-        print(format_section("⌨️  Keyboard Shortcuts"))
+        out.append(format_section("⌨️  Keyboard Shortcuts"))
         for shortcut in info["shortcuts"]:
-            print(format_tip(shortcut))
-        print()
+            out.append(format_tip(shortcut, width))
+        out.append("")
     
     # Tips
     if "tips" in info:
-        print(format_section("💡 Pro Tips"))
+        out.append(format_section("💡 Pro Tips"))
         for tip in info['tips']:
-            print(format_tip(tip))
-        print()
+            out.append(format_tip(tip, width))
+        out.append("")
     
     # Additional information
     if "storage" in info:
-        print(f"{GRAY}💾 DATA LOCATION:{RESET} {info['storage']}")
+        out.append(f"{GRAY}💾 DATA LOCATION:{RESET} {info['storage']}")
     
     if "output" in info:
-        print(f"{GRAY}📤 OUTPUT:{RESET} {info['output']}")
+        out.append(f"{GRAY}📤 OUTPUT:{RESET} {info['output']}")
     
     if "output_format" in info:
-        print(f"{GRAY}📊 OUTPUT FORMAT:{RESET} {info['output_format']}")
+        out.append(f"{GRAY}📊 OUTPUT FORMAT:{RESET} {info['output_format']}")
     
     if "pagination" in info:
-        print(f"{GRAY}📑 PAGINATION:{RESET} {info['pagination']}")
+        out.append(f"{GRAY}📑 PAGINATION:{RESET} {info['pagination']}")
     
     if "performance" in info:
-        print(f"{GRAY}⚡ PERFORMANCE:{RESET} {info['performance']}")
+        out.append(f"{GRAY}⚡ PERFORMANCE:{RESET} {info['performance']}")
     
     if "automation" in info:
-        print(f"{GRAY}🔄 AUTOMATION:{RESET} {info['automation']}")
+        out.append(f"{GRAY}🔄 AUTOMATION:{RESET} {info['automation']}")
     
     if "requires" in info:
-        print(f"{GRAY}📦 REQUIREMENTS:{RESET} {info['requires']}")
+        out.append(f"{GRAY}📦 REQUIREMENTS:{RESET} {info['requires']}")
     
     # Available games
     if "available_games" in info:
-        print(f"\n{YELLOW}🎮 Available Games:{RESET}")
+        out.append(f"\n{YELLOW}🎮 Available Games:{RESET}")
         for game in info["available_games"]:
-            print(f"  {MAGENTA}▸{RESET} {game}")
+            out.append(f"  {MAGENTA}▸{RESET} {game}")
     
-    print(f"\n{CYAN}{BOLD}{'─' * 82}{RESET}\n")
+    out.append(f"\n{CYAN}{BOLD}{'─' * 82}{RESET}\n")
+    return "\n".join(out) + "\n"
+
+# ======================== RENDER CACHE & PAGER ========================
+
+@cached(maxsize=512)
+def _render_cached(key, checksum, width, color):
+    """One entry rendered for a terminal width and colour mode.
+
+    The checksum of the entry's cache line is part of the key, so an edited
+    entry is rendered again instead of served stale.
+    """
+    text = _render_entry(HELP.get(key), width)
+    return text if color else strip_ansi(text)
+
+def render_entry(key, width=None, color=None):
+    """Rendered help for a documented command, from the render cache."""
+    width = width or _term_width()
+    color = use_color() if color is None else color
+    return _render_cached(key, HELP.load()["checksums"].get(key), width, color)
+
+def iter_rendered(width=None, color=None):
+    """Yield (command, rendered text) in name order, rendering each entry only when asked for."""
+    width = width or _term_width()
+    color = use_color() if color is None else color
+    index = HELP.load()
+    for key in list(index["offsets"]):
+        yield key, _render_cached(key, index["checksums"].get(key), width, color)
+
+def _interactive():
+    try:
+        return sys.stdout.isatty() and sys.stdin.isatty() and current_format() == "table"
+    except (AttributeError, ValueError):
+        return False
+
+def show_all():
+    """help all - every entry, paged on a console and streamed entry by entry otherwise."""
+    width, color = _term_width(), use_color()
+    header = f"\n{CYAN}{BOLD}📖 COMPLETE COMMAND DOCUMENTATION{RESET}\n{CYAN}{BOLD}{'═' * 82}{RESET}\n\n"
+    chunks = iter_rendered(width, color)
+    if _interactive():
+        return HelpPager(itertools.chain([(None, header)], chunks)).run()
+    emit(header)
+    for _, text in chunks:
+        emit(text)
+
+class HelpPager:
+    """Page through (command, text) chunks, pulling chunks only as far as needed.
+
+    The first page shows as soon as its entries are rendered; the rest are
+    rendered while scrolling, searching or jumping. Commands at the prompt:
+    Enter/space next page, b previous page, g top, /text search, n/N next or
+    previous match, :command jump to an entry, q quit.
+    """
+    PROMPT = "-- {pos} -- [Enter] more  b back  /text search  n/N match  :cmd jump  q quit: "
+
+    def __init__(self, chunks, height=None, stream=None, read=input):
+        self._chunks = iter(chunks)
+        self.height = height or max(5, shutil.get_terminal_size((80, 24)).lines - 1)
+        self.stream = stream
+        self.read = read
+        self.lines = []
+        self._plain = []
+        self.starts = {}
+        self.done = False
+        self.pattern = None
+        self.message = ""
+
+    def _pull(self):
+        """Render one more chunk; False once they are exhausted."""
+        if self.done:
+            return False
+        try:
+            key, text = next(self._chunks)
+        except StopIteration:
+            self.done = True
+            return False
+        if key is not None:
+            self.starts[key] = len(self.lines)
+        new = text.split("\n")
+        if new and new[-1] == "":
+            new.pop()
+        self.lines.extend(new)
+        self._plain.extend(strip_ansi(line).lower() for line in new)
+        return True
+
+    def _fill(self, count):
+        while len(self.lines) < count and self._pull():
+            pass
+
+    def _find(self, start, step):
+        """Line of the next match of self.pattern from `start` in direction `step`, or None."""
+        i = start
+        while True:
+            if i < 0:
+                return None
+            if i >= len(self.lines) and not self._pull():
+                return None
+            if i < len(self.lines):
+                if self.pattern in self._plain[i]:
+                    return i
+                i += step
+
+    def _jump(self, name):
+        key = HELP.resolve(name)
+        if key is None:
+            name = name.lower()
+            key = next((k for k in HELP.names() if k.startswith(name)), None)
+        if key is None:
+            self.message = f"No entry '{name}'"
+            return None
+        while key not in self.starts and self._pull():
+            pass
+        return self.starts.get(key)
+
+    def _position(self, top):
+        current = None
+        for key, start in self.starts.items():
+            if start > top:
+                break
+            current = key
+        total = "" if self.done else "+"
+        where = f"{current}, " if current else ""
+        return f"{where}line {top + 1}/{len(self.lines)}{total}"
+
+    def run(self):
+        top = 0
+        while True:
+            self._fill(top + self.height + 1)
+            page = self.lines[top:top + self.height]
+            emit("\n".join(page) + "\n", stream=self.stream)
+            if self.done and top + self.height >= len(self.lines):
+                return
+            prompt = self.PROMPT.format(pos=self._position(top))
+            if self.message:
+                prompt = f"{self.message}. {prompt}"
+                self.message = ""
+            try:
+                reply = self.read(f"{GRAY}{prompt}{RESET}" if use_color(self.stream) else prompt)
+            except (EOFError, KeyboardInterrupt):
+                emit("\n", stream=self.stream)
+                return
+            reply = reply.strip()
+            if reply in ("q", "Q"):
+                return
+            if reply in ("", " ", "f"):
+                top += self.height
+            elif reply == "b":
+                top = max(0, top - self.height)
+            elif reply == "g":
+                top = 0
+            elif reply.startswith("/") or reply in ("n", "N"):
+                if reply.startswith("/"):
+                    self.pattern = reply[1:].strip().lower() or self.pattern
+                    found = self._find(top, 1) if self.pattern else None
+                elif self.pattern is None:
+                    self.message = "No search pattern"
+                    continue
+                else:
+                    found = self._find(top + 1, 1) if reply == "n" else self._find(top - 1, -1)
+                if found is None:
+                    self.message = f"Pattern not found: {self.pattern}"
+                else:
+                    top = found
+            elif reply.startswith(":"):
+                found = self._jump(reply[1:].strip())
+                if found is not None:
+                    top = found
+            else:
+                self.message = f"Unknown key '{reply}'"
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        show_help(sys.argv[1])
-    else:
-        show_help()
+    show_help(*sys.argv[1:])
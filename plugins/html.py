@@ -1,8 +1,9 @@
 import os
 import webbrowser
 import datetime
+import http.client
 import urllib.request
-from cli import command, Color
+from cli import command, Color, gather_limited, run_async, run_blocking
 
 __author__ = "System"
 __category__ = "Reports"
@@ -15,28 +16,44 @@ ASSETS = {
     "css/highlight.min.css": "https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/default.min.css"
 }
 
+def _fetch_asset(rel, url, target, timeout=10):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp, open(target, "wb") as f:
+            f.write(resp.read())
+    except (OSError, ValueError, http.client.HTTPException):
+        # Offline, bad URL or broken response: fallback minimal content
+        if rel.endswith(".css"):
+            with open(target, "w", encoding="utf-8") as f:
+                f.write("/* fallback */ body{font-family:Segoe UI,Consolas,Courier New,monospace}")
+        elif rel.endswith(".js"):
+            with open(target, "w", encoding="utf-8") as f:
+                f.write("/* fallback */")
+
+async def _fetch_assets(missing):
+    await gather_limited(4, *(run_blocking(_fetch_asset, *m) for m in missing))
+
 def ensure_assets(reports_dir):
     """Download local CSS/JS assets to keep HTML portable and offline."""
     assets_dir = os.path.join(reports_dir, "assets")
     try:
         os.makedirs(assets_dir, exist_ok=True)
+        missing = []
         for rel, url in ASSETS.items():
             target = os.path.join(assets_dir, rel.replace("/", os.sep))
             os.makedirs(os.path.dirname(target), exist_ok=True)
             if not os.path.exists(target) or os.path.getsize(target) == 0:
-                try:
-                    urllib.request.urlretrieve(url, target)
-                except Exception:
-                    # Fallback minimal content
-                    if rel.endswith(".css"):
-                        with open(target, "w", encoding="utf-8") as f:
-                            f.write("/* fallback */ body{font-family:Segoe UI,Consolas,Courier New,monospace}")
-                    elif rel.endswith(".js"):
-                        with open(target, "w", encoding="utf-8") as f:
-                            f.write("/* fallback */")
-        return assets_dir
-    except Exception:
+                missing.append((rel, url, target))
+    except OSError:
         return None
+    if missing:
+        # Fetch all missing assets at once instead of one after another. Not caught:
+        # the RuntimeError raised when called from the event loop itself.
+        try:
+            run_async(_fetch_assets(missing))
+        except OSError:
+            # Neither the download nor the fallback file could be written
+            return None
+    return assets_dir
 
 
 def generate_reports_page(reports_dir):
@@ -9,7 +9,7 @@ import os
 import datetime
 import msvcrt
 import json
-from cli import command
+from cli import command, load_json_cached, invalidate_json_cache
 
 # ============================================
 #  PATH CONFIGURATION (TERMINAL CLI)
@@ -36,26 +36,21 @@ def load_settings():
         "last_src": os.getcwd(),
         "last_output": os.path.join(USER_PROFILE, "Desktop", "list.txt")
     }
-    if os.path.exists(GLOBAL_SETTINGS_FILE):
-        try:
-            with open(GLOBAL_SETTINGS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if "filelist_config" not in data:
-                    data["filelist_config"] = default
-                return data["filelist_config"]
-        except:
-            return default
-    return default
+    try:
+        data = load_json_cached(GLOBAL_SETTINGS_FILE, {})
+        if "filelist_config" not in data:
+            data["filelist_config"] = default
+        return data["filelist_config"]
+    except:
+        return default
 
 def save_settings(filelist_data):
     try:
-        full_settings = {}
-        if os.path.exists(GLOBAL_SETTINGS_FILE):
-            with open(GLOBAL_SETTINGS_FILE, "r", encoding="utf-8") as f:
-                full_settings = json.load(f)
+        full_settings = load_json_cached(GLOBAL_SETTINGS_FILE, {})
         full_settings["filelist_config"] = filelist_data
         with open(GLOBAL_SETTINGS_FILE, "w", encoding="utf-8") as f:
             json.dump(full_settings, f, indent=4)
+        invalidate_json_cache(GLOBAL_SETTINGS_FILE)
     except Exception as e:
         print(f"{RED}✖ Error updating terminal.json: {e}{RESET}")
 
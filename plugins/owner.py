@@ -1,17 +1,8 @@
 import os
-import getpass
-import platform
-import socket
 import json
 from datetime import datetime
-from cli import command, Color
-import urllib.request
+from cli import command, Color, Table, emit, emit_rows, current_format, terminal_width, load_json_cached, invalidate_json_cache, cached, network_info, SETTINGS_DIR
 import sys
-import uuid
-import subprocess
-import io
-import csv
-import re
 import version
 
 __author__ = "Sebastian Januchowski"
@@ -19,7 +10,10 @@ __category__ = "user info"
 __group__ = "system"
 __desc__ = "Owner and environment information"
 
+# Keyed on the interpreter, since python_version is part of the result
+@cached(ttl=86400, persist=True, key=lambda: sys.executable)
 def get_os_info():
+    import platform
     u = platform.uname()
     arch = platform.architecture()[0]
     pyv = platform.python_version()
@@ -39,44 +33,120 @@ def get_os_info():
         "build": build
     }
 
-def get_network_info():
-    def _local_ip():
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except:
-            try:
-                return socket.gethostbyname(socket.gethostname())
-            except:
-                return None
-    def _is_online():
-        try:
-            socket.create_connection(("1.1.1.1", 53), timeout=2).close()
-            return True
-        except:
-            return False
-    def _public_ip():
-        try:
-            with urllib.request.urlopen("https://api.ipify.org?format=json", timeout=3) as r:
-                data = json.loads(r.read().decode("utf-8"))
-                return data.get("ip")
-        except:
-            return None
-    def _mac():
-        try:
-            n = uuid.getnode()
-            return ":".join(f"{(n >> (i*8)) & 0xff:02x}" for i in reversed(range(6)))
-        except:
-            return None
-    info = {"local_ip": _local_ip(), "online": _is_online(), "mac": _mac()}
-    if info["online"]:
-        info["public_ip"] = _public_ip()
+def get_network_info(refresh=False):
+    """Local/public IP, connectivity and MAC; probed concurrently and cached on disk.
+
+    Shares the cache and the "network" settings with the menu header, so a
+    recent probe is reused; refresh=True (`owner --refresh`) probes again.
+    """
+    try:
+        options = load_json_cached(_settings_path(), {}).get("network") or {}
+    except Exception:
+        options = {}
+    info = network_info(options, refresh=refresh)
+    try:
+        info["mac"] = get_preferred_mac() or info.get("mac")
+    except Exception:
+        pass
     return info
 
-def get_interfaces():
+IFF_UP = 0x1
+IFF_LOOPBACK = 0x8
+
+def _interface_record(name, mac=None):
+    return {"name": name, "mac": mac, "ipv4": [], "ipv6": [], "up": None, "state": None, "mtu": None,
+            "default": False, "gateway": None, "rx_bytes": None, "rx_packets": None, "rx_errors": None,
+            "tx_bytes": None, "tx_packets": None, "tx_errors": None}
+
+def _read(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+def _hex_ipv4(value):
+    import ipaddress
+    return ipaddress.IPv4Address(int.from_bytes(bytes.fromhex(value), "little"))
+
+def read_sysfs_interfaces(root="/"):
+    """Interface records from /sys/class/net and /proc/net under `root`.
+
+    No processes are started; pass the root of a fake tree to test it.
+    """
+    import ipaddress
+    net_dir = os.path.join(root, "sys", "class", "net")
+    proc_dir = os.path.join(root, "proc", "net")
+    items = {}
+    flags = {}
+    for name in sorted(os.listdir(net_dir)):
+        base = os.path.join(net_dir, name)
+        it = _interface_record(name, (_read(os.path.join(base, "address")) or "").lower() or None)
+        try:
+            flags[name] = int(_read(os.path.join(base, "flags")) or "0", 16)
+        except ValueError:
+            flags[name] = 0
+        it["state"] = _read(os.path.join(base, "operstate"))
+        # Loopback and some virtual devices report "unknown" while up
+        it["up"] = bool(flags[name] & IFF_UP) and it["state"] != "down"
+        mtu = _read(os.path.join(base, "mtu"))
+        it["mtu"] = int(mtu) if mtu and mtu.isdigit() else None
+        items[name] = it
+
+    # Counters: "iface: rx_bytes rx_packets rx_errs ... tx_bytes tx_packets tx_errs ..."
+    for line in (_read(os.path.join(proc_dir, "dev")) or "").splitlines()[2:]:
+        name, _, data = line.partition(":")
+        fields = data.split()
+        it = items.get(name.strip())
+        if it is not None and len(fields) >= 11:
+            it["rx_bytes"], it["rx_packets"], it["rx_errors"] = (int(v) for v in fields[0:3])
+            it["tx_bytes"], it["tx_packets"], it["tx_errors"] = (int(v) for v in fields[8:11])
+
+    # Routes (little-endian hex) find the default interface and the subnet of each address
+    routes = []
+    for line in (_read(os.path.join(proc_dir, "route")) or "").splitlines()[1:]:
+        fields = line.split()
+        if len(fields) < 8 or fields[0] not in items:
+            continue
+        dest, gateway, mask = _hex_ipv4(fields[1]), _hex_ipv4(fields[2]), _hex_ipv4(fields[7])
+        if int(mask) == 0:
+            items[fields[0]]["default"] = True
+            items[fields[0]]["gateway"] = str(gateway)
+        else:
+            routes.append((int(mask), int(dest), fields[0]))
+    routes.sort(reverse=True)
+
+    # Local IPv4 addresses are the "/32 host LOCAL" entries of the FIB trie
+    local, last = [], None
+    for line in (_read(os.path.join(proc_dir, "fib_trie")) or "").splitlines():
+        line = line.strip()
+        if line.startswith("|--"):
+            last = line[3:].strip()
+        elif line == "/32 host LOCAL" and last and last not in local:
+            local.append(last)
+    loopback = [n for n, f in flags.items() if f & IFF_LOOPBACK]
+    for addr in local:
+        ip = ipaddress.IPv4Address(addr)
+        owner = next((name for mask, dest, name in routes if int(ip) & mask == dest), None)
+        if owner is None and ip.is_loopback and loopback:
+            owner = loopback[0]
+        if owner is not None:
+            items[owner]["ipv4"].append(addr)
+
+    # "address ifindex prefixlen scope flags name"
+    for line in (_read(os.path.join(proc_dir, "if_inet6")) or "").splitlines():
+        fields = line.split()
+        if len(fields) == 6 and fields[5] in items:
+            addr = ipaddress.IPv6Address(int(fields[0], 16))
+            items[fields[5]]["ipv6"].append(f"{addr}/{int(fields[2], 16)}")
+    return list(items.values())
+
+@cached(ttl=300)
+def _windows_interfaces():
+    import subprocess
+    import io
+    import csv
+    import re
     items = []
     try:
         out = subprocess.check_output(["getmac", "/v", "/fo", "csv"], encoding="utf-8", errors="ignore")
@@ -88,7 +158,7 @@ def get_interfaces():
                 mac_norm = mac.replace("-", ":").lower()
             else:
                 mac_norm = None
-            items.append({"name": name, "mac": mac_norm})
+            items.append(_interface_record(name, mac_norm))
     except Exception:
         try:
             out = subprocess.check_output(["ipconfig", "/all"], encoding="utf-8", errors="ignore")
@@ -104,52 +174,97 @@ def get_interfaces():
                     parts = l.split(":", 1)
                     mac = parts[1].strip() if len(parts) > 1 else ""
                     mac_norm = mac.replace("-", ":").lower() if mac else None
-                    items.append({"name": current, "mac": mac_norm})
+                    items.append(_interface_record(current, mac_norm))
                     current = None
         except Exception:
             pass
     return [i for i in items if i.get("name")]
 
+def get_interfaces(root=None):
+    """Network interfaces as records (name, mac, ipv4, ipv6, up, counters, ...).
+
+    Read natively from sysfs/procfs where available (Linux, or a fake tree at
+    `root`); otherwise parsed from `getmac` / `ipconfig /all`, which only fill
+    in name and MAC.
+    """
+    base = root or "/"
+    if os.path.isdir(os.path.join(base, "sys", "class", "net")):
+        try:
+            return read_sysfs_interfaces(base)
+        except OSError:
+            pass
+    if root is not None:
+        return []
+    return _windows_interfaces()
+
 def _settings_path():
-    return os.path.expandvars(r"%userprofile%\.polsoft\psCli\settings\terminal.json")
+    return os.path.join(SETTINGS_DIR, "terminal.json")
 
 def get_preferred_adapter():
     try:
-        p = _settings_path()
-        if os.path.exists(p):
-            with open(p, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return (data.get("network", {}) or {}).get("preferred_adapter")
+        data = load_json_cached(_settings_path(), {})
+        return (data.get("network", {}) or {}).get("preferred_adapter")
     except Exception:
         return None
 
 def set_preferred_adapter(name):
     try:
         p = _settings_path()
-        data = {}
-        if os.path.exists(p):
-            with open(p, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        data = load_json_cached(p, {})
         if "network" not in data:
             data["network"] = {}
         data["network"]["preferred_adapter"] = name
         os.makedirs(os.path.dirname(p), exist_ok=True)
         with open(p, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=4)
+        invalidate_json_cache(p)
         return True
     except Exception:
         return False
 
-def get_preferred_mac():
-    name = get_preferred_adapter()
-    if not name:
-        return None
-    for it in get_interfaces():
+def _find_interface(items, name):
+    for it in items:
         if it["name"].lower() == str(name).lower():
+            return it
+    return None
+
+def get_preferred_mac(interfaces=None):
+    """MAC of the preferred adapter, else of the interface holding the default route."""
+    items = get_interfaces() if interfaces is None else interfaces
+    name = get_preferred_adapter()
+    if name:
+        it = _find_interface(items, name)
+        return it["mac"] if it else None
+    for it in items:
+        if it["default"] and it["mac"] and it["mac"].strip("0:"):
             return it["mac"]
     return None
 
-def get_owner_info():
+def _fmt_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024.0
+
+def display_interfaces(items, preferred=None):
+    """Adapters as a table, or as rows with --json / --format=jsonl."""
+    def render(rows):
+        table = Table([("ADAPTER", None), ("STATE", 7), ("MAC", 17), ("IPV4", None), ("RX", 10), ("TX", None)])
+        for it in rows:
+            name = it["name"] + (" *" if preferred and it["name"].lower() == preferred.lower() else "")
+            state = ("-", "") if it["up"] is None else (("up", Color.GREEN) if it["up"] else ("down", Color.RED))
+            table.add_row((name, Color.CYAN), state, it.get("mac") or "-", ", ".join(it["ipv4"]) or "-",
+                          _fmt_bytes(it["rx_bytes"]), _fmt_bytes(it["tx_bytes"]))
+        note = f"Preferred: {preferred}\n" if preferred else ""
+        return f"{Color.CYAN}ADAPTERS & MAC{Color.RESET}\n" + table.render(max_width=terminal_width(), top_rule=False) + note
+    emit_rows(items, render=render)
+
+def get_owner_info(refresh=False):
+    import getpass
+    import platform
+    import socket
     username = getpass.getuser()
     
     metadata = {
@@ -159,7 +274,7 @@ def get_owner_info():
         "environment": version.NAME
     }
 
-    net = get_network_info()
+    net = get_network_info(refresh)
     osi = get_os_info()
 
     info = {
@@ -194,19 +309,19 @@ def save_metadata(info):
 
 @command(name="owner", aliases=["about", "me", "whoami"])
 def owner(*args):
-    data = get_owner_info()
+    refresh = "--refresh" in args
+    args = [a for a in args if a != "--refresh"]
+    if args and args[0].lower() == "mac":
+        data = None
+    else:
+        data = get_owner_info(refresh)
     if args and args[0].lower() == "save":
         p = save_metadata(data)
         print(f"{Color.GREEN}Saved:{Color.RESET} {p}")
         return
     if args and args[0].lower() == "mac":
         if len(args) == 1:
-            print(f"{Color.CYAN}ADAPTERS & MAC{Color.RESET}")
-            for it in get_interfaces():
-                print(f"- {it['name']}: {it.get('mac')}")
-            pref = get_preferred_adapter()
-            if pref:
-                print(f"Preferred: {pref}")
+            display_interfaces(get_interfaces(), get_preferred_adapter())
             return
         if args[1].lower() == "set" and len(args) >= 3:
             ok = set_preferred_adapter(" ".join(args[2:]))
@@ -217,12 +332,8 @@ def owner(*args):
             return
         # show MAC for specific adapter
         target = " ".join(args[1:])
-        mac = None
-        for it in get_interfaces():
-            if it["name"].lower() == target.lower():
-                mac = it.get("mac")
-                break
-        print(f"{Color.CYAN}{target}{Color.RESET} MAC: {mac}")
+        it = _find_interface(get_interfaces(), target)
+        print(f"{Color.CYAN}{target}{Color.RESET} MAC: {it.get('mac') if it else None}")
         return
     print(f"{Color.CYAN}OWNER INFORMATION{Color.RESET}")
     print(f"User: {data['user']['username']}")
@@ -247,6 +358,9 @@ def owner(*args):
     if data.get('network', {}).get('public_ip'):
         print(f"Public IP: {data['network']['public_ip']}")
     print(f"MAC: {data.get('network', {}).get('mac')}")
+    checked = data.get('network', {}).get('checked_at')
+    if checked:
+        print(f"{Color.GRAY}Network checked: {datetime.fromtimestamp(checked).strftime('%Y-%m-%d %H:%M:%S')} (owner --refresh to re-check){Color.RESET}")
 
 if __name__ == "__main__":
     data = get_owner_info()
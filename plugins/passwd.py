@@ -6,7 +6,7 @@ import importlib
 import json
 import getpass
 from pathlib import Path
-from cli import command, Color
+from cli import command, Color, load_json_cached, invalidate_json_cache
 
 __author__ = "Sebastian Januchowski"
 __category__ = "security"
@@ -61,12 +61,10 @@ def zapisz_haslo():
 
 def _load_protected():
     try:
-        if PROTECTED_FILE.exists():
-            with open(PROTECTED_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                lst = data.get("commands", [])
-                if isinstance(lst, list):
-                    return set([str(x).lower() for x in lst])
+        data = load_json_cached(str(PROTECTED_FILE), {})
+        lst = data.get("commands", [])
+        if isinstance(lst, list):
+            return set([str(x).lower() for x in lst])
     except:
         pass
     return set()
@@ -74,27 +72,23 @@ def _load_protected():
 def _save_protected(names):
     try:
         SCIEZKA.mkdir(parents=True, exist_ok=True)
-        base = {}
-        if PROTECTED_FILE.exists():
-            try:
-                with open(PROTECTED_FILE, "r", encoding="utf-8") as rf:
-                    base = json.load(rf)
-            except:
-                base = {}
+        try:
+            base = load_json_cached(str(PROTECTED_FILE), {})
+        except:
+            base = {}
         base["commands"] = sorted(list(names))
         with open(PROTECTED_FILE, "w", encoding="utf-8") as f:
             json.dump(base, f, ensure_ascii=False, indent=2)
+        invalidate_json_cache(str(PROTECTED_FILE))
     except:
         pass
 
 def _load_protected_modules():
     try:
-        if PROTECTED_FILE.exists():
-            with open(PROTECTED_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                lst = data.get("modules", [])
-                if isinstance(lst, list):
-                    return set([str(x).lower() for x in lst])
+        data = load_json_cached(str(PROTECTED_FILE), {})
+        lst = data.get("modules", [])
+        if isinstance(lst, list):
+            return set([str(x).lower() for x in lst])
     except:
         pass
     return set()
@@ -102,16 +96,14 @@ def _load_protected_modules():
 def _save_protected_modules(names):
     try:
         SCIEZKA.mkdir(parents=True, exist_ok=True)
-        base = {}
-        if PROTECTED_FILE.exists():
-            try:
-                with open(PROTECTED_FILE, "r", encoding="utf-8") as rf:
-                    base = json.load(rf)
-            except:
-                base = {}
+        try:
+            base = load_json_cached(str(PROTECTED_FILE), {})
+        except:
+            base = {}
         base["modules"] = sorted(list(names))
         with open(PROTECTED_FILE, "w", encoding="utf-8") as f:
             json.dump(base, f, ensure_ascii=False, indent=2)
+        invalidate_json_cache(str(PROTECTED_FILE))
     except:
         pass
 
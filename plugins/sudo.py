@@ -3,7 +3,7 @@ import json
 import ctypes
 import sys
 from datetime import datetime
-from cli import command
+from cli import command, SETTINGS_DIR
 
 # --- METADATA & SETTINGS ---
 __metadata__ = {
@@ -20,7 +20,8 @@ __category__ = "system"
 __group__ = "core"
 __desc__ = "Execute programs with administrator privileges"
 
-SETTINGS_FILE = os.path.expandvars(r"%userprofile%\.polsoft\psCli\settings\terminal.json")
+# One JSON object per line; appending keeps the log out of terminal.json
+LOG_FILE = os.path.join(SETTINGS_DIR, "sudo_log.jsonl")
 
 def show_help():
     """Wyświetla dokumentację modułu sudo."""
@@ -29,7 +30,7 @@ def show_help():
 --------------------------------------------------
 OPIS:
     Moduł służy do eskalacji uprawnień dla aplikacji i skryptów.
-    Wszystkie operacje są logowane do terminal.json.
+    Wszystkie operacje są logowane do sudo_log.jsonl.
 
 SKŁADNIA:
     sudo <command> [args]
@@ -44,7 +45,7 @@ UPRAWNIENIA:
     - {', '.join(__metadata__['permissions'])}
 
 LOGI:
-    {SETTINGS_FILE}
+    {LOG_FILE}
 --------------------------------------------------
     """
     print(help_text)
@@ -54,7 +55,6 @@ def is_admin():
     except: return False
 
 def log_action(action_type, target):
-    log_path = os.path.expandvars(SETTINGS_FILE)
     entry = {
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "action": action_type,
@@ -62,13 +62,9 @@ def log_action(action_type, target):
         "status": "elevated_execution"
     }
     try:
-        data = {}
-        if os.path.exists(log_path):
-            with open(log_path, "r") as f: data = json.load(f)
-        if "execution_logs" not in data: data["execution_logs"] = []
-        data["execution_logs"].append(entry)
-        with open(log_path, "w") as f: json.dump(data, f, indent=4)
-    except: pass
+        with open(LOG_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    except OSError: pass
 
 def execute(command, args=None):
     if args is None: args = []
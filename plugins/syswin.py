@@ -1,5 +1,5 @@
 # Import decorator from main CLI file
-from cli import command
+from cli import command, cached
 import ctypes
 import shutil
 import platform
@@ -125,12 +125,16 @@ def display_drive_info():
                 continue
     print("")
 
+@cached(ttl=5)
+def _running_tasks():
+    output = subprocess.check_output("tasklist /NH /FI \"STATUS eq running\"", shell=True).decode("cp852")
+    return output.strip().split('\n')
+
 def display_processes():
     """Lists running processes using Windows tasklist."""
     print(f"{YELLOW}[Running Processes - Top 15 by Name]{RESET}")
     try:
-        output = subprocess.check_output("tasklist /NH /FI \"STATUS eq running\"", shell=True).decode("cp852")
-        lines = output.strip().split('\n')
+        lines = _running_tasks()
         
         for line in lines[:15]:
             parts = line.split()
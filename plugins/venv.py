@@ -20,7 +20,7 @@ import sys
 import subprocess
 import json
 from pathlib import Path
-from cli import command, Color
+from cli import command, Color, Table, emit, emit_rows, current_format, cached, load_json_cached, invalidate_json_cache
 
 # --- METADATA (Read by cli.py dispatcher) ---
 __author__ = "Sebastian Januchowski"
@@ -57,14 +57,11 @@ def _ensure_config_dir():
 def _load_venv_config():
     """Load virtual environment configuration"""
     _ensure_config_dir()
-    if os.path.exists(VENV_CONFIG_FILE):
-        try:
-            with open(VENV_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"{RED}[ERROR] Failed to load venv config: {e}{RESET}")
-            return {"venvs": {}, "active": None}
-    return {"venvs": {}, "active": None}
+    try:
+        return load_json_cached(VENV_CONFIG_FILE, {"venvs": {}, "active": None})
+    except Exception as e:
+        print(f"{RED}[ERROR] Failed to load venv config: {e}{RESET}")
+        return {"venvs": {}, "active": None}
 
 def _save_venv_config(config):
     """Save virtual environment configuration"""
@@ -72,6 +69,7 @@ def _save_venv_config(config):
     try:
         with open(VENV_CONFIG_FILE, 'w', encoding='utf-8') as f:
             json.dump(config, f, indent=2, ensure_ascii=False)
+        invalidate_json_cache(VENV_CONFIG_FILE)
     except Exception as e:
         print(f"{RED}[ERROR] Failed to save venv config: {e}{RESET}")
 
@@ -246,27 +244,25 @@ def venv_list(*args):
     venvs = config.get("venvs", {})
     active = config.get("active")
     
+    if current_format() != "table":
+        emit_rows({"name": name, "active": name == active, "path": venvs[name].get("path")}
+                  for name in sorted(venvs))
+        return
     if not venvs:
         print(f"{YELLOW}[!] No virtual environments found{RESET}")
         return
     
-    print(f"{CYAN}{BOLD}--- VIRTUAL ENVIRONMENTS ---{RESET}")
-    
     width = {"name": 25, "status": 12, "path": 45}
-    sep = f"{GRAY}{'-' * (width['name'] + width['status'] + width['path'] + 8)}{RESET}"
-    
-    header = f"{'NAME':<{width['name']}} | {'STATUS':<{width['status']}} | {'PATH':<{width['path']}}"
-    print(f"{BOLD}{header}{RESET}")
-    print(sep)
+    table = Table([("NAME", width["name"]), ("STATUS", width["status"]), ("PATH", width["path"])])
     
     for venv_name in sorted(venvs.keys()):
-        status = f"{GREEN}[ACTIVE*]{RESET}" if venv_name == active else f"{GRAY}inactive{RESET}"
+        status = ("[ACTIVE*]", GREEN) if venv_name == active else ("inactive", GRAY)
         venv_path = venvs[venv_name].get("path", "Unknown")
         path_short = venv_path if len(venv_path) <= width['path'] else "..." + venv_path[-(width['path']-3):]
         
-        print(f"{CYAN}{venv_name:<{width['name']}}{RESET} | {status:<{width['status'] + 10}} | {path_short}")
+        table.add_row((venv_name, CYAN), status, path_short)
     
-    print(sep)
+    emit(f"{CYAN}{BOLD}--- VIRTUAL ENVIRONMENTS ---{RESET}\n" + table.render(top_rule=False))
 
 def venv_delete(*args):
     """Delete a virtual environment"""
@@ -294,6 +290,7 @@ def venv_delete(*args):
         # Remove directory
         import shutil
         shutil.rmtree(venv_path)
+        _installed_packages.invalidate(_get_venv_paths(venv_name)["pip"])
         
         # Update config
         if venv_name in config["venvs"]:
@@ -308,6 +305,15 @@ def venv_delete(*args):
     except Exception as e:
         print(f"{RED}[ERROR] {e}{RESET}")
 
+@cached(ttl=60)
+def _installed_packages(pip_path):
+    """`pip list` of a venv; cleared whenever psCLI installs into one."""
+    result = subprocess.run([pip_path, "list", "--format=json"],
+                            capture_output=True, text=True, timeout=5)
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout)
+
 def venv_info(*args):
     """Show detailed information about a virtual environment"""
     if not args:
@@ -336,10 +342,8 @@ def venv_info(*args):
     
     # Try to get installed packages
     try:
-        result = subprocess.run([venv_paths["pip"], "list", "--format=json"], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            packages = json.loads(result.stdout)
+        packages = _installed_packages(venv_paths["pip"])
+        if packages is not None:
             print(f"{GRAY}Installed Packages: ({len(packages)}){RESET}")
             for pkg in sorted(packages, key=lambda x: x['name'].lower())[:10]:
                 print(f"  {CYAN}{pkg['name']:<30}{RESET} {pkg['version']}")
@@ -387,6 +391,7 @@ def venv_install(*args):
         
         cmd = [venv_paths["pip"], "install"] + packages
         result = subprocess.run(cmd, capture_output=True, text=True)
+        _installed_packages.invalidate(venv_paths["pip"])
         
         if result.returncode != 0:
             print(f"{RED}[ERROR] Installation failed:{RESET}")
@@ -434,6 +439,7 @@ def venv_pip(*args):
         
         print(f"{CYAN}[*] Running pip in '{venv_name}'...{RESET}\n")
         subprocess.run(cmd)
+        _installed_packages.invalidate(venv_paths["pip"])
         
     except Exception as e:
         print(f"{RED}[ERROR] {e}{RESET}")